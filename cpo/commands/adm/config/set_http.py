@@ -0,0 +1,128 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pathlib
+import urllib.parse
+
+import click
+
+import cpo.config
+
+from cpo.config.configuration_manager import (
+    HTTP_BACKOFF_FACTOR_CONFIG_KEY,
+    HTTP_CA_BUNDLE_CONFIG_KEY,
+    HTTP_CONNECT_TIMEOUT_CONFIG_KEY,
+    HTTP_PROXY_CONFIG_KEY,
+    HTTP_READ_TIMEOUT_CONFIG_KEY,
+    HTTP_RETRIES_CONFIG_KEY,
+    HTTPS_PROXY_CONFIG_KEY,
+    NO_PROXY_CONFIG_KEY,
+)
+from cpo.utils.logging import loglevel_command
+
+
+def validate_ca_bundle(ctx, param, value: str | None) -> str | None:
+    if value is not None and value != "":
+        ca_bundle_path = pathlib.Path(value).expanduser()
+
+        if not ca_bundle_path.is_file():
+            raise click.BadParameter(f"File does not exist: {value}")
+
+        value = str(ca_bundle_path.resolve())
+
+    return value
+
+
+def validate_proxy(ctx, param, value: str | None) -> str | None:
+    if value is not None and value != "":
+        split_result = urllib.parse.urlsplit(value)
+
+        if (split_result.scheme not in ["http", "https", "socks5", "socks5h"]) or not split_result.hostname:
+            raise click.BadParameter("Proxy URL must have the form <http|https|socks5|socks5h>://<host>[:<port>]")
+
+    return value
+
+
+@loglevel_command()
+@click.option(
+    "--backoff-factor",
+    help=f"Backoff factor of retries in seconds ({HTTP_BACKOFF_FACTOR_CONFIG_KEY}, default: 0.5)",
+    type=click.FloatRange(min=0),
+)
+@click.option(
+    "--ca-bundle",
+    callback=validate_ca_bundle,
+    help=f"Path of a CA bundle used to verify TLS certificates ({HTTP_CA_BUNDLE_CONFIG_KEY}, empty string: unset)",
+)
+@click.option(
+    "--connect-timeout",
+    help=f"Connect timeout in seconds ({HTTP_CONNECT_TIMEOUT_CONFIG_KEY}, default: 10)",
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--http-proxy",
+    callback=validate_proxy,
+    help=f"Proxy URL used for HTTP requests ({HTTP_PROXY_CONFIG_KEY}, empty string: unset)",
+)
+@click.option(
+    "--https-proxy",
+    callback=validate_proxy,
+    help=f"Proxy URL used for HTTPS requests ({HTTPS_PROXY_CONFIG_KEY}, empty string: unset)",
+)
+@click.option(
+    "--no-proxy",
+    help=f"Comma-separated list of hosts or domains not accessed via a proxy ({NO_PROXY_CONFIG_KEY}, "
+    "empty string: unset)",
+)
+@click.option(
+    "--read-timeout",
+    help=f"Read timeout in seconds ({HTTP_READ_TIMEOUT_CONFIG_KEY}, default: 60)",
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--retries",
+    help=f"Number of retries of failed idempotent requests ({HTTP_RETRIES_CONFIG_KEY}, default: 3)",
+    type=click.IntRange(min=0),
+)
+def set_http(
+    backoff_factor: float | None,
+    ca_bundle: str | None,
+    connect_timeout: float | None,
+    http_proxy: str | None,
+    https_proxy: str | None,
+    no_proxy: str | None,
+    read_timeout: float | None,
+    retries: int | None,
+):
+    """Set HTTP configuration options
+
+    The options apply to HTTP requests sent by the CLI (e.g., downloads of
+    dependencies or requests to OpenShift clusters) and are stored in
+    ~/.cpo/settings.json using the keys given in parentheses. Options that are
+    not passed remain unchanged. To reset an option to its default value, use
+    'cpo adm config unset --key <key>'.
+    """
+
+    cpo.config.configuration_manager.set_config_values(
+        {
+            HTTP_BACKOFF_FACTOR_CONFIG_KEY: backoff_factor,
+            HTTP_CA_BUNDLE_CONFIG_KEY: ca_bundle,
+            HTTP_CONNECT_TIMEOUT_CONFIG_KEY: connect_timeout,
+            HTTP_PROXY_CONFIG_KEY: http_proxy,
+            HTTPS_PROXY_CONFIG_KEY: https_proxy,
+            NO_PROXY_CONFIG_KEY: no_proxy,
+            HTTP_READ_TIMEOUT_CONFIG_KEY: read_timeout,
+            HTTP_RETRIES_CONFIG_KEY: retries,
+        }
+    )
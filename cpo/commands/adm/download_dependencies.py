@@ -1,4 +1,4 @@
-#  Copyright 2021, 2025 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -20,7 +20,14 @@ from cpo.utils.logging import loglevel_command
 
 @loglevel_command()
 @click.option("--github-access-token", help="GitHub access token used for retrieving the latest release information")
-def download_dependencies(github_access_token: str | None):
+@click.option(
+    "--max-parallel",
+    default=4,
+    help="Maximum number of dependencies downloaded in parallel",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+def download_dependencies(github_access_token: str | None, max_parallel: int):
     """Download dependencies"""
 
-    DependencyManager.get_instance().download_latest_dependencies_if_required(github_access_token)
+    DependencyManager.get_instance().download_latest_dependencies_if_required(github_access_token, max_parallel)
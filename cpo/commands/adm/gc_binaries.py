@@ -0,0 +1,44 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+
+import click
+
+from cpo.lib.dependency_manager.dependency_manager import DependencyManager
+from cpo.utils.logging import loglevel_command
+
+logger = logging.getLogger(__name__)
+
+
+@loglevel_command()
+@click.option("--dry-run", help="Only list binaries to be removed", is_flag=True)
+@click.option("--max-age", help="Number of days after which unused binaries are removed", type=click.IntRange(min=0))
+@click.option("--max-count", help="Maximum number of binaries kept per dependency", type=click.IntRange(min=1))
+@click.option("--max-size", help="Maximum total size of binaries in MiB", type=click.IntRange(min=0))
+def gc_binaries(dry_run: bool, max_age: int | None, max_count: int | None, max_size: int | None):
+    """Remove least recently used binaries from ~/.cpo/bin
+
+    The latest downloaded version of each dependency is never removed.
+    """
+
+    removed_binaries = DependencyManager.get_instance().collect_binary_garbage(
+        max_count,
+        max_age * 86400 if max_age is not None else None,
+        max_size * 1048576 if max_size is not None else None,
+        dry_run,
+    )
+
+    for entry in removed_binaries:
+        logger.info(f"{'Would remove' if dry_run else 'Removed'} {entry.path} ({entry.size / 1048576:.1f} MiB)")
@@ -0,0 +1,54 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+import pathlib
+
+import click
+
+from cpo.config import configuration_manager
+from cpo.lib.dependency_manager.dependency_manager import DependencyManager
+from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.logging import loglevel_command
+
+logger = logging.getLogger(__name__)
+
+
+@loglevel_command()
+@click.option(
+    "--shared-bin-directory",
+    help="Path of the shared binaries directory (default: value of CPO_SHARED_BIN_DIRECTORY or shared_bin_directory "
+    "setting)",
+    type=click.Path(file_okay=False, path_type=pathlib.Path),
+)
+def populate_shared_bin(shared_bin_directory: pathlib.Path | None):
+    """Copy the latest downloaded binaries to a shared binaries directory
+
+    A shared binaries directory (e.g., /opt/cpo/bin) is a read-only,
+    system-wide directory consulted before ~/.cpo/bin. Users on multi-user
+    hosts or in containers configure it by setting the CPO_SHARED_BIN_DIRECTORY
+    environment variable or the shared_bin_directory setting.
+    """
+
+    shared_bin_directory_path = (
+        shared_bin_directory
+        if shared_bin_directory is not None
+        else configuration_manager.get_shared_bin_directory_path()
+    )
+
+    if shared_bin_directory_path is None:
+        raise CloudPakOperationsCLIException("No shared binaries directory is configured")
+
+    for path in DependencyManager.get_instance().populate_shared_bin_directory(shared_bin_directory_path):
+        logger.info(f"Copied {path}")
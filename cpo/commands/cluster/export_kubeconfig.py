@@ -0,0 +1,88 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+import pathlib
+
+import click
+
+import cpo.config.cluster_credentials_manager
+import cpo.utils.network
+
+from cpo.config.cluster_credentials_manager import ClustersFileEntry
+from cpo.lib.openshift.kube_config_exporter import KubeConfigExporter
+from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.logging import loglevel_command
+
+logger = logging.getLogger(__name__)
+
+
+@loglevel_command()
+@click.option(
+    "--alias-or-server",
+    "aliases_or_servers",
+    help="Alias or server URL of a registered OpenShift cluster to be exported (default: all clusters)",
+    multiple=True,
+)
+@click.option(
+    "--kubeconfig",
+    help="Path of the kubeconfig file to be written (default: ~/.kube/config)",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+)
+@click.option(
+    "--max-parallel",
+    default=8,
+    help="Maximum number of OAuth access tokens obtained in parallel",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+def export_kubeconfig(aliases_or_servers: tuple[str, ...], kubeconfig: pathlib.Path | None, max_parallel: int):
+    """Export registered OpenShift clusters to a kubeconfig file
+
+    Existing entries in the kubeconfig file are retained.
+    """
+
+    cpo.utils.network.disable_insecure_request_warning()
+
+    cluster_credentials_manager = cpo.config.cluster_credentials_manager.cluster_credentials_manager
+    clusters_file_contents = cluster_credentials_manager.get_clusters_file_contents_with_default()
+
+    if len(aliases_or_servers) != 0:
+        clusters_by_server = {
+            cluster.get_server(): cluster
+            for cluster in map(cluster_credentials_manager.get_cluster_or_raise_exception, aliases_or_servers)
+        }
+
+        clusters = list(clusters_by_server.values())
+    else:
+        clusters = [
+            cluster_credentials_manager.get_cluster_from_cluster_file_entry(ClustersFileEntry(cluster_data, server))
+            for server, cluster_data in clusters_file_contents["clusters"].items()
+        ]
+
+    if len(clusters) == 0:
+        raise CloudPakOperationsCLIException("No registered OpenShift clusters found")
+
+    result = KubeConfigExporter(clusters, max_parallel).export_kube_config(
+        kubeconfig, clusters_file_contents["current_cluster"] or None
+    )
+
+    for server in result.exported_servers:
+        logger.info(f"Exported {server}")
+
+    if len(result.failed_servers) != 0:
+        for server, exception in result.failed_servers.items():
+            logger.error(f"Failed to export {server}: {exception}")
+
+        raise CloudPakOperationsCLIException(f"Failed to export {len(result.failed_servers)} cluster(s)")
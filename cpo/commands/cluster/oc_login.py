@@ -1,4 +1,4 @@
-#  Copyright 2025 IBM Corporation
+#  Copyright 2025, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -15,6 +15,8 @@
 import cpo.config.cluster_credentials_manager
 import cpo.lib.click.utils
 
+from cpo.lib.dependency_manager.dependency_manager import requires_dependencies
+from cpo.lib.dependency_manager.plugins.openshift.openshift_cli_plugin import OpenShiftCLIPlugIn
 from cpo.lib.openshift.oc import login
 from cpo.utils.error import CloudPakOperationsCLIException
 from cpo.utils.logging import loglevel_command
@@ -25,6 +27,7 @@ from cpo.utils.logging import loglevel_command
         cpo.config.cluster_credentials_manager.cluster_credentials_manager.get_current_credentials()
     )
 )
+@requires_dependencies(OpenShiftCLIPlugIn)
 def oc_login():
     """Log in to the current OpenShift cluster
 
@@ -1,4 +1,4 @@
-#  Copyright 2024 IBM Corporation
+#  Copyright 2024, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -12,16 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import logging
+
 import click
 
 import cpo.config.cluster_credentials_manager
 import cpo.lib.click.utils
-import cpo.utils.network
 
-from cpo.lib.ansible.openshift_playbook_runner import OpenShiftPlaybookRunner
+from cpo.lib.openshift.pods.terminated_pods_deleter import TerminatedPodsDeleter
 from cpo.lib.openshift.utils.click import openshift_server_options
 from cpo.utils.logging import loglevel_command
 
+logger = logging.getLogger(__name__)
+
 
 @loglevel_command(
     context_settings=cpo.lib.click.utils.create_default_map_from_dict(
@@ -29,6 +32,14 @@ from cpo.utils.logging import loglevel_command
     )
 )
 @openshift_server_options
+@click.option("--dry-run", help="Only count terminated pods without deleting them", is_flag=True)
+@click.option(
+    "--max-parallel",
+    default=8,
+    help="Maximum number of projects processed in parallel",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
 @click.pass_context
 def delete_terminated_pods(
     ctx: click.Context,
@@ -38,9 +49,18 @@ def delete_terminated_pods(
     token: str | None,
     insecure_skip_tls_verify: bool | None,
     use_cluster: str | None,
+    dry_run: bool,
+    max_parallel: int,
 ):
     """Delete terminated pods"""
 
     credentials = cpo.lib.click.utils.get_cluster_credentials(ctx, locals().copy())
+    result = TerminatedPodsDeleter(credentials, max_parallel).delete_terminated_pods(dry_run)
+
+    for project, number_of_pods in sorted(result.number_of_pods_per_project.items()):
+        logger.info(f"{project}: {number_of_pods}")
 
-    OpenShiftPlaybookRunner("delete_terminated_pods_playbook.yaml", credentials).run_playbook()
+    if dry_run:
+        logger.info(f"Terminated pods to be deleted: {result.number_of_pods}")
+    else:
+        logger.info(f"Deleted terminated pods: {result.number_of_pods}")
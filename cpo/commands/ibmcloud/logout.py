@@ -1,4 +1,4 @@
-#  Copyright 2021, 2022 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -16,6 +16,8 @@ import logging
 
 import click
 
+from cpo.lib.dependency_manager.dependency_manager import requires_dependencies
+from cpo.lib.dependency_manager.plugins.ibm_cloud_cli_plugin import IBMCloudCLIPlugIn
 from cpo.lib.ibmcloud.ibm_cloud_api_manager import IBMCloudAPIManager
 from cpo.utils.logging import loglevel_command
 
@@ -28,6 +30,7 @@ logger = logging.getLogger(__name__)
     help="Delete the API key created for the IBM Cloud Pak Operations CLI (in IBM Cloud and on disk)",
     is_flag=True,
 )
+@requires_dependencies(IBMCloudCLIPlugIn)
 def logout(delete_api_key: bool):
     """Log out from IBM Cloud"""
 
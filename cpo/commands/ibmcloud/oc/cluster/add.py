@@ -1,4 +1,4 @@
-#  Copyright 2021, 2024 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -17,6 +17,8 @@ import click
 import cpo.config.cluster_credentials_manager
 import cpo.lib.ibmcloud.oc.cluster
 
+from cpo.lib.dependency_manager.dependency_manager import requires_dependencies
+from cpo.lib.dependency_manager.plugins.ibm_cloud_cli_plugin import IBMCloudCLIPlugIn
 from cpo.lib.ibmcloud.ibm_cloud_api_manager import IBMCloudAPIManager
 from cpo.utils.logging import loglevel_command
 
@@ -26,6 +28,7 @@ from cpo.utils.logging import loglevel_command
 @click.option(
     "--cluster-name", help="Name of the Red Hat OpenShift on IBM Cloud cluster to be registered", required=True
 )
+@requires_dependencies(IBMCloudCLIPlugIn)
 def add(alias: str | None, cluster_name: str):
     """Register an existing Red Hat OpenShift on IBM Cloud cluster"""
 
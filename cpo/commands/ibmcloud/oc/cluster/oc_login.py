@@ -1,4 +1,4 @@
-#  Copyright 2025 IBM Corporation
+#  Copyright 2025, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -16,6 +16,9 @@ import click
 
 import cpo.lib.openshift.oc
 
+from cpo.lib.dependency_manager.dependency_manager import requires_dependencies
+from cpo.lib.dependency_manager.plugins.ibm_cloud_cli_plugin import IBMCloudCLIPlugIn
+from cpo.lib.dependency_manager.plugins.openshift.openshift_cli_plugin import OpenShiftCLIPlugIn
 from cpo.lib.ibmcloud.ibm_cloud_api_manager import IBMCloudAPIManager
 from cpo.lib.ibmcloud.oc.cluster.roks_cluster_factory import roks_cluster_factory
 from cpo.utils.error import CloudPakOperationsCLIException
@@ -24,6 +27,7 @@ from cpo.utils.logging import loglevel_command
 
 @loglevel_command()
 @click.option("--cluster-name", help="cluster name", required=True)
+@requires_dependencies(IBMCloudCLIPlugIn, OpenShiftCLIPlugIn)
 def oc_login(cluster_name: str):
     """Log in to a Red Hat OpenShift on IBM Cloud cluster"""
 
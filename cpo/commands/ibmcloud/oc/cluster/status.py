@@ -1,4 +1,4 @@
-#  Copyright 2021, 2022 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -14,6 +14,8 @@
 
 import click
 
+from cpo.lib.dependency_manager.dependency_manager import requires_dependencies
+from cpo.lib.dependency_manager.plugins.ibm_cloud_cli_plugin import IBMCloudCLIPlugIn
 from cpo.lib.ibmcloud.ibm_cloud_api_manager import IBMCloudAPIManager
 from cpo.utils.logging import loglevel_command
 
@@ -21,6 +23,7 @@ from cpo.utils.logging import loglevel_command
 @loglevel_command()
 @click.option("--cluster-name", help="cluster name", required=True)
 @click.option("--json", help="Prints the command output in JSON format", is_flag=True)
+@requires_dependencies(IBMCloudCLIPlugIn)
 def status(cluster_name: str, json: bool):
     """Display the status of a Red Hat OpenShift on IBM Cloud cluster"""
 
@@ -1,4 +1,4 @@
-#  Copyright 2021, 2022 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -13,5 +13,8 @@
 #  limitations under the License.
 
 from cpo.config.configuration_manager import ConfigurationManager
+from cpo.utils.http_session import http_session_factory
 
 configuration_manager = ConfigurationManager()
+
+http_session_factory.set_settings_provider(configuration_manager.get_http_session_settings)
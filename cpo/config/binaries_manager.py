@@ -14,8 +14,12 @@
 
 import json
 import pathlib
+import threading
+
+from filelock import FileLock
 
 from cpo.config import configuration_manager
+from cpo.utils.file import write_file_atomically
 
 BinariesFileContents = dict[str, str]
 
@@ -25,6 +29,8 @@ class BinariesManager:
 
     def __init__(self):
         self._binaries_file_contents: dict[str, str] | None = None
+        self._shared_binaries_file_contents: dict[str, str] | None = None
+        self._lock = threading.RLock()
 
     def get_binaries_file_contents(self) -> BinariesFileContents | None:
         """Returns the contents of the binaries file
@@ -72,15 +78,54 @@ class BinariesManager:
         return configuration_manager.get_cli_data_directory_path() / "binaries.json"
 
     def get_latest_downloaded_binary_version(self, binary_alias: str) -> str | None:
+        """Returns the latest downloaded version of the given binary
+
+        If the binary was not downloaded to ~/.cpo/bin, the version stored in
+        the binaries file of the shared binaries directory (if configured) is
+        returned.
+
+        Parameters
+        ----------
+        binary_alias
+            alias of the binary
+
+        Returns
+        -------
+        str | None
+            latest downloaded version of the given binary or None if the binary
+            was not downloaded
+        """
+
         binaries = self._get_binary_versions()
 
-        return binaries[binary_alias] if binary_alias in binaries else None
+        if binary_alias in binaries:
+            return binaries[binary_alias]
+
+        return self._get_shared_binary_versions().get(binary_alias)
+
+    def get_shared_binaries_file_path(self) -> pathlib.Path | None:
+        """Returns the path of the binaries file of the shared binaries
+        directory
+
+        Returns
+        -------
+        pathlib.Path | None
+            path of the binaries file of the shared binaries directory or None
+            if no shared binaries directory is configured
+        """
+
+        shared_bin_directory_path = configuration_manager.get_shared_bin_directory_path()
+
+        return shared_bin_directory_path / "binaries.json" if shared_bin_directory_path is not None else None
 
     def set_latest_downloaded_binary_version(self, binary_alias: str, version: str):
-        binary_versions = self._get_binary_versions()
+        # serialize updates of dependencies downloaded concurrently (see
+        # DependencyManager.download_latest_dependencies_if_required())
+        with self._lock:
+            binary_versions = self._get_binary_versions()
 
-        binary_versions[binary_alias] = version
-        self._save_binaries_file()
+            binary_versions[binary_alias] = version
+            self._save_binaries_file({binary_alias: version})
 
     def _get_binary_versions(self) -> dict[str, str]:
         """Returns versions of downloaded binaries
@@ -91,23 +136,53 @@ class BinariesManager:
             versions of downloaded binaries
         """
 
-        if self._binaries_file_contents is None:
-            self._binaries_file_contents = self.get_binaries_file_contents_with_default()
+        with self._lock:
+            if self._binaries_file_contents is None:
+                self._binaries_file_contents = self.get_binaries_file_contents_with_default()
 
-        return self._binaries_file_contents
+            return self._binaries_file_contents
 
-    def _save_binaries_file(self):
-        """Stores versions of downloaded binaries in a configuration file"""
+    def _get_shared_binary_versions(self) -> dict[str, str]:
+        """Returns versions of binaries in the shared binaries directory
+
+        Returns
+        -------
+        dict[str, str]
+            versions of binaries in the shared binaries directory
+        """
+
+        with self._lock:
+            if self._shared_binaries_file_contents is None:
+                self._shared_binaries_file_contents = {}
+                shared_binaries_file_path = self.get_shared_binaries_file_path()
+
+                if (shared_binaries_file_path is not None) and shared_binaries_file_path.exists():
+                    with open(shared_binaries_file_path) as shared_binaries_file:
+                        self._shared_binaries_file_contents = json.load(shared_binaries_file)
+
+            return self._shared_binaries_file_contents
+
+    def _save_binaries_file(self, updated_binary_versions: dict[str, str]):
+        """Stores versions of downloaded binaries in a configuration file
+
+        Versions stored by other processes in the meantime are retained.
+
+        Parameters
+        ----------
+        updated_binary_versions
+            updated versions of downloaded binaries
+        """
 
         configuration_manager.get_cli_data_directory_path().mkdir(exist_ok=True)
 
-        with open(self.get_binaries_file_path(), "w") as binaries_file:
-            json.dump(
-                self._get_binary_versions(),
-                binaries_file,
-                indent="\t",
-                sort_keys=True,
-            )
+        binaries_file_path = self.get_binaries_file_path()
+
+        with FileLock(binaries_file_path.with_name(f"{binaries_file_path.name}.lock")):
+            binary_versions = self.get_binaries_file_contents_with_default() | updated_binary_versions
+
+            write_file_atomically(binaries_file_path, json.dumps(binary_versions, indent="\t", sort_keys=True))
+
+            self._get_binary_versions().update(binary_versions)
 
 
 binaries_manager = BinariesManager()
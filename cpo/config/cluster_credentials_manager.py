@@ -12,7 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
+import dataclasses
 import json
+import os
 import pathlib
 
 from dataclasses import dataclass
@@ -26,6 +29,7 @@ import cpo.lib.cluster
 from cpo.config import configuration_manager
 from cpo.lib.cluster.cluster import AbstractCluster, ClusterData
 from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.file import write_file_atomically
 
 ContextData = dict[str, Any]
 
@@ -43,11 +47,76 @@ class ClustersFileEntry:
     server: str
 
 
+FileIdentity = tuple[int, int, int]
+
+
+@dataclass
+class ClustersFileSnapshot:
+    contents: ClustersFileContents | None
+    file_identity: FileIdentity | None
+    path: pathlib.Path
+    servers_by_alias: dict[str, str] | None = None
+
+    def get_servers_by_alias(self) -> dict[str, str]:
+        """Returns the server URLs of registered OpenShift clusters indexed by
+        their aliases
+
+        The index is created once per snapshot.
+
+        Returns
+        -------
+        dict[str, str]
+            server URLs of registered OpenShift clusters indexed by their
+            aliases
+        """
+
+        if self.servers_by_alias is None:
+            self.servers_by_alias = create_servers_by_alias(
+                self.contents["clusters"] if self.contents is not None else {}
+            )
+
+        return self.servers_by_alias
+
+
+def create_servers_by_alias(clusters: dict[str, ClusterData]) -> dict[str, str]:
+    """Returns the server URLs of the given OpenShift clusters indexed by their
+    aliases
+
+    Parameters
+    ----------
+    clusters
+        OpenShift clusters
+
+    Returns
+    -------
+    dict[str, str]
+        server URLs of the given OpenShift clusters indexed by their aliases
+    """
+
+    return {
+        cluster_data["alias"]: server
+        for server, cluster_data in clusters.items()
+        if cluster_data.get("alias", "") != ""
+    }
+
+
 class ClusterCredentialsManager:
-    """Manages registered OpenShift clusters"""
+    """Manages registered OpenShift clusters
+
+    The contents of the clusters file are cached in a snapshot, which is
+    validated by comparing the inode number, modification time, and size of
+    the clusters file with the values recorded when the snapshot was created.
+    If the clusters file was not modified, it is not parsed again. Writes
+    update the snapshot.
+
+    The snapshot is never modified in place: write methods modify a copy of
+    its contents, which only replaces the snapshot once it was saved, and
+    public methods return copies of its contents.
+    """
 
     def __init__(self):
         self._current_credentials: ContextData | None = None
+        self._snapshot: ClustersFileSnapshot | None = None
 
     @file_lock
     def add_cluster(self, alias: str, server: str, type: str, cluster_data: ClusterData):
@@ -70,7 +139,7 @@ class ClusterCredentialsManager:
         cluster_data_copy["alias"] = alias
         cluster_data_copy["type"] = type
 
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_for_update()
         clusters_file_contents["clusters"][server] = cluster_data_copy
 
         self._save_clusters_file(clusters_file_contents)
@@ -93,7 +162,7 @@ class ClusterCredentialsManager:
             server URL
         """
 
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_for_update()
         clusters_file_entry = self.get_clusters_file_entry_from_clusters_file_contents(
             clusters_file_contents, alias_or_server
         )
@@ -106,14 +175,13 @@ class ClusterCredentialsManager:
 
         cluster_data = clusters_file_entry.cluster_data
 
-        for key, value in cluster_data_to_be_added.items():
+        for key, value in copy.deepcopy(cluster_data_to_be_added).items():
             cluster_data[key] = value
 
         self._save_clusters_file(clusters_file_contents)
 
-        return clusters_file_entry
+        return self._copy_clusters_file_entry(clusters_file_entry)
 
-    @file_lock
     def get_cluster(self, alias_or_server) -> AbstractCluster | None:
         """Returns metadata of the registered OpenShift cluster with the given
         alias or server URL
@@ -132,7 +200,7 @@ class ClusterCredentialsManager:
         """
 
         return self.get_cluster_from_clusters_file_contents(
-            self.get_clusters_file_contents_with_default(), alias_or_server
+            self._get_clusters_file_contents_with_default(), alias_or_server
         )
 
     def get_cluster_from_cluster_file_entry(self, cluster_file_entry: ClustersFileEntry) -> AbstractCluster:
@@ -166,22 +234,21 @@ class ClusterCredentialsManager:
             server URL or None if no cluster was found
         """
 
-        result: AbstractCluster | None = None
+        clusters_file_entry = self.get_clusters_file_entry_from_clusters_file_contents(
+            clusters_file_contents, alias_or_server
+        )
 
-        for server, cluster_data in clusters_file_contents["clusters"].items():
-            if (server == alias_or_server) or (
-                ("alias" in cluster_data) and (cluster_data["alias"] == alias_or_server)
-            ):
-                cluster_factory = cpo.lib.cluster.cluster_factories.get(cluster_data["type"])
+        if clusters_file_entry is None:
+            return None
 
-                if cluster_factory is None:
-                    raise CloudPakOperationsCLIException(
-                        f"Unknown cluster type '{cluster_data['type']}' (CLI plug-in missing?)"
-                    )
+        cluster_factory = cpo.lib.cluster.cluster_factories.get(clusters_file_entry.cluster_data["type"])
 
-                result = cluster_factory.create_cluster(server, cluster_data)
+        if cluster_factory is None:
+            raise CloudPakOperationsCLIException(
+                f"Unknown cluster type '{clusters_file_entry.cluster_data['type']}' (CLI plug-in missing?)"
+            )
 
-        return result
+        return cluster_factory.create_cluster(clusters_file_entry.server, clusters_file_entry.cluster_data.copy())
 
     def get_cluster_or_raise_exception(self, alias_or_server) -> AbstractCluster:
         """Returns metadata of the registered OpenShift cluster with the given
@@ -217,7 +284,7 @@ class ClusterCredentialsManager:
         """
 
         cluster_list: list[list[str]] = []
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_with_default()
 
         for server, cluster_data in clusters_file_contents["clusters"].items():
             alias = cluster_data["alias"] if "alias" in cluster_data else ""
@@ -236,46 +303,30 @@ class ClusterCredentialsManager:
 
         return result
 
-    @file_lock
     def get_clusters_file_contents(self) -> ClustersFileContents | None:
         """Returns the contents of the clusters file
 
         Returns
         -------
         ClustersFileContents | None
-            contents of the clusters file or None if it does not exist
+            copy of the contents of the clusters file or None if it does not
+            exist
         """
 
-        clusters_file_contents: ClustersFileContents | None = None
-        clusters_file_path = self.get_clusters_file_path()
+        return copy.deepcopy(self._get_snapshot().contents)
 
-        if clusters_file_path.exists():
-            with open(clusters_file_path) as clusters_file:
-                clusters_file_contents = json.load(clusters_file)
-
-        return clusters_file_contents
-
-    @file_lock
     def get_clusters_file_contents_with_default(self) -> ClustersFileContents:
         """Returns the contents of the clusters file or a default value
 
         Returns
         -------
         ClustersFileContents
-            contents of the clusters file or a default value if it does not exist
+            copy of the contents of the clusters file or a default value if it
+            does not exist
         """
 
-        clusters_file_contents = self.get_clusters_file_contents()
-
-        if clusters_file_contents is None:
-            clusters_file_contents = ClustersFileContents(clusters={}, current_cluster="")
-        elif "clusters" not in clusters_file_contents:
-            # TODO: check JSON schema
-            raise CloudPakOperationsCLIException("Corrupt configuration file")
-
-        return clusters_file_contents
+        return copy.deepcopy(self._get_clusters_file_contents_with_default())
 
-    @file_lock
     def get_clusters_file_entry(self, alias_or_server: str) -> ClustersFileEntry | None:
         """Returns metadata of the registered OpenShift cluster with the given
         alias or server URL
@@ -293,10 +344,12 @@ class ClusterCredentialsManager:
             server URL or None if no cluster was found
         """
 
-        return self.get_clusters_file_entry_from_clusters_file_contents(
-            self.get_clusters_file_contents_with_default(), alias_or_server
+        clusters_file_entry = self.get_clusters_file_entry_from_clusters_file_contents(
+            self._get_clusters_file_contents_with_default(), alias_or_server
         )
 
+        return self._copy_clusters_file_entry(clusters_file_entry) if clusters_file_entry is not None else None
+
     def get_clusters_file_entry_from_clusters_file_contents(
         self, clusters_file_contents: ClustersFileContents, alias_or_server: str
     ) -> ClustersFileEntry | None:
@@ -318,15 +371,14 @@ class ClusterCredentialsManager:
             server URL or None if no cluster was found
         """
 
-        result: ClustersFileEntry | None = None
-
-        for server, cluster_data in clusters_file_contents["clusters"].items():
-            if (server == alias_or_server) or (
-                ("alias" in cluster_data) and (cluster_data["alias"] == alias_or_server)
-            ):
-                result = ClustersFileEntry(cluster_data, server)
+        clusters = clusters_file_contents["clusters"]
+        server = (
+            alias_or_server
+            if alias_or_server in clusters
+            else self._get_servers_by_alias(clusters_file_contents).get(alias_or_server)
+        )
 
-        return result
+        return ClustersFileEntry(clusters[server], server) if server is not None else None
 
     def get_clusters_file_entry_or_raise_exception(self, alias_or_server) -> ClustersFileEntry:
         """Returns metadata of the registered OpenShift cluster with the given
@@ -362,7 +414,6 @@ class ClusterCredentialsManager:
 
         return configuration_manager.get_cli_data_directory_path() / "clusters.json"
 
-    @file_lock
     def get_current_cluster(self) -> AbstractCluster | None:
         """Returns metadata of the current registered OpenShift cluster
 
@@ -374,7 +425,7 @@ class ClusterCredentialsManager:
         """
 
         cluster: AbstractCluster | None = None
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_with_default()
         server_of_current_cluster = clusters_file_contents["current_cluster"]
 
         if server_of_current_cluster != "":
@@ -385,7 +436,6 @@ class ClusterCredentialsManager:
 
         return cluster
 
-    @file_lock
     def get_current_cluster_file_entry(self) -> ClustersFileEntry | None:
         """Returns metadata of the current registered OpenShift cluster
 
@@ -397,7 +447,7 @@ class ClusterCredentialsManager:
         """
 
         clusters_file_entry: ClustersFileEntry | None = None
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_with_default()
         server_of_current_cluster = clusters_file_contents["current_cluster"]
 
         if server_of_current_cluster != "":
@@ -408,6 +458,8 @@ class ClusterCredentialsManager:
             if clusters_file_entry is None:
                 raise CloudPakOperationsCLIException("Current cluster not found")
 
+            clusters_file_entry = self._copy_clusters_file_entry(clusters_file_entry)
+
         return clusters_file_entry
 
     def get_current_credentials(self) -> ContextData:
@@ -422,6 +474,9 @@ class ClusterCredentialsManager:
             user and current cluster credentials
         """
 
+        # invalidates current credentials if the clusters file was modified
+        self._get_snapshot()
+
         if self._current_credentials is None:
             credentials_file_path = configuration_manager.get_credentials_file_path()
 
@@ -452,11 +507,8 @@ class ClusterCredentialsManager:
             alias to be searched
         """
 
-        clusters = self._get_clusters()
-
-        for server, cluster_data in clusters.items():
-            if ("alias" in cluster_data) and (cluster_data["alias"] == alias_to_be_searched):
-                raise CloudPakOperationsCLIException("Alias already exists")
+        if alias_to_be_searched in self._get_servers_by_alias(self._get_clusters_file_contents_with_default()):
+            raise CloudPakOperationsCLIException("Alias already exists")
 
     @file_lock
     def remove_cluster(self, alias_or_server: str):
@@ -469,7 +521,7 @@ class ClusterCredentialsManager:
             alias or server URL of the registered OpenShift cluster to be removed
         """
 
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_for_update()
         cluster = self.get_cluster_from_clusters_file_contents(clusters_file_contents, alias_or_server)
 
         if cluster is None:
@@ -487,7 +539,7 @@ class ClusterCredentialsManager:
     def reset_current_cluster(self):
         """Resets the current registered OpenShift cluster"""
 
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_for_update()
         clusters_file_contents["current_cluster"] = ""
 
         self._save_clusters_file(clusters_file_contents)
@@ -509,7 +561,7 @@ class ClusterCredentialsManager:
             server URL
         """
 
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_for_update()
         clusters_file_entry = self.get_clusters_file_entry_from_clusters_file_contents(
             clusters_file_contents, alias_or_server
         )
@@ -521,7 +573,7 @@ class ClusterCredentialsManager:
 
         self._save_clusters_file(clusters_file_contents)
 
-        return clusters_file_entry
+        return self._copy_clusters_file_entry(clusters_file_entry)
 
     @file_lock
     def set_cluster_data(self, alias_or_server: str, cluster_data: ClusterData) -> ClustersFileEntry:
@@ -541,7 +593,7 @@ class ClusterCredentialsManager:
             server URL
         """
 
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        clusters_file_contents = self._get_clusters_file_contents_for_update()
         clusters_file_entry = self.get_clusters_file_entry_from_clusters_file_contents(
             clusters_file_contents, alias_or_server
         )
@@ -554,24 +606,159 @@ class ClusterCredentialsManager:
         if ("alias" in cluster_data) and ((new_alias := cluster_data["alias"]) != current_alias):
             self._raise_if_alias_exists(new_alias)
 
-        clusters_file_contents["clusters"][clusters_file_entry.server] = cluster_data
+        clusters_file_contents["clusters"][clusters_file_entry.server] = copy.deepcopy(cluster_data)
         self._save_clusters_file(clusters_file_contents)
 
         return clusters_file_entry
 
-    @file_lock
-    def _get_clusters(self) -> dict[str, ClusterData]:
-        """Returns registered OpenShift clusters
+    def _copy_clusters_file_entry(self, clusters_file_entry: ClustersFileEntry) -> ClustersFileEntry:
+        """Returns a copy of the given clusters file entry not sharing cluster
+        data with the snapshot
+
+        Parameters
+        ----------
+        clusters_file_entry
+            clusters file entry to be copied
 
         Returns
         -------
-        dict[str, ClusterData]
-            registered OpenShift clusters
+        ClustersFileEntry
+            copy of the given clusters file entry
         """
 
-        clusters_file_contents = self.get_clusters_file_contents_with_default()
+        return dataclasses.replace(clusters_file_entry, cluster_data=copy.deepcopy(clusters_file_entry.cluster_data))
 
-        return clusters_file_contents["clusters"]
+    def _get_clusters_file_contents_for_update(self) -> ClustersFileContents:
+        """Returns a copy of the contents of the clusters file to be modified
+        and saved
+
+        The snapshot is only replaced once the modified contents were saved,
+        i.e., it remains unchanged if saving fails.
+
+        Returns
+        -------
+        ClustersFileContents
+            copy of the contents of the clusters file or a default value if it
+            does not exist
+        """
+
+        return copy.deepcopy(self._get_clusters_file_contents_with_default())
+
+    def _get_clusters_file_contents_with_default(self) -> ClustersFileContents:
+        """Returns the contents of the clusters file stored in the snapshot or
+        a default value
+
+        The returned contents must not be modified.
+
+        Returns
+        -------
+        ClustersFileContents
+            contents of the clusters file or a default value if it does not exist
+        """
+
+        clusters_file_contents = self._get_snapshot().contents
+
+        if clusters_file_contents is None:
+            clusters_file_contents = ClustersFileContents(clusters={}, current_cluster="")
+        elif "clusters" not in clusters_file_contents:
+            # TODO: check JSON schema
+            raise CloudPakOperationsCLIException("Corrupt configuration file")
+
+        return clusters_file_contents
+
+    def _get_clusters_file_identity(self, clusters_file_path: pathlib.Path) -> FileIdentity | None:
+        """Returns the inode number, modification time, and size of the
+        clusters file
+
+        Parameters
+        ----------
+        clusters_file_path
+            path of the clusters file
+
+        Returns
+        -------
+        FileIdentity | None
+            inode number, modification time, and size of the clusters file or
+            None if it does not exist
+        """
+
+        try:
+            stat_result = clusters_file_path.stat()
+        except FileNotFoundError:
+            return None
+
+        return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+    def _get_servers_by_alias(self, clusters_file_contents: ClustersFileContents) -> dict[str, str]:
+        """Returns the server URLs of registered OpenShift clusters indexed by
+        their aliases
+
+        If the given contents of the clusters file are the contents of the
+        current snapshot, the index of the snapshot is returned.
+
+        Parameters
+        ----------
+        clusters_file_contents
+            contents of the clusters file or a default value if it does not exist
+
+        Returns
+        -------
+        dict[str, str]
+            server URLs of registered OpenShift clusters indexed by their
+            aliases
+        """
+
+        snapshot = self._snapshot
+
+        return (
+            snapshot.get_servers_by_alias()
+            if (snapshot is not None) and (snapshot.contents is clusters_file_contents)
+            else create_servers_by_alias(clusters_file_contents["clusters"])
+        )
+
+    def _get_snapshot(self) -> ClustersFileSnapshot:
+        """Returns a snapshot of the contents of the clusters file
+
+        The clusters file is only read if it was modified since the current
+        snapshot was created. As the clusters file is written atomically, it is
+        read without acquiring the file lock, i.e., processes read it
+        concurrently. The file lock only serializes updates.
+
+        Returns
+        -------
+        ClustersFileSnapshot
+            snapshot of the contents of the clusters file
+        """
+
+        clusters_file_path = self.get_clusters_file_path()
+        snapshot = self._snapshot
+
+        if (
+            (snapshot is not None)
+            and (snapshot.path == clusters_file_path)
+            and (snapshot.file_identity == self._get_clusters_file_identity(clusters_file_path))
+        ):
+            return snapshot
+
+        clusters_file_contents: ClustersFileContents | None = None
+        file_identity: FileIdentity | None = None
+
+        try:
+            with open(clusters_file_path) as clusters_file:
+                # the identity of the opened file is recorded as the clusters
+                # file may have been replaced after it was validated
+                stat_result = os.fstat(clusters_file.fileno())
+                file_identity = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+                clusters_file_contents = json.load(clusters_file)
+        except FileNotFoundError:
+            pass
+
+        self._snapshot = ClustersFileSnapshot(clusters_file_contents, file_identity, clusters_file_path)
+
+        if snapshot is not None:
+            self._invalidate_current_credentials()
+
+        return self._snapshot
 
     def _get_credentials_file_contents(self, credentials_file_path: pathlib.Path) -> ContextData:
         with open(credentials_file_path) as json_file:
@@ -592,11 +779,8 @@ class ClusterCredentialsManager:
             alias to be searched
         """
 
-        clusters = self._get_clusters()
-
-        for cluster_data in clusters.values():
-            if ("alias" in cluster_data) and (cluster_data["alias"] == alias_to_be_searched):
-                raise CloudPakOperationsCLIException("Alias already exists")
+        if alias_to_be_searched in self._get_servers_by_alias(self._get_clusters_file_contents_with_default()):
+            raise CloudPakOperationsCLIException("Alias already exists")
 
     def _raise_if_alias_or_server_exists(self, alias_to_be_searched: str, server_to_be_searched: str):
         """Raises an exception if the given alias or server URL is already
@@ -610,13 +794,12 @@ class ClusterCredentialsManager:
             Server URL to be searched
         """
 
-        clusters = self._get_clusters()
+        clusters_file_contents = self._get_clusters_file_contents_with_default()
 
-        for server, cluster_data in clusters.items():
-            if server == server_to_be_searched:
-                raise CloudPakOperationsCLIException("Server already exists")
-            elif ("alias" in cluster_data) and (cluster_data["alias"] == alias_to_be_searched):
-                raise CloudPakOperationsCLIException("Alias already exists")
+        if server_to_be_searched in clusters_file_contents["clusters"]:
+            raise CloudPakOperationsCLIException("Server already exists")
+        elif alias_to_be_searched in self._get_servers_by_alias(clusters_file_contents):
+            raise CloudPakOperationsCLIException("Alias already exists")
 
     @file_lock
     def _save_clusters_file(self, clusters_file_contents: ClustersFileContents):
@@ -624,13 +807,13 @@ class ClusterCredentialsManager:
 
         configuration_manager.get_cli_data_directory_path().mkdir(exist_ok=True)
 
-        with open(self.get_clusters_file_path(), "w") as clusters_file:
-            json.dump(
-                clusters_file_contents,
-                clusters_file,
-                indent="\t",
-                sort_keys=True,
-            )
+        clusters_file_path = self.get_clusters_file_path()
+
+        write_file_atomically(clusters_file_path, json.dumps(clusters_file_contents, indent="\t", sort_keys=True))
+
+        self._snapshot = ClustersFileSnapshot(
+            clusters_file_contents, self._get_clusters_file_identity(clusters_file_path), clusters_file_path
+        )
 
         self._invalidate_current_credentials()
 
@@ -1,4 +1,4 @@
-#  Copyright 2021, 2024 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -16,14 +16,29 @@ import json
 import os
 import pathlib
 
-from typing import Any, Type, TypeVar
+from typing import Any, Final, Type, TypeVar
+
+from filelock import FileLock
 
 import cpo
 
 from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.file import write_file_atomically
+from cpo.utils.http_session import HTTPSessionSettings
 
 T = TypeVar("T")
 
+HTTP_BACKOFF_FACTOR_CONFIG_KEY: Final[str] = "http_backoff_factor"
+HTTP_CA_BUNDLE_CONFIG_KEY: Final[str] = "http_ca_bundle"
+HTTP_CONNECT_TIMEOUT_CONFIG_KEY: Final[str] = "http_connect_timeout"
+HTTP_PROXY_CONFIG_KEY: Final[str] = "http_proxy"
+HTTP_READ_TIMEOUT_CONFIG_KEY: Final[str] = "http_read_timeout"
+HTTP_RETRIES_CONFIG_KEY: Final[str] = "http_retries"
+HTTPS_PROXY_CONFIG_KEY: Final[str] = "https_proxy"
+NO_PROXY_CONFIG_KEY: Final[str] = "no_proxy"
+SHARED_BIN_DIRECTORY_CONFIG_KEY: Final[str] = "shared_bin_directory"
+SHARED_BIN_DIRECTORY_ENVIRONMENT_VARIABLE: Final[str] = "CPO_SHARED_BIN_DIRECTORY"
+
 
 class ConfigurationManager:
     """Manages the CLI configuration"""
@@ -105,6 +120,41 @@ class ConfigurationManager:
 
         return self.get_home_directory_path() / ".cpo"
 
+    def get_http_session_settings(self) -> HTTPSessionSettings:
+        """Returns settings of HTTP sessions stored in the settings file
+
+        Returns
+        -------
+        HTTPSessionSettings
+            settings of HTTP sessions
+        """
+
+        default_settings = HTTPSessionSettings()
+        proxies: dict[str, str] = {}
+
+        for key, proxy_key in [
+            (HTTP_PROXY_CONFIG_KEY, "http"),
+            (HTTPS_PROXY_CONFIG_KEY, "https"),
+        ]:
+            if (proxy := self.get_config_value(key, str, "")) != "":
+                proxies[proxy_key] = proxy
+
+        return HTTPSessionSettings(
+            backoff_factor=float(
+                self.get_config_value(HTTP_BACKOFF_FACTOR_CONFIG_KEY, int | float, default_settings.backoff_factor)
+            ),
+            ca_bundle_path=self.get_config_value(HTTP_CA_BUNDLE_CONFIG_KEY, str, "") or None,
+            connect_timeout=float(
+                self.get_config_value(HTTP_CONNECT_TIMEOUT_CONFIG_KEY, int | float, default_settings.connect_timeout)
+            ),
+            no_proxy=self.get_config_value(NO_PROXY_CONFIG_KEY, str, ""),
+            proxies=proxies,
+            read_timeout=float(
+                self.get_config_value(HTTP_READ_TIMEOUT_CONFIG_KEY, int | float, default_settings.read_timeout)
+            ),
+            retries=self.get_config_value(HTTP_RETRIES_CONFIG_KEY, int, default_settings.retries),
+        )
+
     def get_ibmcloud_data_directory_path(self) -> pathlib.Path:
         """Returns the path of the IBM Cloud CLI data directory
 
@@ -127,6 +177,27 @@ class ConfigurationManager:
 
         return self.get_cli_data_directory_path() / "settings.json"
 
+    def get_shared_bin_directory_path(self) -> pathlib.Path | None:
+        """Returns the path of the shared binaries directory
+
+        The shared binaries directory is a read-only, system-wide directory
+        (e.g., /opt/cpo/bin) consulted before ~/.cpo/bin. Its path is read from
+        the CPO_SHARED_BIN_DIRECTORY environment variable or, if it is not set,
+        from the settings file.
+
+        Returns
+        -------
+        pathlib.Path | None
+            path of the shared binaries directory or None if it is not
+            configured
+        """
+
+        shared_bin_directory = os.environ.get(SHARED_BIN_DIRECTORY_ENVIRONMENT_VARIABLE) or self.get_config_value(
+            SHARED_BIN_DIRECTORY_CONFIG_KEY, str, ""
+        )
+
+        return pathlib.Path(shared_bin_directory).expanduser() if shared_bin_directory != "" else None
+
     def get_home_directory_path(self) -> pathlib.Path:
         return pathlib.Path.home()
 
@@ -194,14 +265,35 @@ class ConfigurationManager:
             value to be set for key
         """
 
-        if self.get_settings_file_path().exists():
-            settings = json.loads(self.get_settings_file_path().read_text())
-            settings[key] = value
-        else:
-            settings = {key: value}
+        self.set_config_values({key: value})
+
+    def set_config_values(self, settings_to_be_stored: dict[str, Any]):
+        """Sets the given key-value pairs in the settings file
 
-        with open(self.get_settings_file_path(), "w+") as f:
-            f.write(json.dumps(settings, indent="\t", sort_keys=True))
+        Parameters
+        ----------
+        settings_to_be_stored
+            dictionary containing key-value pairs to be stored (key-value pairs
+            whose value is None are ignored and keys whose value is an empty
+            string are removed)
+        """
+
+        if all(value is None for value in settings_to_be_stored.values()):
+            return
+
+        settings_file_path = self.get_settings_file_path()
+
+        with self._get_file_lock(settings_file_path):
+            settings: dict[str, Any] = json.loads(settings_file_path.read_text()) if settings_file_path.exists() else {}
+
+            for key, value in settings_to_be_stored.items():
+                if value is not None:
+                    if value != "":
+                        settings[key] = value
+                    else:
+                        settings.pop(key, None)
+
+            write_file_atomically(settings_file_path, json.dumps(settings, indent="\t", sort_keys=True))
 
     def store_credentials(
         self,
@@ -222,26 +314,28 @@ class ConfigurationManager:
         credentials: dict[Any, Any] | None = None
         credentials_file_path = self.get_credentials_file_path()
 
-        if credentials_file_path.exists():
-            with open(credentials_file_path) as credentials_file:
-                credentials = json.load(credentials_file)
-
-                if credentials is None:
-                    raise TypeError()
-        else:
-            credentials = {}
-
-        for key, value in credentials_to_be_stored.items():
-            if value is not None:
-                if value != "":
-                    credentials[key] = value
-                else:
-                    credentials.pop(key, None)
-
-        self.get_cli_data_directory_path().mkdir(exist_ok=True)
-
-        with open(credentials_file_path, "w") as credentials_file:
-            json.dump(credentials, credentials_file, indent="\t", sort_keys=True)
+        with self._get_file_lock(credentials_file_path):
+            if credentials_file_path.exists():
+                with open(credentials_file_path) as credentials_file:
+                    credentials = json.load(credentials_file)
+
+                    if credentials is None:
+                        raise TypeError()
+            else:
+                credentials = {}
+
+            for key, value in credentials_to_be_stored.items():
+                if value is not None:
+                    if value != "":
+                        credentials[key] = value
+                    else:
+                        credentials.pop(key, None)
+
+            write_file_atomically(
+                credentials_file_path,
+                json.dumps(credentials, indent="\t", sort_keys=True),
+                None if credentials_file_path.exists() else 0o600,
+            )
 
     def unset_config_value(self, key: str):
         """Unsets the given key in the settings file
@@ -252,12 +346,36 @@ class ConfigurationManager:
             name of the key to be deleted
         """
 
-        if self.get_settings_file_path().exists():
-            settings: dict[str, Any] = json.loads(self.get_settings_file_path().read_text())
-
-            if settings.pop(key, None) is not None:
-                if len(settings) == 0:
-                    os.remove(self.get_settings_file_path())
-                else:
-                    with open(self.get_settings_file_path(), "w+") as f:
-                        f.write(json.dumps(settings, indent="\t", sort_keys=True))
+        settings_file_path = self.get_settings_file_path()
+
+        with self._get_file_lock(settings_file_path):
+            if settings_file_path.exists():
+                settings: dict[str, Any] = json.loads(settings_file_path.read_text())
+
+                if settings.pop(key, None) is not None:
+                    if len(settings) == 0:
+                        os.remove(settings_file_path)
+                    else:
+                        write_file_atomically(settings_file_path, json.dumps(settings, indent="\t", sort_keys=True))
+
+    def _get_file_lock(self, path: pathlib.Path) -> FileLock:
+        """Returns a lock serializing updates of the given configuration file
+
+        Configuration files are written atomically (see
+        cpo.utils.file.write_file_atomically()). Therefore, readers do not
+        acquire the lock as they never see partially written files.
+
+        Parameters
+        ----------
+        path
+            path of the configuration file
+
+        Returns
+        -------
+        FileLock
+            lock serializing updates of the given configuration file
+        """
+
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        return FileLock(path.with_name(f"{path.name}.lock"))
@@ -0,0 +1,319 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import dataclasses
+import hashlib
+import json
+import pathlib
+import threading
+import time
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final
+
+from filelock import FileLock
+
+from cpo.config import configuration_manager
+from cpo.utils.file import write_file_atomically
+
+LAST_USED_UPDATE_INTERVAL: Final[float] = 3600.0
+
+
+@dataclass
+class BinaryInventoryEntry:
+    dependency_alias: str
+    last_used: float
+    path: str
+    sha256: str
+    size: int
+    version: str
+
+    def get_key(self) -> str:
+        return f"{self.dependency_alias}-{self.version}"
+
+
+class BinaryInventory:
+    """Manages the inventory of installed binaries
+
+    The inventory is stored in ~/.cpo/binary_inventory.json and records the
+    path, size, SHA-256 digest, and last-used time of each installed binary.
+    It is read once per process, i.e., looking up whether a binary is
+    installed does not access the file system. The last-used time of a binary
+    is updated at most once per LAST_USED_UPDATE_INTERVAL seconds.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, BinaryInventoryEntry] | None = None
+        self._lock = threading.RLock()
+
+    def add(
+        self, dependency_alias: str, version: str, path: pathlib.Path, last_used: float | None = None
+    ) -> BinaryInventoryEntry:
+        """Adds an installed binary to the inventory
+
+        Parameters
+        ----------
+        dependency_alias
+            alias of the dependency providing the binary
+        version
+            binary version
+        path
+            path of the binary
+        last_used
+            last-used time of the binary (default: current time)
+
+        Returns
+        -------
+        BinaryInventoryEntry
+            added inventory entry
+        """
+
+        path = self._get_path_with_os_specific_extension(path)
+
+        with open(path, "rb") as binary_file:
+            sha256 = hashlib.file_digest(binary_file, "sha256").hexdigest()
+
+        entry = BinaryInventoryEntry(
+            dependency_alias,
+            last_used if last_used is not None else time.time(),
+            str(path),
+            sha256,
+            path.stat().st_size,
+            version,
+        )
+
+        self._update_entries(lambda entries: entries.update({entry.get_key(): entry}))
+
+        return entry
+
+    def collect_garbage(
+        self,
+        max_count: int | None = None,
+        max_age: float | None = None,
+        max_size: int | None = None,
+        protected_keys: set[str] = set(),
+        dry_run: bool = False,
+    ) -> list[BinaryInventoryEntry]:
+        """Removes least recently used binaries
+
+        Parameters
+        ----------
+        max_count
+            maximum number of binaries kept per dependency
+        max_age
+            number of seconds after which unused binaries are removed
+        max_size
+            maximum total size of binaries in bytes
+        protected_keys
+            keys of inventory entries never to be removed (see
+            BinaryInventoryEntry.get_key())
+        dry_run
+            flag indicating whether binaries to be removed shall only be
+            returned
+
+        Returns
+        -------
+        list[BinaryInventoryEntry]
+            inventory entries of removed binaries
+        """
+
+        entries = sorted(self.get_entries(), key=lambda entry: entry.last_used, reverse=True)
+        evicted_keys: set[str] = set()
+        count_per_dependency: dict[str, int] = {}
+        now = time.time()
+
+        for entry in entries:
+            count_per_dependency[entry.dependency_alias] = count_per_dependency.get(entry.dependency_alias, 0) + 1
+
+            if ((max_count is not None) and (count_per_dependency[entry.dependency_alias] > max_count)) or (
+                (max_age is not None) and (now - entry.last_used > max_age)
+            ):
+                evicted_keys.add(entry.get_key())
+
+        if max_size is not None:
+            total_size = sum(
+                entry.size
+                for entry in entries
+                if (entry.get_key() not in evicted_keys) or (entry.get_key() in protected_keys)
+            )
+
+            for entry in reversed(entries):
+                if total_size <= max_size:
+                    break
+
+                if (entry.get_key() not in evicted_keys) and (entry.get_key() not in protected_keys):
+                    evicted_keys.add(entry.get_key())
+                    total_size -= entry.size
+
+        evicted_entries = [
+            entry for entry in entries if (entry.get_key() in evicted_keys) and (entry.get_key() not in protected_keys)
+        ]
+
+        if not dry_run:
+            for entry in evicted_entries:
+                pathlib.Path(entry.path).unlink(missing_ok=True)
+
+            self._remove_entries([entry.get_key() for entry in evicted_entries])
+
+        return evicted_entries
+
+    def get_entries(self) -> list[BinaryInventoryEntry]:
+        """Returns all inventory entries
+
+        Returns
+        -------
+        list[BinaryInventoryEntry]
+            all inventory entries
+        """
+
+        return list(self._get_entries().values())
+
+    def get_entry(self, dependency_alias: str, version: str) -> BinaryInventoryEntry | None:
+        """Returns the inventory entry of the given binary
+
+        Parameters
+        ----------
+        dependency_alias
+            alias of the dependency providing the binary
+        version
+            binary version
+
+        Returns
+        -------
+        BinaryInventoryEntry | None
+            inventory entry of the given binary or None if the binary is not
+            installed
+        """
+
+        return self._get_entries().get(f"{dependency_alias}-{version}")
+
+    def get_index_file_path(self) -> pathlib.Path:
+        """Returns the path of the inventory file
+
+        Returns
+        -------
+        pathlib.Path
+            path of the inventory file
+        """
+
+        return configuration_manager.get_cli_data_directory_path() / "binary_inventory.json"
+
+    def remove(self, dependency_alias: str, version: str):
+        """Removes the inventory entry of the given binary
+
+        Parameters
+        ----------
+        dependency_alias
+            alias of the dependency providing the binary
+        version
+            binary version
+        """
+
+        self._remove_entries([f"{dependency_alias}-{version}"])
+
+    def synchronize(self, installed_binaries: list[tuple[str, str, pathlib.Path]]):
+        """Adds installed binaries missing in the inventory (e.g., binaries
+        installed before the inventory was introduced) and removes inventory
+        entries of binaries that do not exist anymore
+
+        Parameters
+        ----------
+        installed_binaries
+            dependency alias, version, and path of installed binaries
+        """
+
+        for dependency_alias, version, path in installed_binaries:
+            if self.get_entry(dependency_alias, version) is None:
+                # binaries added retrospectively are considered to have been
+                # used when they were installed
+                self.add(dependency_alias, version, path, path.stat().st_mtime)
+
+        self._remove_entries([entry.get_key() for entry in self.get_entries() if not pathlib.Path(entry.path).exists()])
+
+    def touch(self, dependency_alias: str, version: str):
+        """Updates the last-used time of the given binary
+
+        The inventory file is only written if the last-used time is older than
+        LAST_USED_UPDATE_INTERVAL seconds.
+
+        Parameters
+        ----------
+        dependency_alias
+            alias of the dependency providing the binary
+        version
+            binary version
+        """
+
+        entry = self.get_entry(dependency_alias, version)
+        now = time.time()
+
+        if (entry is not None) and (now - entry.last_used > LAST_USED_UPDATE_INTERVAL):
+            key = entry.get_key()
+
+            def update_last_used(entries: dict[str, BinaryInventoryEntry]):
+                if key in entries:
+                    entries[key] = dataclasses.replace(entries[key], last_used=now)
+
+            self._update_entries(update_last_used)
+
+    def _get_entries(self) -> dict[str, BinaryInventoryEntry]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_entries()
+
+            return self._entries
+
+    def _get_path_with_os_specific_extension(self, path: pathlib.Path) -> pathlib.Path:
+        path_with_exe_extension = path.with_name(f"{path.name}.exe")
+
+        return path_with_exe_extension if not path.exists() and path_with_exe_extension.exists() else path
+
+    def _read_entries(self) -> dict[str, BinaryInventoryEntry]:
+        try:
+            entries = json.loads(self.get_index_file_path().read_text())
+        except (OSError, ValueError):
+            return {}
+
+        return {key: BinaryInventoryEntry(**entry) for key, entry in entries.items()}
+
+    def _remove_entries(self, keys: list[str]):
+        def remove_entries(entries: dict[str, BinaryInventoryEntry]):
+            for key in keys:
+                entries.pop(key, None)
+
+        if len(keys) != 0:
+            self._update_entries(remove_entries)
+
+    def _update_entries(self, update_func: Callable[[dict[str, BinaryInventoryEntry]], None]):
+        """Applies the given function to the inventory entries stored in the
+        inventory file and writes the result (concurrent updates of other
+        processes are retained)"""
+
+        index_file_path = self.get_index_file_path()
+        index_file_path.parent.mkdir(exist_ok=True, parents=True)
+
+        with self._lock, FileLock(index_file_path.with_name(f"{index_file_path.name}.lock")):
+            entries = self._read_entries()
+            update_func(entries)
+
+            write_file_atomically(
+                index_file_path,
+                json.dumps({key: dataclasses.asdict(entry) for key, entry in entries.items()}, indent="\t"),
+            )
+
+            self._entries = entries
+
+
+binary_inventory = BinaryInventory()
@@ -0,0 +1,179 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import base64
+import hashlib
+import json
+import logging
+import pathlib
+import time
+
+from typing import Final
+
+import cpo.utils.process
+
+from cpo.config import configuration_manager
+from cpo.utils.file import write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+BINARY_RESULT_CACHE_CONFIG_KEY: Final[str] = "binary_result_cache"
+
+
+class BinaryResultCache:
+    """Caches results of read-only binary invocations
+
+    Results are stored in ~/.cpo/cache/binary-results and are keyed on the
+    dependency alias, the binary version, the arguments, and the values of
+    environment variables affecting the result. Only results of successful
+    invocations are cached.
+    """
+
+    def get(
+        self, dependency_alias: str, version: str, args: list[str], env: dict[str, str | None], ttl: float
+    ) -> cpo.utils.process.ProcessResult | None:
+        """Returns a cached result
+
+        Parameters
+        ----------
+        dependency_alias
+            alias of the dependency providing the binary
+        version
+            binary version
+        args
+            arguments passed to the binary
+        env
+            environment variables affecting the result
+        ttl
+            maximum age of the cached result in seconds
+
+        Returns
+        -------
+        ProcessResult | None
+            cached result or None if no valid cached result exists
+        """
+
+        if not self.is_enabled():
+            return None
+
+        cache_file_path = self._get_cache_file_path(dependency_alias, version, args, env)
+
+        try:
+            cache_entry = json.loads(cache_file_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - cache_entry["timestamp"] > ttl:
+            return None
+
+        logger.debug(f"Using cached result for {dependency_alias} {' '.join(args)}")
+
+        return cpo.utils.process.ProcessResult(
+            cache_entry["command"],
+            0,
+            [cache_entry["stderr"]],
+            [cache_entry["stdout"]] if cache_entry["stdout"] is not None else [],
+            base64.b64decode(cache_entry["stdout_bytes"]) if cache_entry["stdout_bytes"] is not None else None,
+        )
+
+    def get_cache_directory_path(self) -> pathlib.Path:
+        """Returns the path of the cache directory
+
+        Returns
+        -------
+        pathlib.Path
+            path of the cache directory
+        """
+
+        return configuration_manager.get_cli_data_directory_path() / "cache" / "binary-results"
+
+    def invalidate(self, dependency_alias: str | None = None):
+        """Removes cached results
+
+        Parameters
+        ----------
+        dependency_alias
+            alias of the dependency whose cached results shall be removed
+            (default: all dependencies)
+        """
+
+        if not self.get_cache_directory_path().exists():
+            return
+
+        for cache_file_path in self.get_cache_directory_path().glob(
+            f"{dependency_alias}-{'[0-9a-f]' * 64}.json" if dependency_alias is not None else "*.json"
+        ):
+            cache_file_path.unlink(missing_ok=True)
+
+    def is_enabled(self) -> bool:
+        return configuration_manager.get_config_value(BINARY_RESULT_CACHE_CONFIG_KEY, bool, True)
+
+    def put(
+        self,
+        dependency_alias: str,
+        version: str,
+        args: list[str],
+        env: dict[str, str | None],
+        result: cpo.utils.process.ProcessResult,
+        raw_stdout: bool,
+    ):
+        """Caches the given result if it is the result of a successful
+        invocation
+
+        Parameters
+        ----------
+        dependency_alias
+            alias of the dependency providing the binary
+        version
+            binary version
+        args
+            arguments passed to the binary
+        env
+            environment variables affecting the result
+        result
+            result to be cached
+        raw_stdout
+            flag indicating whether output to stdout was captured as raw bytes
+        """
+
+        if (result.return_code != 0) or not self.is_enabled():
+            return
+
+        cache_file_path = self._get_cache_file_path(dependency_alias, version, args, env)
+        cache_file_path.parent.mkdir(exist_ok=True, parents=True)
+
+        write_file_atomically(
+            cache_file_path,
+            json.dumps(
+                {
+                    "command": result.command,
+                    "stderr": result.stderr,
+                    "stdout": result.stdout if not raw_stdout else None,
+                    "stdout_bytes": base64.b64encode(result.stdout_bytes).decode() if raw_stdout else None,
+                    "timestamp": time.time(),
+                }
+            ),
+        )
+
+    def _get_cache_file_path(
+        self, dependency_alias: str, version: str, args: list[str], env: dict[str, str | None]
+    ) -> pathlib.Path:
+        key = hashlib.sha256(
+            json.dumps({"args": args, "env": env, "version": version}, sort_keys=True).encode()
+        ).hexdigest()
+
+        return self.get_cache_directory_path() / f"{dependency_alias}-{key}.json"
+
+
+binary_result_cache = BinaryResultCache()
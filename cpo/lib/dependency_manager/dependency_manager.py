@@ -12,22 +12,41 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import concurrent.futures
+import functools
+import json
+import logging
 import os
 import pathlib
+import shutil
+import tempfile
+import threading
 
-from typing import Self, TypeVar
+from typing import Callable, ParamSpec, Self, TypeVar
+
+import click
+
+from filelock import FileLock
 
 import cpo.utils.operating_system
 import cpo.utils.process
 
+from cpo.config import configuration_manager
 from cpo.config.binaries_manager import binaries_manager
+from cpo.lib.dependency_manager.binary_inventory import BinaryInventoryEntry, binary_inventory
+from cpo.lib.dependency_manager.binary_result_cache import binary_result_cache
 from cpo.lib.dependency_manager.dependency_manager_binary_plugin import DependencyManagerBinaryPlugIn
 from cpo.lib.dependency_manager.dependency_manager_plugin import AbstractDependencyManagerPlugIn, DependencyVersion
 from cpo.lib.dependency_manager.plugins.ibm_cloud_cli_plugin import IBMCloudCLIPlugIn
 from cpo.lib.dependency_manager.plugins.openshift.openshift_cli_plugin import OpenShiftCLIPlugIn
 from cpo.lib.dependency_manager.plugins.openshift.openshift_install_plugin import OpenShiftInstallPlugIn
 from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.file import write_file_atomically
 
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
 T = TypeVar("T", bound=AbstractDependencyManagerPlugIn)
 
 
@@ -55,6 +74,64 @@ class DependencyManager:
     def __init__(self):
         self._dependency_manager_dict: dict[type[AbstractDependencyManagerPlugIn], AbstractDependencyManagerPlugIn] = {}
         self._dependency_manager_plugins: list[AbstractDependencyManagerPlugIn] = []
+        self._prefetch_futures: dict[str, concurrent.futures.Future[str]] = {}
+        self._prefetch_futures_lock = threading.Lock()
+
+    def collect_binary_garbage(
+        self,
+        max_count: int | None = None,
+        max_age: float | None = None,
+        max_size: int | None = None,
+        dry_run: bool = False,
+    ) -> list[BinaryInventoryEntry]:
+        """Removes least recently used binaries
+
+        Binaries installed before the binary inventory was introduced are added
+        to the inventory first. The latest downloaded version of each
+        dependency (see ~/.cpo/binaries.json) is never removed.
+
+        Parameters
+        ----------
+        max_count
+            maximum number of binaries kept per dependency
+        max_age
+            number of seconds after which unused binaries are removed
+        max_size
+            maximum total size of binaries in bytes
+        dry_run
+            flag indicating whether binaries to be removed shall only be
+            returned
+
+        Returns
+        -------
+        list[BinaryInventoryEntry]
+            inventory entries of removed binaries
+        """
+
+        installed_binaries: list[tuple[str, str, pathlib.Path]] = []
+
+        for plugin in self._dependency_manager_plugins:
+            if isinstance(plugin, DependencyManagerBinaryPlugIn) and not plugin.is_located_in_subdirectory():
+                binary_name = plugin.get_binary_name()
+
+                for path in configuration_manager.get_bin_directory_path().glob(f"{binary_name}-*"):
+                    version = path.name.removeprefix(f"{binary_name}-").removesuffix(".exe")
+
+                    if path.is_file() and (len(version) != 0) and version[0].isdigit():
+                        installed_binaries.append((plugin.get_dependency_alias(), version, path))
+
+        binary_inventory.synchronize(installed_binaries)
+
+        return binary_inventory.collect_garbage(
+            max_count,
+            max_age,
+            max_size,
+            {
+                f"{dependency_alias}-{version}"
+                for dependency_alias, version in binaries_manager.get_binaries_file_contents_with_default().items()
+            },
+            dry_run,
+        )
 
     def download_dependency_if_required(self, cls: type[AbstractDependencyManagerPlugIn]) -> str:
         """Downloads a dependency if required
@@ -71,39 +148,51 @@ class DependencyManager:
         """
 
         plugin = self.get_plugin_for_plugin_class(cls)
-        latest_downloaded_binary_version = binaries_manager.get_latest_downloaded_binary_version(
-            plugin.get_dependency_alias()
-        )
 
-        if latest_downloaded_binary_version is None:
-            latest_downloaded_binary_version = self._download_dependency(plugin).version_without_prefix
+        self._wait_for_prefetched_dependency(plugin)
 
-        return latest_downloaded_binary_version
+        return self._download_dependency_if_required(plugin)
 
-    def download_latest_dependencies_if_required(self, github_access_token: str | None):
+    def download_latest_dependencies_if_required(self, github_access_token: str | None, max_parallel: int = 4):
         """Downloads latest dependencies if required
 
-        The versions of the downloaded dependencies are stored in
-        ~/.cpo/binaries.json.
+        Dependencies are downloaded concurrently. The versions of the
+        downloaded dependencies are stored in ~/.cpo/binaries.json.
 
         Parameters
         ----------
         github_access_token
             GitHub access token
+        max_parallel
+            maximum number of dependencies downloaded in parallel
         """
 
-        for dependency_manager_plugin in self._dependency_manager_plugins:
-            if dependency_manager_plugin.is_operating_system_supported(
-                cpo.utils.operating_system.get_operating_system()
-            ):
-                binary_alias = dependency_manager_plugin.get_dependency_alias()
-                latest_downloaded_binary_version = binaries_manager.get_latest_downloaded_binary_version(binary_alias)
-                latest_dependency_version = dependency_manager_plugin.get_latest_dependency_version(github_access_token)
+        operating_system = cpo.utils.operating_system.get_operating_system()
+        plugins = [
+            dependency_manager_plugin
+            for dependency_manager_plugin in self._dependency_manager_plugins
+            if dependency_manager_plugin.is_operating_system_supported(operating_system)
+        ]
 
-                if (latest_downloaded_binary_version is None) or (
-                    latest_dependency_version.version_without_prefix != latest_downloaded_binary_version
-                ):
-                    self._download_dependency(dependency_manager_plugin, latest_dependency_version)
+        failed_dependencies: dict[str, Exception] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = {
+                executor.submit(self._download_latest_dependency_if_required, plugin, github_access_token): plugin
+                for plugin in plugins
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exception:
+                    failed_dependencies[futures[future].get_dependency_name()] = exception
+
+        if len(failed_dependencies) != 0:
+            for dependency_name, exception in failed_dependencies.items():
+                logger.error(f"Failed to download {dependency_name}: {exception}")
+
+            raise CloudPakOperationsCLIException(f"Failed to download {len(failed_dependencies)} dependency(ies)")
 
     def execute_binary(
         self,
@@ -114,6 +203,10 @@ class DependencyManager:
         capture_output=False,
         check=True,
         print_captured_output=False,
+        max_captured_lines: int | None = None,
+        capture_raw_stdout=False,
+        timeout: float | None = None,
+        cache_ttl: float | None = None,
         github_access_token: str | None = None,
     ) -> cpo.utils.process.ProcessResult:
         """Executes the binary provided by the dependency corresponding to the
@@ -140,6 +233,23 @@ class DependencyManager:
         print_captured_output
             flag indicating whether captured process output shall also be written to
             stdout/stderr
+        max_captured_lines
+            maximum number of most recent lines of captured process output kept
+            in memory per stream (default: unlimited)
+        capture_raw_stdout
+            flag indicating whether output to stdout shall be captured as raw
+            bytes (see ProcessResult.stdout_bytes)
+        timeout
+            number of seconds after which the binary is terminated (stdin is
+            redirected from the null device, i.e., the binary must not prompt
+            for input)
+        cache_ttl
+            number of seconds for which the result of a successful invocation
+            is cached and returned instead of executing the binary again
+            (default: results are not cached); must only be passed for
+            read-only invocations and requires capture_output to be set
+        github_access_token
+            GitHub access token
 
         Returns
         -------
@@ -152,38 +262,124 @@ class DependencyManager:
 
         assert isinstance(plugin, DependencyManagerBinaryPlugIn)
 
-        latest_downloaded_binary_version = binaries_manager.get_latest_downloaded_binary_version(
-            plugin.get_dependency_alias()
+        version = self._get_binary_version_and_download_if_required(plugin, version, github_access_token)
+
+        if (cache_ttl is not None) and capture_output:
+            dependency_alias = plugin.get_dependency_alias()
+            cache_key_environment = plugin.get_cache_key_environment(env)
+            result = binary_result_cache.get(dependency_alias, version, args, cache_key_environment, cache_ttl)
+
+            if result is None:
+                result = self._execute_with_binary_recovery(
+                    plugin,
+                    version,
+                    github_access_token,
+                    lambda: plugin.execute_binary(
+                        version,
+                        args,
+                        env,
+                        capture_output=capture_output,
+                        check=check,
+                        print_captured_output=print_captured_output,
+                        max_captured_lines=max_captured_lines,
+                        capture_raw_stdout=capture_raw_stdout,
+                        timeout=timeout,
+                    ),
+                )
+
+                binary_result_cache.put(
+                    dependency_alias, version, args, cache_key_environment, result, capture_raw_stdout
+                )
+            elif print_captured_output:
+                # replay captured output like cpo.utils.process does for live
+                # output
+                for line in result.stdout.splitlines():
+                    click.echo(line)
+
+                for line in result.stderr.splitlines():
+                    click.echo(click.style(f"{line}\n", fg="red"), err=True, nl=False)
+
+            return result
+
+        return self._execute_with_binary_recovery(
+            plugin,
+            version,
+            github_access_token,
+            lambda: plugin.execute_binary(
+                version,
+                args,
+                env,
+                capture_output=capture_output,
+                check=check,
+                print_captured_output=print_captured_output,
+                max_captured_lines=max_captured_lines,
+                capture_raw_stdout=capture_raw_stdout,
+                timeout=timeout,
+            ),
         )
 
-        if version is None:
-            if latest_downloaded_binary_version is None:
-                latest_dependency_version = plugin.get_latest_dependency_version(github_access_token)
+    def execute_binary_concurrently(
+        self,
+        cls: type[DependencyManagerBinaryPlugIn],
+        version: str | None,
+        list_of_args: list[list[str]],
+        env: dict[str, str] = os.environ.copy(),
+        check=True,
+        print_captured_output=False,
+        max_parallel: int = 4,
+        github_access_token: str | None = None,
+    ) -> list[cpo.utils.process.ProcessResult]:
+        """Executes the binary provided by the dependency corresponding to the
+        dependency manager plug-in of the given type concurrently with
+        different arguments
 
-                plugin.download_dependency_version(
-                    github_access_token, latest_dependency_version.version_without_prefix
-                )
+        Process output is always captured (see
+        cpo.utils.process.execute_commands()).
 
-                binaries_manager.set_latest_downloaded_binary_version(
-                    plugin.get_dependency_alias(), latest_dependency_version.version_without_prefix
-                )
+        Parameters
+        ----------
+        cls
+            dependency manager plug-in type
+        version
+            version of the dependency
+        list_of_args
+            list of arguments to be passed to the binary per invocation
+        env
+            dictionary of environment variables passed to the processes
+        check
+            flag indicating whether an exception shall be thrown if the binary
+            returns with a nonzero return code
+        print_captured_output
+            flag indicating whether captured process output shall also be written to
+            stdout/stderr
+        max_parallel
+            maximum number of processes executed in parallel
 
-                latest_downloaded_binary_version = latest_dependency_version.version_without_prefix
+        Returns
+        -------
+        list[ProcessResult]
+            objects storing the return code and captured process output in the
+            order of the given arguments
+        """
 
-            version = latest_downloaded_binary_version
-        elif not plugin.get_binary_path(version).exists():
-            plugin.download_dependency_version(github_access_token, version)
+        plugin = self.get_plugin_for_plugin_class(cls)
 
-            if latest_downloaded_binary_version is None:
-                binaries_manager.set_latest_downloaded_binary_version(plugin.get_dependency_alias(), version)
+        assert isinstance(plugin, DependencyManagerBinaryPlugIn)
+
+        version = self._get_binary_version_and_download_if_required(plugin, version, github_access_token)
 
-        return plugin.execute_binary(
+        return self._execute_with_binary_recovery(
+            plugin,
             version,
-            args,
-            env,
-            capture_output=capture_output,
-            check=check,
-            print_captured_output=print_captured_output,
+            github_access_token,
+            lambda: plugin.execute_binary_concurrently(
+                version,
+                list_of_args,
+                env,
+                check=check,
+                print_captured_output=print_captured_output,
+                max_parallel=max_parallel,
+            ),
         )
 
     def get_binary_path(self, cls: type[DependencyManagerBinaryPlugIn], version: str) -> pathlib.Path | None:
@@ -237,6 +433,110 @@ class DependencyManager:
 
         return plugin
 
+    def populate_shared_bin_directory(self, shared_bin_directory_path: pathlib.Path) -> list[pathlib.Path]:
+        """Copies the latest downloaded version of each binary to the given
+        shared binaries directory
+
+        Binaries are downloaded first if required. Binaries already contained
+        in the shared binaries directory are not copied again. Copies are
+        renamed to their final path atomically, i.e., processes reading from the
+        shared binaries directory never see partially copied binaries. The
+        versions of the copied binaries are stored in the binaries file of the
+        shared binaries directory.
+
+        Parameters
+        ----------
+        shared_bin_directory_path
+            path of the shared binaries directory
+
+        Returns
+        -------
+        list[pathlib.Path]
+            paths of the copied binaries within the shared binaries directory
+        """
+
+        shared_bin_directory_path.mkdir(exist_ok=True, parents=True)
+
+        copied_binary_paths: list[pathlib.Path] = []
+        shared_binaries_file_path = shared_bin_directory_path / "binaries.json"
+        shared_binary_versions: dict[str, str] = (
+            json.loads(shared_binaries_file_path.read_text()) if shared_binaries_file_path.exists() else {}
+        )
+
+        for plugin in self._dependency_manager_plugins:
+            if not isinstance(plugin, DependencyManagerBinaryPlugIn):
+                continue
+
+            version = self.download_dependency_if_required(type(plugin))
+            binary_relative_path = plugin.get_binary_relative_path(version)
+            target_path = shared_bin_directory_path / binary_relative_path.parts[0]
+
+            if not target_path.exists():
+                source_path = configuration_manager.get_bin_directory_path() / binary_relative_path.parts[0]
+
+                with tempfile.TemporaryDirectory(
+                    dir=shared_bin_directory_path, prefix=".staging-"
+                ) as staging_directory:
+                    staging_path = pathlib.Path(staging_directory) / target_path.name
+
+                    if source_path.is_dir():
+                        shutil.copytree(source_path, staging_path)
+                    else:
+                        shutil.copy2(source_path, staging_path)
+
+                    self._make_readable_by_all_users(staging_path)
+                    os.replace(staging_path, target_path)
+
+                copied_binary_paths.append(shared_bin_directory_path / binary_relative_path)
+
+            shared_binary_versions[plugin.get_dependency_alias()] = version
+
+        write_file_atomically(
+            shared_binaries_file_path, json.dumps(shared_binary_versions, indent="\t", sort_keys=True), 0o644
+        )
+
+        return copied_binary_paths
+
+    def prefetch_dependencies(self, classes: list[type[AbstractDependencyManagerPlugIn]]):
+        """Downloads dependencies that were not downloaded yet on background
+        threads
+
+        Prefetching overlaps downloads with the work a command performs before
+        it requires a dependency for the first time. Prefetched downloads are
+        joined before a binary is executed (see execute_binary()).
+
+        Parameters
+        ----------
+        classes
+            dependency manager plug-in types of dependencies to be prefetched
+        """
+
+        for cls in classes:
+            plugin = self.get_plugin_for_plugin_class(cls)
+            dependency_alias = plugin.get_dependency_alias()
+
+            if binaries_manager.get_latest_downloaded_binary_version(dependency_alias) is not None:
+                continue
+
+            with self._prefetch_futures_lock:
+                if dependency_alias in self._prefetch_futures:
+                    continue
+
+                future: concurrent.futures.Future[str] = concurrent.futures.Future()
+                self._prefetch_futures[dependency_alias] = future
+
+            def prefetch_dependency(plugin: AbstractDependencyManagerPlugIn, future: concurrent.futures.Future[str]):
+                try:
+                    future.set_result(self._download_dependency_if_required(plugin))
+                except Exception as exception:
+                    future.set_exception(exception)
+
+            logger.debug(f"Prefetching {plugin.get_dependency_name()}")
+
+            # daemon threads do not delay the termination of commands not
+            # requiring a prefetched dependency
+            threading.Thread(target=prefetch_dependency, args=(plugin, future), daemon=True).start()
+
     def register_plugin(self, cls: type[AbstractDependencyManagerPlugIn]):
         """Registers a dependency manager plug-in of the given type
 
@@ -260,11 +560,232 @@ class DependencyManager:
         if dependency_version is None:
             dependency_version = plugin.get_latest_dependency_version(github_access_token)
 
-        plugin.download_dependency_version(github_access_token, dependency_version.version_without_prefix)
+        self._download_dependency_version_if_required(
+            plugin, dependency_version.version_without_prefix, github_access_token
+        )
         binaries_manager.set_latest_downloaded_binary_version(
             plugin.get_dependency_alias(), dependency_version.version_without_prefix
         )
 
         return dependency_version
 
+    def _download_dependency_if_required(self, plugin: AbstractDependencyManagerPlugIn) -> str:
+        latest_downloaded_binary_version = binaries_manager.get_latest_downloaded_binary_version(
+            plugin.get_dependency_alias()
+        )
+
+        if latest_downloaded_binary_version is None:
+            latest_downloaded_binary_version = self._download_dependency(plugin).version_without_prefix
+
+        return latest_downloaded_binary_version
+
+    def _download_dependency_version_if_required(
+        self, plugin: AbstractDependencyManagerPlugIn, version: str, github_access_token: str | None
+    ):
+        """Downloads the given version of a dependency unless it was already
+        downloaded
+
+        A file lock per dependency and version ensures that a dependency is
+        downloaded once if multiple processes require it at the same time: the
+        first process downloads the dependency while the others wait and reuse
+        the result.
+
+        Parameters
+        ----------
+        plugin
+            dependency manager plug-in
+        version
+            version of the dependency
+        github_access_token
+            GitHub access token
+        """
+
+        if isinstance(plugin, DependencyManagerBinaryPlugIn) and (plugin.get_shared_binary_path(version) is not None):
+            # binaries contained in the shared binaries directory are neither
+            # downloaded nor recorded in the binary inventory
+            return
+
+        lock_directory_path = configuration_manager.get_cli_data_directory_path() / "locks"
+        lock_directory_path.mkdir(exist_ok=True, parents=True)
+
+        with FileLock(lock_directory_path / f"{plugin.get_dependency_alias()}-{version}.lock"):
+            if not plugin.is_dependency_version_downloaded(version):
+                plugin.download_dependency_version(github_access_token, version)
+
+            if isinstance(plugin, DependencyManagerBinaryPlugIn) and (
+                binary_inventory.get_entry(plugin.get_dependency_alias(), version) is None
+            ):
+                binary_inventory.add(plugin.get_dependency_alias(), version, plugin.get_binary_path(version))
+
+    def _download_latest_dependency_if_required(
+        self, plugin: AbstractDependencyManagerPlugIn, github_access_token: str | None
+    ):
+        latest_downloaded_binary_version = binaries_manager.get_latest_downloaded_binary_version(
+            plugin.get_dependency_alias()
+        )
+
+        latest_dependency_version = plugin.get_latest_dependency_version(github_access_token)
+
+        if (latest_downloaded_binary_version is None) or (
+            latest_dependency_version.version_without_prefix != latest_downloaded_binary_version
+        ):
+            self._download_dependency(plugin, latest_dependency_version)
+
+    def _execute_with_binary_recovery(
+        self,
+        plugin: DependencyManagerBinaryPlugIn,
+        version: str,
+        github_access_token: str | None,
+        execute_func: Callable[[], R],
+    ) -> R:
+        """Calls the given function executing the binary and downloads the
+        binary again if it was removed behind the back of the binary inventory
+
+        The binary inventory is trusted without accessing the file system
+        before executing a binary. If the binary cannot be found, its inventory
+        entry is removed, the binary is downloaded, and the function is called
+        once more.
+
+        Parameters
+        ----------
+        plugin
+            dependency manager plug-in
+        version
+            version of the dependency
+        github_access_token
+            GitHub access token
+        execute_func
+            function executing the binary
+
+        Returns
+        -------
+        R
+            return value of the given function
+        """
+
+        try:
+            return execute_func()
+        except FileNotFoundError:
+            if plugin.get_binary_path(version).exists():
+                raise
+
+            logger.warning(f"{plugin.get_dependency_name()} {version} does not exist anymore and is downloaded again")
+
+            binary_inventory.remove(plugin.get_dependency_alias(), version)
+            self._download_dependency_version_if_required(plugin, version, github_access_token)
+
+            return execute_func()
+
+    def _get_binary_version_and_download_if_required(
+        self, plugin: DependencyManagerBinaryPlugIn, version: str | None, github_access_token: str | None
+    ) -> str:
+        """Returns the given binary version or the latest downloaded binary
+        version if no version is given and downloads the binary if required
+
+        Parameters
+        ----------
+        plugin
+            dependency manager plug-in
+        version
+            version of the dependency
+        github_access_token
+            GitHub access token
+
+        Returns
+        -------
+        str
+            binary version
+        """
+
+        self._wait_for_prefetched_dependency(plugin)
+
+        latest_downloaded_binary_version = binaries_manager.get_latest_downloaded_binary_version(
+            plugin.get_dependency_alias()
+        )
+
+        if version is None:
+            if latest_downloaded_binary_version is None:
+                latest_downloaded_binary_version = self._download_dependency(
+                    plugin, github_access_token=github_access_token
+                ).version_without_prefix
+
+            version = latest_downloaded_binary_version
+        elif binary_inventory.get_entry(plugin.get_dependency_alias(), version) is None:
+            # the file system is only accessed if the binary is not recorded
+            # in the binary inventory
+            self._download_dependency_version_if_required(plugin, version, github_access_token)
+
+            if latest_downloaded_binary_version is None:
+                binaries_manager.set_latest_downloaded_binary_version(plugin.get_dependency_alias(), version)
+
+        binary_inventory.touch(plugin.get_dependency_alias(), version)
+
+        return version
+
+    def _make_readable_by_all_users(self, path: pathlib.Path):
+        """Makes the given file or directory tree readable (and executables
+        executable) by all users
+
+        Parameters
+        ----------
+        path
+            path of the file or directory tree
+        """
+
+        for child_path in [path, *path.rglob("*")] if path.is_dir() else [path]:
+            mode = child_path.stat().st_mode
+
+            child_path.chmod(mode | (0o555 if child_path.is_dir() or (mode & 0o100) else 0o444))
+
+    def _wait_for_prefetched_dependency(self, plugin: AbstractDependencyManagerPlugIn):
+        """Waits for the download of the given dependency if it is being
+        prefetched
+
+        If prefetching failed, the error is logged and the dependency is
+        downloaded again by the caller, which raises the error.
+
+        Parameters
+        ----------
+        plugin
+            dependency manager plug-in
+        """
+
+        with self._prefetch_futures_lock:
+            future = self._prefetch_futures.pop(plugin.get_dependency_alias(), None)
+
+        if future is not None:
+            try:
+                future.result()
+            except Exception as exception:
+                logger.debug(f"Prefetching {plugin.get_dependency_name()} failed: {exception}")
+
     _instance: Self | None = None
+
+
+def requires_dependencies(
+    *classes: type[AbstractDependencyManagerPlugIn],
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator declaring dependencies required by a Click command
+
+    Dependencies that were not downloaded yet are prefetched on background
+    threads when the command is invoked (see
+    DependencyManager.prefetch_dependencies()). The decorator must be
+    applied before Click decorators.
+
+    Parameters
+    ----------
+    classes
+        dependency manager plug-in types of dependencies required by the
+        command
+    """
+
+    def decorator(f: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(f)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            DependencyManager.get_instance().prefetch_dependencies(list(classes))
+
+            return f(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
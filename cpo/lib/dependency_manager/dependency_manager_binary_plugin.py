@@ -12,15 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import contextlib
 import os
 import pathlib
 
 from abc import abstractmethod
+from collections.abc import Iterator
 
 import cpo.utils.process
 
 from cpo.config import configuration_manager
 from cpo.lib.dependency_manager.dependency_manager_plugin import AbstractDependencyManagerPlugIn
+from cpo.utils.file import create_staging_directory
 
 
 class DependencyManagerBinaryPlugIn(AbstractDependencyManagerPlugIn):
@@ -32,6 +35,9 @@ class DependencyManagerBinaryPlugIn(AbstractDependencyManagerPlugIn):
         capture_output=False,
         check=True,
         print_captured_output=False,
+        max_captured_lines: int | None = None,
+        capture_raw_stdout=False,
+        timeout: float | None = None,
     ) -> cpo.utils.process.ProcessResult:
         """Executes the binary associated with the dependency
 
@@ -51,6 +57,16 @@ class DependencyManagerBinaryPlugIn(AbstractDependencyManagerPlugIn):
         print_captured_output
             flag indicating whether captured process output shall also be written to
             stdout/stderr
+        max_captured_lines
+            maximum number of most recent lines of captured process output kept
+            in memory per stream (default: unlimited)
+        capture_raw_stdout
+            flag indicating whether output to stdout shall be captured as raw
+            bytes (see ProcessResult.stdout_bytes)
+        timeout
+            number of seconds after which the binary is terminated (stdin is
+            redirected from the null device, i.e., the binary must not prompt
+            for input)
 
         Returns
         -------
@@ -68,6 +84,64 @@ class DependencyManagerBinaryPlugIn(AbstractDependencyManagerPlugIn):
             capture_output=capture_output,
             check=check,
             print_captured_output=print_captured_output,
+            max_captured_lines=max_captured_lines,
+            capture_raw_stdout=capture_raw_stdout,
+            timeout=timeout,
+        )
+
+    def execute_binary_concurrently(
+        self,
+        version: str,
+        list_of_args: list[list[str]],
+        env: dict[str, str] = os.environ.copy(),
+        check=True,
+        print_captured_output=False,
+        max_parallel: int = 4,
+    ) -> list[cpo.utils.process.ProcessResult]:
+        """Executes the binary associated with the dependency concurrently with
+        different arguments
+
+        Process output is always captured (see
+        cpo.utils.process.execute_commands()).
+
+        Parameters
+        ----------
+        version
+            binary version
+        list_of_args
+            list of arguments to be passed to the binary per invocation
+        env
+            dictionary of environment variables passed to the processes
+        check
+            flag indicating whether an exception shall be thrown if the binary
+            returns with a nonzero return code
+        print_captured_output
+            flag indicating whether captured process output shall also be written to
+            stdout/stderr
+        max_parallel
+            maximum number of processes executed in parallel
+
+        Returns
+        -------
+        list[ProcessResult]
+            objects storing the return code and captured process output in the
+            order of the given arguments
+        """
+
+        binary_path = self.get_binary_path(version)
+
+        return cpo.utils.process.execute_commands(
+            [
+                cpo.utils.process.CommandSpec(
+                    binary_path,
+                    args,
+                    check=check,
+                    env=env,
+                    print_captured_output=print_captured_output,
+                )
+                for args in list_of_args
+            ],
+            max_parallel,
         )
 
     @abstractmethod
@@ -85,6 +159,12 @@ class DependencyManagerBinaryPlugIn(AbstractDependencyManagerPlugIn):
     def get_binary_path(self, version: str) -> pathlib.Path:
         """Returns the path of the binary associated with the dependency
 
+        If a shared binaries directory is configured (see
+        ConfigurationManager.get_shared_bin_directory_path()) and contains the
+        binary, the path of the binary within the shared binaries directory is
+        returned. Otherwise, the path of the binary within ~/.cpo/bin is
+        returned.
+
         Parameters
         ----------
         version
@@ -96,12 +176,101 @@ class DependencyManagerBinaryPlugIn(AbstractDependencyManagerPlugIn):
             path of the binary associated with the dependency
         """
 
-        binary_path = configuration_manager.get_bin_directory_path()
+        shared_binary_path = self.get_shared_binary_path(version)
+
+        return (
+            shared_binary_path
+            if shared_binary_path is not None
+            else configuration_manager.get_bin_directory_path() / self.get_binary_relative_path(version)
+        )
+
+    def get_binary_relative_path(self, version: str) -> pathlib.PurePath:
+        """Returns the path of the binary associated with the dependency
+        relative to a binaries directory
+
+        Parameters
+        ----------
+        version
+            version of the dependency
+
+        Returns
+        -------
+        pathlib.PurePath
+            path of the binary associated with the dependency relative to a
+            binaries directory
+        """
 
         if self.is_located_in_subdirectory():
-            binary_path /= f"{self.get_dependency_alias()}-{version}"
-            binary_path /= self.get_binary_name()
+            return pathlib.PurePath(f"{self.get_dependency_alias()}-{version}", self.get_binary_name())
         else:
-            binary_path /= f"{self.get_binary_name()}-{version}"
+            return pathlib.PurePath(f"{self.get_binary_name()}-{version}")
+
+    def get_cache_key_environment(self, env: dict[str, str]) -> dict[str, str | None]:
+        """Returns values affecting the result of a read-only invocation of the
+        binary in addition to its version and arguments
+
+        Values returned by this method are part of the key of cached results
+        (see cpo.lib.dependency_manager.binary_result_cache).
+
+        Parameters
+        ----------
+        env
+            dictionary of environment variables passed to the process
+
+        Returns
+        -------
+        dict[str, str | None]
+            values affecting the result of a read-only invocation of the binary
+        """
+
+        return {}
+
+    def get_shared_binary_path(self, version: str) -> pathlib.Path | None:
+        """Returns the path of the binary associated with the dependency within
+        the shared binaries directory
+
+        Parameters
+        ----------
+        version
+            version of the dependency
+
+        Returns
+        -------
+        pathlib.Path | None
+            path of the binary associated with the dependency within the shared
+            binaries directory or None if no shared binaries directory is
+            configured or it does not contain the binary
+        """
+
+        shared_bin_directory_path = configuration_manager.get_shared_bin_directory_path()
+
+        if shared_bin_directory_path is None:
+            return None
+
+        shared_binary_path = shared_bin_directory_path / self.get_binary_relative_path(version)
+
+        return shared_binary_path if shared_binary_path.exists() else None
+
+    # override
+    def is_dependency_version_downloaded(self, version: str) -> bool:
+        return self.get_binary_path(version).exists()
+
+    @contextlib.contextmanager
+    def _create_staging_directory(self) -> Iterator[pathlib.Path]:
+        """Creates a temporary staging directory within the binaries directory
+
+        Archives are extracted to the staging directory and binaries are
+        renamed to their final path afterwards. As the staging directory is
+        located on the same file system, binaries are installed atomically,
+        i.e., processes never see partially extracted binaries. Staging
+        directories left behind by terminated processes (e.g., if a prefetch
+        thread was killed on exit) are removed.
+
+        Yields
+        ------
+        pathlib.Path
+            path of the staging directory
+        """
 
-        return binary_path
+        with create_staging_directory(configuration_manager.get_bin_directory_path()) as staging_directory_path:
+            yield staging_directory_path
@@ -15,11 +15,13 @@
 import json
 
 from abc import ABC, abstractmethod
+from typing import Any, Final
 
-import requests
-
+from cpo.lib.dependency_manager.http_response_cache import http_response_cache
 from cpo.utils.operating_system import OperatingSystem
 
+LATEST_DEPENDENCY_VERSION_CACHE_TTL: Final[float] = 3600.0
+
 
 class DependencyVersion:
     def __init__(self, version: str):
@@ -106,6 +108,22 @@ class AbstractDependencyManagerPlugIn(ABC):
 
         pass
 
+    def is_dependency_version_downloaded(self, version: str) -> bool:
+        """Returns whether the given version of the dependency was downloaded
+
+        Parameters
+        ----------
+        version
+            version of the dependency
+
+        Returns
+        -------
+        bool
+            true, if the given version of the dependency was downloaded
+        """
+
+        return False
+
     def is_located_in_subdirectory(self) -> bool:
         """Returns whether the plug-in is located in a subdirectory
 
@@ -175,22 +193,9 @@ class AbstractDependencyManagerPlugIn(ABC):
             None if the latest release was found
         """
 
-        headers = {}
-
-        if github_access_token is not None:
-            headers["Authorization"] = f"Bearer {github_access_token}"
-
-        response = requests.get(f"https://api.github.com/repos/{owner}/{repo}/releases/latest", headers=headers)
-        result: list[str] | None = None
-
-        if response.ok:
-            response_json = json.loads(response.content)
+        latest_release = self._get_latest_release_on_github(owner, repo, github_access_token)
 
-            result = [asset["name"] for asset in response_json["assets"]]
-        elif response.status_code != 404:
-            response.raise_for_status()
-
-        return result
+        return [asset["name"] for asset in latest_release["assets"]] if latest_release is not None else None
 
     def _get_latest_dependency_version_on_github(
         self, owner: str, repo: str, github_access_token: str | None
@@ -242,19 +247,43 @@ class AbstractDependencyManagerPlugIn(ABC):
             latest version of the dependency or None if the latest release was found
         """
 
+        latest_release = self._get_latest_release_on_github(owner, repo, github_access_token)
+
+        return DependencyVersion(latest_release["tag_name"]) if latest_release is not None else None
+
+    def _get_latest_release_on_github(self, owner: str, repo: str, github_access_token: str | None) -> Any | None:
+        """Returns the JSON document describing the latest release of the
+        dependency on GitHub
+
+        The document is cached for LATEST_DEPENDENCY_VERSION_CACHE_TTL seconds
+        and revalidated using a conditional request afterwards (see
+        cpo.lib.dependency_manager.http_response_cache).
+
+        Parameters
+        ----------
+        owner
+            GitHub repository owner
+        repo
+            GitHub repository name
+        github_access_token
+            GitHub access token
+
+        Returns
+        -------
+        Any | None
+            JSON document describing the latest release of the dependency or
+            None if no release was found
+        """
+
         headers = {}
 
         if github_access_token is not None:
             headers["Authorization"] = f"Bearer {github_access_token}"
 
-        response = requests.get(f"https://api.github.com/repos/{owner}/{repo}/releases/latest", headers=headers)
-        result: DependencyVersion | None = None
-
-        if response.ok:
-            response_json = json.loads(response.content)
-
-            result = DependencyVersion(response_json["tag_name"])
-        elif response.status_code != 404:
-            response.raise_for_status()
+        content = http_response_cache.get_content(
+            f"https://api.github.com/repos/{owner}/{repo}/releases/latest",
+            LATEST_DEPENDENCY_VERSION_CACHE_TTL,
+            headers,
+        )
 
-        return result
+        return json.loads(content) if content is not None else None
@@ -0,0 +1,461 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import pathlib
+import re as regex
+import shutil
+import time
+import urllib.parse
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import IO, Any, Final
+
+import requests
+import urllib3
+
+from filelock import FileLock
+
+import cpo.utils.compression
+import cpo.utils.download
+
+from cpo.config import configuration_manager
+from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.file import write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_CACHE_CONFIG_KEY: Final[str] = "download_cache"
+DOWNLOAD_CACHE_MAX_SIZE_CONFIG_KEY: Final[str] = "download_cache_max_size"
+DEFAULT_DOWNLOAD_CACHE_MAX_SIZE: Final[int] = 4294967296  # 4 GiB
+
+DownloadCacheIndex = dict[str, dict[str, Any]]
+
+
+class DownloadCache:
+    """Caches downloaded dependency archives
+
+    Downloaded files are verified against a published SHA-256 digest (if
+    any) and stored in ~/.cpo/cache/downloads/objects/<SHA-256 digest>/<file
+    name>, i.e., files with identical contents are stored once. An index
+    (index.json) maps each URL to the digest, file name, and size of the
+    downloaded file and records when it was last used. If the total size of
+    cached files exceeds the configured maximum size (download_cache_max_size
+    setting), least recently used files are evicted.
+    """
+
+    def download_file(
+        self,
+        url: urllib.parse.SplitResult,
+        get_expected_sha256: Callable[[], str | None] | None = None,
+        **kwargs: Any,
+    ) -> pathlib.Path:
+        """Returns the path of a cached copy of the file with the given URL and
+        downloads the file if it is not cached
+
+        Parameters
+        ----------
+        url
+            url of the file to be downloaded
+        get_expected_sha256
+            function returning the expected SHA-256 digest of the file or None
+            if no digest is published (only called if the file is not cached)
+        **kwargs
+            passed to cpo.utils.download.download_file()
+
+        Returns
+        -------
+        pathlib.Path
+            path of the cached file
+        """
+
+        url_string = urllib.parse.urlunsplit(url)
+
+        if not self.is_enabled():
+            downloaded_file_path = cpo.utils.download.download_file(url, **kwargs)
+
+            try:
+                self._verify_sha256(url_string, self._get_sha256(downloaded_file_path), get_expected_sha256)
+            except CloudPakOperationsCLIException:
+                downloaded_file_path.unlink(missing_ok=True)
+
+                raise
+
+            return downloaded_file_path
+
+        cached_file_path = self._get_cached_file_path(url_string)
+
+        if cached_file_path is not None:
+            logger.debug(f"Using cached download of {url_string}: {cached_file_path}")
+
+            return cached_file_path
+
+        # partial files are kept in the cache directory to resume interrupted
+        # downloads in subsequent invocations
+        download_directory_path = self._get_download_directory_path(url_string)
+        download_directory_path.mkdir(exist_ok=True, parents=True)
+        downloaded_file_path = cpo.utils.download.download_file(
+            url, **(kwargs | {"target_directory_path": download_directory_path})
+        )
+
+        try:
+            sha256 = self._get_sha256(downloaded_file_path)
+            self._verify_sha256(url_string, sha256, get_expected_sha256)
+
+            return self._add_file(url_string, downloaded_file_path, sha256)
+        finally:
+            shutil.rmtree(download_directory_path, ignore_errors=True)
+
+    def extract_archive(
+        self,
+        url: urllib.parse.SplitResult,
+        target_directory_path: pathlib.Path,
+        get_expected_sha256: Callable[[], str | None] | None = None,
+        **kwargs: Any,
+    ):
+        """Extracts the archive with the given URL
+
+        If a tar.gz or tgz archive is not cached, it is extracted while it is
+        being downloaded instead of being read again after the download
+        completed. If neither the download cache is enabled nor a SHA-256
+        digest is published, the download stops as soon as all expected
+        members were extracted (see memberMatcher). If the connection is
+        interrupted, the archive is downloaded (and resumed if possible)
+        before being extracted.
+
+        Parameters
+        ----------
+        url
+            url of the archive to be extracted
+        target_directory_path
+            path of the directory the archive shall be extracted to
+        get_expected_sha256
+            function returning the expected SHA-256 digest of the archive or
+            None if no digest is published
+        **kwargs
+            passed to cpo.utils.compression.extract_archive()
+        """
+
+        url_string = urllib.parse.urlunsplit(url)
+
+        if not cpo.utils.compression.is_tgz_archive(pathlib.PurePosixPath(url.path)) or (
+            self.is_enabled() and (self._get_cached_file_path(url_string) is not None)
+        ):
+            cpo.utils.compression.extract_archive(
+                self.download_file(url, get_expected_sha256), target_directory_path, **kwargs
+            )
+
+            return
+
+        try:
+            self._extract_tgz_archive_while_downloading(url, target_directory_path, get_expected_sha256, **kwargs)
+        except (
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            urllib3.exceptions.HTTPError,
+        ) as exception:
+            logger.warning(
+                f"Download of {url_string} interrupted ({exception}), downloading archive before extracting it"
+            )
+
+            cpo.utils.compression.extract_archive(
+                self.download_file(url, get_expected_sha256), target_directory_path, **kwargs
+            )
+
+    def get_cache_directory_path(self) -> pathlib.Path:
+        """Returns the path of the cache directory
+
+        Returns
+        -------
+        pathlib.Path
+            path of the cache directory
+        """
+
+        return configuration_manager.get_cli_data_directory_path() / "cache" / "downloads"
+
+    def get_max_size(self) -> int:
+        return configuration_manager.get_config_value(
+            DOWNLOAD_CACHE_MAX_SIZE_CONFIG_KEY, int, DEFAULT_DOWNLOAD_CACHE_MAX_SIZE
+        )
+
+    def is_enabled(self) -> bool:
+        return configuration_manager.get_config_value(DOWNLOAD_CACHE_CONFIG_KEY, bool, True)
+
+    def _add_file(self, url: str, downloaded_file_path: pathlib.Path, sha256: str) -> pathlib.Path:
+        cached_file_path = self.get_cache_directory_path() / "objects" / sha256 / downloaded_file_path.name
+        size = downloaded_file_path.stat().st_size
+
+        with self._get_lock():
+            if not cached_file_path.exists():
+                cached_file_path.parent.mkdir(exist_ok=True, parents=True)
+                os.replace(downloaded_file_path, cached_file_path)
+
+            index = self._read_index()
+            index[url] = {
+                "file_name": cached_file_path.name,
+                "last_used": time.time(),
+                "sha256": sha256,
+                "size": size,
+            }
+
+            self._evict_least_recently_used_files(index, sha256)
+            self._write_index(index)
+
+        return cached_file_path
+
+    def _evict_least_recently_used_files(self, index: DownloadCacheIndex, retained_sha256: str):
+        """Removes least recently used files until the total size of cached
+        files does not exceed the maximum size
+
+        Parameters
+        ----------
+        index
+            index to be modified
+        retained_sha256
+            SHA-256 digest of a file that must not be removed
+        """
+
+        # files with identical contents referenced by multiple URLs are
+        # counted once
+        last_used_by_sha256: dict[str, float] = {}
+        size_by_sha256: dict[str, int] = {}
+
+        for entry in index.values():
+            last_used_by_sha256[entry["sha256"]] = max(
+                last_used_by_sha256.get(entry["sha256"], 0.0), entry["last_used"]
+            )
+
+            size_by_sha256[entry["sha256"]] = entry["size"]
+
+        max_size = self.get_max_size()
+        total_size = sum(size_by_sha256.values())
+
+        for sha256 in sorted(last_used_by_sha256, key=last_used_by_sha256.__getitem__):
+            if total_size <= max_size:
+                break
+
+            if sha256 == retained_sha256:
+                continue
+
+            logger.debug(f"Evicting cached download {sha256}")
+            shutil.rmtree(self.get_cache_directory_path() / "objects" / sha256, ignore_errors=True)
+            total_size -= size_by_sha256[sha256]
+
+            for url in [url for url, entry in index.items() if entry["sha256"] == sha256]:
+                del index[url]
+
+    def _extract_tgz_archive_while_downloading(
+        self,
+        url: urllib.parse.SplitResult,
+        target_directory_path: pathlib.Path,
+        get_expected_sha256: Callable[[], str | None] | None,
+        **kwargs: Any,
+    ):
+        url_string = urllib.parse.urlunsplit(url)
+        download_directory_path = self._get_download_directory_path(url_string) if self.is_enabled() else None
+
+        try:
+            with contextlib.ExitStack() as exit_stack:
+                file_name, stream = exit_stack.enter_context(cpo.utils.download.open_file_stream(url))
+                copy_file: IO[bytes] | None = None
+
+                if download_directory_path is not None:
+                    download_directory_path.mkdir(exist_ok=True, parents=True)
+                    copy_file = exit_stack.enter_context(open(download_directory_path / file_name, "wb"))
+
+                reader = _DigestingReader(stream, copy_file)
+                extracted_paths = cpo.utils.compression.extract_tgz_archive_from_stream(
+                    reader, target_directory_path, **kwargs
+                )
+
+                if (get_expected_sha256 is not None) or (copy_file is not None):
+                    reader.read_remaining()
+
+            if get_expected_sha256 is not None:
+                try:
+                    self._verify_sha256(url_string, reader.hexdigest(), get_expected_sha256)
+                except CloudPakOperationsCLIException:
+                    for extracted_path in extracted_paths:
+                        if extracted_path.is_dir():
+                            shutil.rmtree(extracted_path, ignore_errors=True)
+                        else:
+                            extracted_path.unlink(missing_ok=True)
+
+                    raise
+
+            if download_directory_path is not None:
+                self._add_file(url_string, download_directory_path / file_name, reader.hexdigest())
+        finally:
+            if download_directory_path is not None:
+                shutil.rmtree(download_directory_path, ignore_errors=True)
+
+    def _get_cached_file_path(self, url: str) -> pathlib.Path | None:
+        if not self._get_index_file_path().exists():
+            return None
+
+        with self._get_lock():
+            index = self._read_index()
+            entry = index.get(url)
+
+            if entry is None:
+                return None
+
+            cached_file_path = self.get_cache_directory_path() / "objects" / entry["sha256"] / entry["file_name"]
+
+            try:
+                is_valid = cached_file_path.stat().st_size == entry["size"]
+            except FileNotFoundError:
+                is_valid = False
+
+            if is_valid:
+                entry["last_used"] = time.time()
+            else:
+                del index[url]
+
+            self._write_index(index)
+
+            return cached_file_path if is_valid else None
+
+    def _get_download_directory_path(self, url: str) -> pathlib.Path:
+        return self.get_cache_directory_path() / "partial" / hashlib.sha256(url.encode()).hexdigest()
+
+    def _get_index_file_path(self) -> pathlib.Path:
+        return self.get_cache_directory_path() / "index.json"
+
+    def _get_lock(self) -> FileLock:
+        self.get_cache_directory_path().mkdir(exist_ok=True, parents=True)
+
+        return FileLock(self.get_cache_directory_path() / "index.json.lock")
+
+    def _get_sha256(self, path: pathlib.Path) -> str:
+        with open(path, "rb") as file:
+            return hashlib.file_digest(file, "sha256").hexdigest()
+
+    def _read_index(self) -> DownloadCacheIndex:
+        try:
+            return json.loads(self._get_index_file_path().read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"Ignoring invalid download cache index {self._get_index_file_path()}")
+
+            return {}
+
+    def _verify_sha256(self, url: str, sha256: str, get_expected_sha256: Callable[[], str | None] | None):
+        expected_sha256 = get_expected_sha256() if get_expected_sha256 is not None else None
+
+        if (expected_sha256 is not None) and (sha256 != expected_sha256.lower()):
+            raise CloudPakOperationsCLIException(
+                f"SHA-256 digest of {url} ({sha256}) does not match expected digest ({expected_sha256})"
+            )
+
+    def _write_index(self, index: DownloadCacheIndex):
+        write_file_atomically(self._get_index_file_path(), json.dumps(index, indent=4), 0o644)
+
+
+@dataclass
+class DependencyArchive:
+    """Archive providing a dependency
+
+    The archive is downloaded or read from the download cache when it is
+    extracted (see DownloadCache.extract_archive()).
+    """
+
+    url: urllib.parse.SplitResult
+    get_expected_sha256: Callable[[], str | None] | None = None
+
+    def extract(self, target_directory_path: pathlib.Path, **kwargs: Any):
+        """Extracts the archive
+
+        Parameters
+        ----------
+        target_directory_path
+            path of the directory the archive shall be extracted to
+        **kwargs
+            passed to cpo.utils.compression.extract_archive()
+        """
+
+        download_cache.extract_archive(self.url, target_directory_path, self.get_expected_sha256, **kwargs)
+
+
+class _DigestingReader:
+    """Computes the SHA-256 digest of data read from a stream and optionally
+    copies the data to a file"""
+
+    def __init__(self, stream: IO[bytes], copy_file: IO[bytes] | None):
+        self._copy_file = copy_file
+        self._hash = hashlib.sha256()
+        self._stream = stream
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._hash.update(data)
+
+        if self._copy_file is not None:
+            self._copy_file.write(data)
+
+        return data
+
+    def read_remaining(self):
+        while len(self.read(cpo.utils.download.DOWNLOAD_CHUNK_SIZE)) != 0:
+            pass
+
+
+def get_sha256_from_checksums_file(checksums_file_url: str, file_name: str) -> str | None:
+    """Returns the SHA-256 digest of the given file listed in a checksums file
+    in the format of sha256sum (e.g., sha256sum.txt on mirror.openshift.com)
+
+    Parameters
+    ----------
+    checksums_file_url
+        URL of the checksums file
+    file_name
+        name of the file whose digest shall be returned
+
+    Returns
+    -------
+    str | None
+        SHA-256 digest of the given file or None if the checksums file does not
+        exist or does not list the given file
+    """
+
+    with io.BytesIO() as buffer:
+        try:
+            cpo.utils.download.download_file_into_buffer(urllib.parse.urlsplit(checksums_file_url), buffer, silent=True)
+        except requests.exceptions.HTTPError as exception:
+            if (exception.response is not None) and (exception.response.status_code == 404):
+                return None
+
+            raise
+
+        for line in buffer.getvalue().decode().splitlines():
+            search_result = regex.fullmatch("([0-9a-fA-F]{64}) [ *](.+)", line.strip())
+
+            if (search_result is not None) and (search_result.group(2) == file_name):
+                return search_result.group(1)
+
+    return None
+
+
+download_cache = DownloadCache()
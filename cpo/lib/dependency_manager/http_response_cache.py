@@ -0,0 +1,138 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import base64
+import hashlib
+import json
+import logging
+import pathlib
+import time
+
+from typing import Any, Final
+
+from cpo.config import configuration_manager
+from cpo.utils.file import write_file_atomically
+from cpo.utils.http_session import get_session
+
+logger = logging.getLogger(__name__)
+
+HTTP_RESPONSE_CACHE_CONFIG_KEY: Final[str] = "http_response_cache"
+
+
+class HTTPResponseCache:
+    """Caches contents of HTTP responses
+
+    Contents are stored in ~/.cpo/cache/http-responses together with the
+    values of the ETag and Last-Modified response headers. Cached contents
+    younger than the given TTL are returned without sending a request. Older
+    cached contents are revalidated using a conditional request
+    (If-None-Match/If-Modified-Since), i.e., the contents are only transferred
+    again if they were modified.
+    """
+
+    def get_cache_directory_path(self) -> pathlib.Path:
+        """Returns the path of the cache directory
+
+        Returns
+        -------
+        pathlib.Path
+            path of the cache directory
+        """
+
+        return configuration_manager.get_cli_data_directory_path() / "cache" / "http-responses"
+
+    def get_content(self, url: str, ttl: float, headers: dict[str, str] | None = None) -> bytes | None:
+        """Returns the contents of the HTTP response to a GET request for the
+        given URL
+
+        Parameters
+        ----------
+        url
+            URL to be requested
+        ttl
+            number of seconds for which cached contents are returned without
+            being revalidated
+        headers
+            additional request headers (not part of the cache key)
+
+        Returns
+        -------
+        bytes | None
+            contents of the HTTP response or None if the server returned HTTP
+            status code 404
+        """
+
+        cache_entry = self._read_cache_entry(url) if self.is_enabled() else None
+
+        if (cache_entry is not None) and (time.time() - cache_entry["timestamp"] <= ttl):
+            logger.debug(f"Using cached response for {url}")
+
+            return base64.b64decode(cache_entry["content"])
+
+        request_headers = dict(headers) if headers is not None else {}
+
+        if cache_entry is not None:
+            if cache_entry["etag"] is not None:
+                request_headers["If-None-Match"] = cache_entry["etag"]
+
+            if cache_entry["last_modified"] is not None:
+                request_headers["If-Modified-Since"] = cache_entry["last_modified"]
+
+        response = get_session().get(url, headers=request_headers)
+
+        if (response.status_code == 304) and (cache_entry is not None):
+            logger.debug(f"Cached response for {url} was not modified")
+
+            self._write_cache_entry(url, cache_entry | {"timestamp": time.time()})
+
+            return base64.b64decode(cache_entry["content"])
+
+        if response.status_code == 404:
+            return None
+
+        response.raise_for_status()
+
+        if self.is_enabled():
+            self._write_cache_entry(
+                url,
+                {
+                    "content": base64.b64encode(response.content).decode(),
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "timestamp": time.time(),
+                },
+            )
+
+        return response.content
+
+    def is_enabled(self) -> bool:
+        return configuration_manager.get_config_value(HTTP_RESPONSE_CACHE_CONFIG_KEY, bool, True)
+
+    def _get_cache_file_path(self, url: str) -> pathlib.Path:
+        return self.get_cache_directory_path() / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _read_cache_entry(self, url: str) -> Any | None:
+        try:
+            return json.loads(self._get_cache_file_path(url).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache_entry(self, url: str, cache_entry: Any):
+        cache_file_path = self._get_cache_file_path(url)
+        cache_file_path.parent.mkdir(exist_ok=True, parents=True)
+
+        write_file_atomically(cache_file_path, json.dumps(cache_entry))
+
+
+http_response_cache = HTTPResponseCache()
@@ -17,14 +17,14 @@ import pathlib
 import urllib.parse
 
 import cpo.config
-import cpo.utils.compression
-import cpo.utils.download
 import cpo.utils.file
 import cpo.utils.operating_system
 import cpo.utils.process
 
 from cpo.lib.dependency_manager.dependency_manager_binary_plugin import DependencyManagerBinaryPlugIn
 from cpo.lib.dependency_manager.dependency_manager_plugin import DependencyVersion
+from cpo.lib.dependency_manager.download_cache import DependencyArchive
+from cpo.utils.compression import MemberMatcher
 from cpo.utils.error import CloudPakOperationsCLIException, IBMCloudException
 from cpo.utils.operating_system import OperatingSystem
 
@@ -50,9 +50,9 @@ class IBMCloudCLIPlugIn(DependencyManagerBinaryPlugIn):
 
         file_name = f"IBM_Cloud_CLI_{version}_{file_name_suffix}"
         url = f"https://download.clis.cloud.ibm.com/ibm-cloud-cli/{version}/binaries/{file_name}"
-        archive_path = cpo.utils.download.download_file(urllib.parse.urlsplit(url))
+        archive = DependencyArchive(urllib.parse.urlsplit(url))
 
-        self._extract_archive(archive_path, version, operating_system)
+        self._extract_archive(archive, version, operating_system)
 
     # override
     def execute_binary(
@@ -63,6 +63,9 @@ class IBMCloudCLIPlugIn(DependencyManagerBinaryPlugIn):
         capture_output=False,
         check=True,
         print_captured_output=False,
+        max_captured_lines: int | None = None,
+        capture_raw_stdout=False,
+        timeout: float | None = None,
     ) -> cpo.utils.process.ProcessResult:
         try:
             return super().execute_binary(
@@ -72,6 +75,34 @@ class IBMCloudCLIPlugIn(DependencyManagerBinaryPlugIn):
                 capture_output=capture_output,
                 check=check,
                 print_captured_output=print_captured_output,
+                max_captured_lines=max_captured_lines,
+                capture_raw_stdout=capture_raw_stdout,
+                timeout=timeout,
+            )
+        except CloudPakOperationsCLIException as exception:
+            if exception.stderr is not None:
+                raise IBMCloudException(exception.stderr)
+            else:
+                raise
+
+    # override
+    def execute_binary_concurrently(
+        self,
+        version: str,
+        list_of_args: list[list[str]],
+        env: dict[str, str] = os.environ.copy(),
+        check=True,
+        print_captured_output=False,
+        max_parallel: int = 4,
+    ) -> list[cpo.utils.process.ProcessResult]:
+        try:
+            return super().execute_binary_concurrently(
+                version,
+                list_of_args,
+                env,
+                check=check,
+                print_captured_output=print_captured_output,
+                max_parallel=max_parallel,
             )
         except CloudPakOperationsCLIException as exception:
             if exception.stderr is not None:
@@ -83,6 +114,20 @@ class IBMCloudCLIPlugIn(DependencyManagerBinaryPlugIn):
     def get_binary_name(self) -> str | None:
         return "ibmcloud"
 
+    # override
+    def get_cache_key_environment(self, env: dict[str, str]) -> dict[str, str | None]:
+        ibmcloud_home = env.get("IBMCLOUD_HOME")
+        ibmcloud_config_file_path = (
+            (pathlib.Path(ibmcloud_home) if ibmcloud_home is not None else pathlib.Path.home())
+            / ".bluemix"
+            / "config.json"
+        )
+
+        return {
+            "IBMCLOUD_HOME": ibmcloud_home,
+            "config.json": cpo.utils.file.get_modification_time(ibmcloud_config_file_path),
+        }
+
     # override
     def get_dependency_alias(self) -> str:
         return "ibmcloud"
@@ -106,13 +151,13 @@ class IBMCloudCLIPlugIn(DependencyManagerBinaryPlugIn):
     def is_operating_system_supported(self, operating_system: OperatingSystem) -> bool:
         return operating_system in self._operating_system_to_file_name_suffix_dict
 
-    def _extract_archive(self, archive_path: pathlib.Path, version: str, operating_system: OperatingSystem):
+    def _extract_archive(self, archive: DependencyArchive, version: str, operating_system: OperatingSystem):
         """Extracts the given archive in a dependency-specific manner
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        archive
+            archive to be extracted
         """
 
         binary_name_with_os_specific_extension = (
@@ -121,19 +166,16 @@ class IBMCloudCLIPlugIn(DependencyManagerBinaryPlugIn):
 
         target_directory_path = cpo.config.configuration_manager.get_bin_directory_path()
 
-        cpo.utils.compression.extract_archive(
-            archive_path,
-            target_directory_path,
-            ignoreDirectoryStructure=True,
-            memberIdentificationFunc=lambda path, file_type: (
-                (os.path.basename(path) == binary_name_with_os_specific_extension)
-                and (file_type == cpo.utils.file.FileType.RegularFile)
-            ),
-        )
+        with self._create_staging_directory() as staging_directory_path:
+            archive.extract(
+                staging_directory_path,
+                ignoreDirectoryStructure=True,
+                memberMatcher=MemberMatcher(
+                    [binary_name_with_os_specific_extension], cpo.utils.file.FileType.RegularFile
+                ),
+            )
 
-        source_file_name = pathlib.Path(f"{target_directory_path}/{binary_name_with_os_specific_extension}")
-        target_file_name = pathlib.Path(
-            f"{source_file_name.parent}/{self.get_binary_name()}-{version}{source_file_name.suffix}"
-        )
+            source_file_name = staging_directory_path / binary_name_with_os_specific_extension
+            target_file_name = target_directory_path / f"{self.get_binary_name()}-{version}{source_file_name.suffix}"
 
-        pathlib.Path(target_directory_path / source_file_name).rename(target_file_name)
+            os.replace(source_file_name, target_file_name)
@@ -12,16 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import pathlib
+import os
 import urllib.parse
 
 import cpo.config
-import cpo.utils.compression
-import cpo.utils.download
 import cpo.utils.operating_system
 
 from cpo.lib.dependency_manager.dependency_manager_binary_plugin import DependencyManagerBinaryPlugIn
 from cpo.lib.dependency_manager.dependency_manager_plugin import DependencyVersion
+from cpo.lib.dependency_manager.download_cache import DependencyArchive
 from cpo.utils.error import CloudPakOperationsCLIException
 from cpo.utils.operating_system import OperatingSystem
 
@@ -41,9 +40,9 @@ class IBMCloudPakCLIPlugIn(DependencyManagerBinaryPlugIn):
         file_name_infix = self._operating_system_to_file_name_infix_dict[operating_system]
         file_name = f"cloudctl-{file_name_infix}-amd64.tar.gz"
         url = f"https://github.com/IBM/cloud-pak-cli/releases/download/v{version}/{file_name}"
-        archive_path = cpo.utils.download.download_file(urllib.parse.urlsplit(url))
+        archive = DependencyArchive(urllib.parse.urlsplit(url))
 
-        self._extract_archive(archive_path, version, operating_system)
+        self._extract_archive(archive, version, operating_system)
 
     # override
     def get_binary_name(self) -> str | None:
@@ -70,27 +69,25 @@ class IBMCloudPakCLIPlugIn(DependencyManagerBinaryPlugIn):
     def is_operating_system_supported(self, operating_system: OperatingSystem) -> bool:
         return operating_system in self._operating_system_to_file_name_infix_dict
 
-    def _extract_archive(self, archive_path: pathlib.Path, version: str, operating_system: OperatingSystem):
+    def _extract_archive(self, archive: DependencyArchive, version: str, operating_system: OperatingSystem):
         """Extracts the given archive in a dependency-specific manner
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        archive
+            archive to be extracted
         operating_system
             current operating system
         """
 
         target_directory_path = cpo.config.configuration_manager.get_bin_directory_path()
 
-        cpo.utils.compression.extract_archive(
-            archive_path,
-            target_directory_path,
-        )
+        with self._create_staging_directory() as staging_directory_path:
+            archive.extract(staging_directory_path)
 
-        file_name_infix = self._operating_system_to_file_name_infix_dict[operating_system]
-        file_name_suffix = ".exe" if operating_system == OperatingSystem.WINDOWS else ""
-        source_file_name = pathlib.Path(f"{target_directory_path}/cloudctl-{file_name_infix}-amd64{file_name_suffix}")
-        target_file_name = pathlib.Path(f"{source_file_name.parent}/cloudctl-{version}{source_file_name.suffix}")
+            file_name_infix = self._operating_system_to_file_name_infix_dict[operating_system]
+            file_name_suffix = ".exe" if operating_system == OperatingSystem.WINDOWS else ""
+            source_file_name = staging_directory_path / f"cloudctl-{file_name_infix}-amd64{file_name_suffix}"
+            target_file_name = target_directory_path / f"cloudctl-{version}{source_file_name.suffix}"
 
-        pathlib.Path(target_directory_path / source_file_name).rename(target_file_name)
+            os.replace(source_file_name, target_file_name)
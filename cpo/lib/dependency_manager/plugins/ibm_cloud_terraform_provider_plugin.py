@@ -17,12 +17,12 @@ import pathlib
 import urllib.parse
 
 import cpo.config
-import cpo.utils.compression
-import cpo.utils.download
 import cpo.utils.operating_system
 
 from cpo.lib.dependency_manager.dependency_manager_plugin import AbstractDependencyManagerPlugIn, DependencyVersion
+from cpo.lib.dependency_manager.download_cache import DependencyArchive
 from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.file import create_staging_directory
 from cpo.utils.operating_system import OperatingSystem
 
 
@@ -56,10 +56,10 @@ class IBMCloudTerraformProviderPlugIn(AbstractDependencyManagerPlugIn):
 
         url = f"https://github.com/IBM-Cloud/terraform-provider-ibm/releases/download/v{version}/{file_name}"
 
-        archive_path = cpo.utils.download.download_file(urllib.parse.urlsplit(url))
+        archive = DependencyArchive(urllib.parse.urlsplit(url))
         target_directory_path = self.get_terraform_plugins_directory_path()
 
-        self._extract_archive(archive_path, target_directory_path)
+        self._extract_archive(archive, target_directory_path)
 
     # override
     def get_dependency_alias(self) -> str:
@@ -98,22 +98,45 @@ class IBMCloudTerraformProviderPlugIn(AbstractDependencyManagerPlugIn):
             ]
         )
 
+    # override
+    def is_dependency_version_downloaded(self, version: str) -> bool:
+        terraform_plugins_directory_path = self.get_terraform_plugins_directory_path()
+
+        # the file name is compared exactly as, e.g., 1.6.1 is a prefix of 1.6.10
+        return any(
+            (terraform_plugins_directory_path / f"terraform-provider-ibm_v{version}{suffix}").exists()
+            for suffix in ["", ".exe"]
+        )
+
     # override
     def is_operating_system_supported(self, operating_system: OperatingSystem) -> bool:
         return operating_system in self._ibmcloud_terraform_provider_plugin_configuration_data_dict
 
-    def _extract_archive(self, archive_path: pathlib.Path, target_directory_path: pathlib.Path):
+    def _extract_archive(self, archive: DependencyArchive, target_directory_path: pathlib.Path):
         """Extracts the given archive in a dependency-specific manner
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        archive
+            archive to be extracted
         target_directory_path
             path of the directory the archive shall be extracted to
         """
 
-        for entry in pathlib.Path(target_directory_path).glob("terraform-provider-ibm*"):
-            os.remove(entry)
+        # extract the archive to a staging directory on the same file system
+        # first to install the provider atomically
+        with create_staging_directory(target_directory_path) as staging_directory_path:
+            archive.extract(staging_directory_path)
+
+            extracted_file_names: set[str] = set()
+
+            # replace existing files instead of removing them first to never
+            # leave the target directory without a provider
+            for entry in staging_directory_path.iterdir():
+                os.replace(entry, target_directory_path / entry.name)
+                extracted_file_names.add(entry.name)
 
-        cpo.utils.compression.extract_archive(archive_path, target_directory_path)
+            # remove providers of other versions
+            for entry in target_directory_path.glob("terraform-provider-ibm*"):
+                if entry.name not in extracted_file_names:
+                    entry.unlink(missing_ok=True)
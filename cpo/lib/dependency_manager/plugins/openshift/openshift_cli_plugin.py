@@ -1,4 +1,4 @@
-#  Copyright 2023, 2024 IBM Corporation
+#  Copyright 2023, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -12,6 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import pathlib
+
+import cpo.utils.file
+
 from cpo.lib.dependency_manager.plugins.openshift.openshift_plugin import AbstractOpenShiftPlugIn
 from cpo.utils.operating_system import OperatingSystem
 
@@ -21,6 +26,19 @@ class OpenShiftCLIPlugIn(AbstractOpenShiftPlugIn):
     def get_binary_name(self) -> str | None:
         return "oc"
 
+    # override
+    def get_cache_key_environment(self, env: dict[str, str]) -> dict[str, str | None]:
+        kube_config = env.get("KUBECONFIG")
+        kube_config_file_paths = (
+            [pathlib.Path(path).expanduser() for path in kube_config.split(os.pathsep) if path != ""]
+            if kube_config
+            else [pathlib.Path.home() / ".kube" / "config"]
+        )
+
+        return {"KUBECONFIG": kube_config} | {
+            str(path): cpo.utils.file.get_modification_time(path) for path in kube_config_file_paths
+        }
+
     # override
     def get_dependency_alias(self) -> str:
         return "oc"
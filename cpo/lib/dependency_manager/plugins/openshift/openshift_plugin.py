@@ -12,9 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import io
 import os
-import pathlib
 import re as regex
 import urllib.parse
 
@@ -23,13 +21,14 @@ from abc import abstractmethod
 import requests
 
 import cpo.config
-import cpo.utils.compression
-import cpo.utils.download
 import cpo.utils.file
 import cpo.utils.operating_system
 
 from cpo.lib.dependency_manager.dependency_manager_binary_plugin import DependencyManagerBinaryPlugIn
-from cpo.lib.dependency_manager.dependency_manager_plugin import DependencyVersion
+from cpo.lib.dependency_manager.dependency_manager_plugin import LATEST_DEPENDENCY_VERSION_CACHE_TTL, DependencyVersion
+from cpo.lib.dependency_manager.download_cache import DependencyArchive, get_sha256_from_checksums_file
+from cpo.lib.dependency_manager.http_response_cache import http_response_cache
+from cpo.utils.compression import MemberMatcher
 from cpo.utils.error import CloudPakOperationsCLIException
 from cpo.utils.operating_system import OperatingSystem
 
@@ -47,16 +46,21 @@ class AbstractOpenShiftPlugIn(DependencyManagerBinaryPlugIn):
 
         url = f"https://mirror.openshift.com/pub/openshift-v4/clients/ocp/{version}/{file_name}"
 
+        archive = DependencyArchive(
+            urllib.parse.urlsplit(url),
+            lambda: get_sha256_from_checksums_file(
+                f"https://mirror.openshift.com/pub/openshift-v4/clients/ocp/{version}/sha256sum.txt", file_name
+            ),
+        )
+
         try:
-            archive_path = cpo.utils.download.download_file(urllib.parse.urlsplit(url))
+            self._extract_archive(archive, version, operating_system)
         except requests.exceptions.HTTPError as exception:
             if (exception.response is not None) and (exception.response.status_code == 404):
                 raise CloudPakOperationsCLIException(f"{self.get_dependency_name()} {version} does not exist")
             else:
                 raise
 
-        self._extract_archive(archive_path, version, operating_system)
-
     # override
     def get_latest_dependency_version(self, github_access_token: str | None) -> DependencyVersion:
         """Returns the latest version of the OpenShift CLI
@@ -68,25 +72,26 @@ class AbstractOpenShiftPlugIn(DependencyManagerBinaryPlugIn):
         """
 
         url = "https://mirror.openshift.com/pub/openshift-v4/clients/ocp/latest/release.txt"
+        content = http_response_cache.get_content(url, LATEST_DEPENDENCY_VERSION_CACHE_TTL)
 
-        with io.BytesIO() as buffer:
-            cpo.utils.download.download_file_into_buffer(urllib.parse.urlsplit(url), buffer, silent=True)
+        if content is None:
+            raise CloudPakOperationsCLIException(f"{url} does not exist")
 
-            latest_version = self._parse_version_from_versions_file(buffer.getvalue().decode("utf-8"))
+        latest_version = self._parse_version_from_versions_file(content.decode("utf-8"))
 
-            return DependencyVersion(latest_version)
+        return DependencyVersion(latest_version)
 
     # override
     def is_operating_system_supported(self, operating_system: OperatingSystem) -> bool:
         return operating_system in self._get_operating_system_file_name_dict()
 
-    def _extract_archive(self, archive_path: pathlib.Path, version: str, operating_system: OperatingSystem):
+    def _extract_archive(self, archive: DependencyArchive, version: str, operating_system: OperatingSystem):
         """Extracts the given archive in a dependency-specific manner
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        archive
+            archive to be extracted
         """
 
         binary_name_with_os_specific_extension = (
@@ -95,21 +100,18 @@ class AbstractOpenShiftPlugIn(DependencyManagerBinaryPlugIn):
 
         target_directory_path = cpo.config.configuration_manager.get_bin_directory_path()
 
-        cpo.utils.compression.extract_archive(
-            archive_path,
-            target_directory_path,
-            memberIdentificationFunc=lambda path, file_type: (
-                (os.path.basename(path) == binary_name_with_os_specific_extension)
-                and (file_type == cpo.utils.file.FileType.RegularFile)
-            ),
-        )
+        with self._create_staging_directory() as staging_directory_path:
+            archive.extract(
+                staging_directory_path,
+                memberMatcher=MemberMatcher(
+                    [binary_name_with_os_specific_extension], cpo.utils.file.FileType.RegularFile
+                ),
+            )
 
-        source_file_name = pathlib.Path(f"{target_directory_path}/{binary_name_with_os_specific_extension}")
-        target_file_name = pathlib.Path(
-            f"{source_file_name.parent}/{self.get_binary_name()}-{version}{source_file_name.suffix}"
-        )
+            source_file_name = staging_directory_path / binary_name_with_os_specific_extension
+            target_file_name = target_directory_path / f"{self.get_binary_name()}-{version}{source_file_name.suffix}"
 
-        pathlib.Path(target_directory_path / source_file_name).rename(target_file_name)
+            os.replace(source_file_name, target_file_name)
 
     @abstractmethod
     def _get_operating_system_file_name_dict(self) -> dict[OperatingSystem, str]:
@@ -13,17 +13,16 @@
 #  limitations under the License.
 
 import os
-import pathlib
 import stat
 import urllib.parse
 
 import cpo.config
-import cpo.utils.compression
-import cpo.utils.download
 import cpo.utils.operating_system
 
 from cpo.lib.dependency_manager.dependency_manager_binary_plugin import DependencyManagerBinaryPlugIn
 from cpo.lib.dependency_manager.dependency_manager_plugin import DependencyVersion
+from cpo.lib.dependency_manager.download_cache import DependencyArchive, get_sha256_from_checksums_file
+from cpo.utils.compression import MemberMatcher
 from cpo.utils.error import CloudPakOperationsCLIException
 from cpo.utils.operating_system import OperatingSystem
 
@@ -49,9 +48,14 @@ class TerraformPlugin(DependencyManagerBinaryPlugIn):
 
         file_name = f"terraform_{version}_{file_name_suffix}"
         url = f"https://releases.hashicorp.com/terraform/{version}/{file_name}"
-        archive_path = cpo.utils.download.download_file(urllib.parse.urlsplit(url))
+        archive = DependencyArchive(
+            urllib.parse.urlsplit(url),
+            lambda: get_sha256_from_checksums_file(
+                f"https://releases.hashicorp.com/terraform/{version}/terraform_{version}_SHA256SUMS", file_name
+            ),
+        )
 
-        self._extract_archive(archive_path, version, operating_system)
+        self._extract_archive(archive, version, operating_system)
 
     # override
     def get_binary_name(self) -> str | None:
@@ -78,44 +82,44 @@ class TerraformPlugin(DependencyManagerBinaryPlugIn):
     def is_operating_system_supported(self, operating_system: OperatingSystem) -> bool:
         return operating_system in self._operating_system_to_file_name_suffix_dict
 
-    def _extract_archive(self, archive_path: pathlib.Path, version: str, operating_system: OperatingSystem):
+    def _extract_archive(self, archive: DependencyArchive, version: str, operating_system: OperatingSystem):
         """Extracts the given archive in a dependency-specific manner
 
         Parameters
         ----------
-        archive_path
-            path of the archive to be extracted
+        archive
+            archive to be extracted
         operating_system
             current operating system
         """
 
         target_directory_path = cpo.config.configuration_manager.get_bin_directory_path()
 
-        if (
-            (operating_system == cpo.utils.operating_system.OperatingSystem.LINUX_X86_64)
-            or (operating_system == cpo.utils.operating_system.OperatingSystem.MAC_OS_AMD64)
-            or (operating_system == cpo.utils.operating_system.OperatingSystem.MAC_OS_ARM64)
-        ):
-            cpo.utils.compression.extract_archive(
-                archive_path,
-                target_directory_path,
-                memberIdentificationFunc=lambda path, file_type: os.path.basename(path) == "terraform",
-                # change file mode (see https://github.com/python/cpython/issues/59999)
-                postExtractionFunc=lambda path: os.chmod(
-                    path,
-                    os.stat(path).st_mode | stat.S_IXGRP | stat.S_IXOTH | stat.S_IXUSR,
-                ),
+        with self._create_staging_directory() as staging_directory_path:
+            if (
+                (operating_system == cpo.utils.operating_system.OperatingSystem.LINUX_X86_64)
+                or (operating_system == cpo.utils.operating_system.OperatingSystem.MAC_OS_AMD64)
+                or (operating_system == cpo.utils.operating_system.OperatingSystem.MAC_OS_ARM64)
+            ):
+                archive.extract(
+                    staging_directory_path,
+                    memberMatcher=MemberMatcher(["terraform"]),
+                    # change file mode (see https://github.com/python/cpython/issues/59999)
+                    postExtractionFunc=lambda path: os.chmod(
+                        path,
+                        os.stat(path).st_mode | stat.S_IXGRP | stat.S_IXOTH | stat.S_IXUSR,
+                    ),
+                )
+            else:
+                archive.extract(staging_directory_path)
+
+            binary_name_with_os_specific_extension = (
+                f"{self.get_binary_name()}.exe"
+                if (operating_system == OperatingSystem.WINDOWS)
+                else self.get_binary_name()
             )
-        else:
-            cpo.utils.compression.extract_archive(archive_path, target_directory_path)
-
-        binary_name_with_os_specific_extension = (
-            f"{self.get_binary_name()}.exe" if (operating_system == OperatingSystem.WINDOWS) else self.get_binary_name()
-        )
 
-        source_file_name = pathlib.Path(f"{target_directory_path}/{binary_name_with_os_specific_extension}")
-        target_file_name = pathlib.Path(
-            f"{source_file_name.parent}/{self.get_binary_name()}-{version}{source_file_name.suffix}"
-        )
+            source_file_name = staging_directory_path / binary_name_with_os_specific_extension
+            target_file_name = target_directory_path / f"{self.get_binary_name()}-{version}{source_file_name.suffix}"
 
-        pathlib.Path(target_directory_path / source_file_name).rename(target_file_name)
+            os.replace(source_file_name, target_file_name)
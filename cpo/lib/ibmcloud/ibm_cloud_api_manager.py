@@ -25,6 +25,7 @@ import cpo.utils.process
 
 from cpo.config import configuration_manager
 from cpo.config.cluster_credentials_manager import cluster_credentials_manager
+from cpo.lib.dependency_manager.binary_result_cache import binary_result_cache
 from cpo.lib.dependency_manager.dependency_manager import DependencyManager
 from cpo.lib.dependency_manager.plugins.ibm_cloud_cli_plugin import IBMCloudCLIPlugIn
 from cpo.lib.ibmcloud import (
@@ -36,6 +37,8 @@ from cpo.lib.ibmcloud.data.cluster_status import ClusterStatus
 from cpo.lib.ibmcloud.data.ingress_status import IngressStatus
 from cpo.utils.error import CloudPakOperationsCLIException, IBMCloudException
 
+IBMCLOUD_READ_ONLY_COMMAND_CACHE_TTL: Final[float] = 300.0
+
 
 @dataclass
 class IBMCloudAPIKey:
@@ -90,6 +93,8 @@ class IBMCloudAPIManager:
             ]
         )
 
+        binary_result_cache.invalidate(IBMCloudCLIPlugIn().get_dependency_alias())
+
     def delete_api_key_in_ibm_cloud_and_on_disk(self):
         """Deletes the current IBM Cloud API key in IBM Cloud and on disk"""
 
@@ -148,7 +153,13 @@ class IBMCloudAPIManager:
         self._execute_ibmcloud_command(["config", "--check-version=false"], capture_output=True)
 
     def execute_ibmcloud_command(
-        self, args: list[str], capture_output=False, check=True, print_captured_output=False, skip_login=False
+        self,
+        args: list[str],
+        capture_output=False,
+        check=True,
+        print_captured_output=False,
+        skip_login=False,
+        cache_ttl: float | None = None,
     ) -> cpo.utils.process.ProcessResult:
         """Executes the IBM Cloud CLI
 
@@ -166,6 +177,9 @@ class IBMCloudAPIManager:
             stdout/stderr
         skip_login
             flag indicating whether logging in to IBM Cloud shall be skipped
+        cache_ttl
+            number of seconds for which the result of a successful read-only
+            invocation is cached (default: results are not cached)
 
         Returns
         -------
@@ -184,7 +198,7 @@ class IBMCloudAPIManager:
                 self.log_in_using_api_key(api_key)
 
         result = self._execute_ibmcloud_command_without_check(
-            args, capture_output=capture_output, print_captured_output=print_captured_output
+            args, capture_output=capture_output, print_captured_output=print_captured_output, cache_ttl=cache_ttl
         )
 
         if result.return_code != 0:
@@ -195,7 +209,11 @@ class IBMCloudAPIManager:
                 self.log_in_using_api_key(api_key)
 
                 result = self._execute_ibmcloud_command(
-                    args, capture_output=capture_output, check=check, print_captured_output=print_captured_output
+                    args,
+                    capture_output=capture_output,
+                    check=check,
+                    print_captured_output=print_captured_output,
+                    cache_ttl=cache_ttl,
                 )
             else:
                 result.raise_for_status()
@@ -257,6 +275,7 @@ class IBMCloudAPIManager:
             skip_login=skip_login,
         )
 
+        binary_result_cache.invalidate(IBMCloudCLIPlugIn().get_dependency_alias())
         json_result = json.loads(result.stdout)
 
         return IBMCloudAPIKey(json_result["apikey"], json_result["id"])
@@ -335,7 +354,9 @@ class IBMCloudAPIManager:
             IBM Cloud API keys
         """
 
-        result = self.execute_ibmcloud_command(["iam", "api-keys", "--output", "json"], capture_output=True)
+        result = self.execute_ibmcloud_command(
+            ["iam", "api-keys", "--output", "json"], capture_output=True, cache_ttl=IBMCLOUD_READ_ONLY_COMMAND_CACHE_TTL
+        )
 
         return json.loads(result.stdout)
 
@@ -428,7 +449,12 @@ class IBMCloudAPIManager:
         )
 
     def _execute_ibmcloud_command(
-        self, args: list[str], capture_output=False, check=True, print_captured_output=False
+        self,
+        args: list[str],
+        capture_output=False,
+        check=True,
+        print_captured_output=False,
+        cache_ttl: float | None = None,
     ) -> cpo.utils.process.ProcessResult:
         """Executes the IBM Cloud CLI
 
@@ -463,6 +489,7 @@ class IBMCloudAPIManager:
             capture_output=capture_output,
             check=check,
             print_captured_output=print_captured_output,
+            cache_ttl=cache_ttl,
         )
 
     def _execute_ibmcloud_command_interactively(self, args: list[str]) -> int:
@@ -481,7 +508,7 @@ class IBMCloudAPIManager:
         return proc.returncode
 
     def _execute_ibmcloud_command_without_check(
-        self, args: list[str], capture_output=False, print_captured_output=False
+        self, args: list[str], capture_output=False, print_captured_output=False, cache_ttl: float | None = None
     ) -> cpo.utils.process.ProcessResult:
         """Executes the IBM Cloud CLI without checking its return code
 
@@ -507,6 +534,7 @@ class IBMCloudAPIManager:
             capture_output=capture_output,
             check=False,
             print_captured_output=print_captured_output,
+            cache_ttl=cache_ttl,
         )
 
     def _read_ibmcloud_config_file_contents(self) -> Any | None:
@@ -550,7 +578,7 @@ class PlugInManager:
     def _get_plug_ins(self) -> list[str]:
         ibmcloud_plugin_list_command_args = ["plugin", "list", "--output", "json"]
         ibmcloud_plugin_list_command_result = self._ibm_cloud_api_manager.execute_ibmcloud_command(
-            ibmcloud_plugin_list_command_args, capture_output=True
+            ibmcloud_plugin_list_command_args, capture_output=True, cache_ttl=IBMCLOUD_READ_ONLY_COMMAND_CACHE_TTL
         )
 
         ibmcloud_plugin_list_command_result_json = json.loads(ibmcloud_plugin_list_command_result.stdout)
@@ -571,6 +599,8 @@ class PlugInManager:
                 ibmcloud_plugin_install_command_args, capture_output=True
             )
 
+            binary_result_cache.invalidate(IBMCloudCLIPlugIn().get_dependency_alias())
+
             if ibmcloud_plugin_install_command_result.return_code != 0:
                 raise IBMCloudException(
                     f"An error occurred when attempting to install IBM Cloud CLI plug-in {plug_in_name}",
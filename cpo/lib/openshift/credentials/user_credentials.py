@@ -1,4 +1,4 @@
-#  Copyright 2021, 2024 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -17,12 +17,11 @@ import urllib.parse
 
 from typing import Final
 
-import requests
-
 from requests.models import Response
 
 from cpo.lib.openshift.credentials.credentials import AbstractCredentials
 from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.http_session import get_session
 from cpo.utils.network import ScopedInsecureRequestWarningDisabler
 
 
@@ -58,15 +57,16 @@ class UserCredentials(AbstractCredentials):
     def refresh_access_token(self):
         authorization_endpoint = self._get_authorization_endpoint()
         response: Response | None = None
+        session = get_session()
 
         with ScopedInsecureRequestWarningDisabler(self._insecure_skip_tls_verify):
-            response = requests.get(
+            response = session.get(
                 UserCredentials.OPENSHIFT_OAUTH_AUTHORIZATION_ENDPOINT.format(
                     authorization_endpoint=authorization_endpoint
                 ),
                 allow_redirects=False,
                 auth=(self._username, self._password),
-                verify=not self._insecure_skip_tls_verify,
+                verify=False if self._insecure_skip_tls_verify else session.verify,
             )
 
         if not response.ok:
@@ -95,11 +95,12 @@ class UserCredentials(AbstractCredentials):
         """
 
         response: Response | None = None
+        session = get_session()
 
         with ScopedInsecureRequestWarningDisabler(self._insecure_skip_tls_verify):
-            response = requests.get(
+            response = session.get(
                 f"{self._server}/.well-known/oauth-authorization-server",
-                verify=not self._insecure_skip_tls_verify,
+                verify=False if self._insecure_skip_tls_verify else session.verify,
             )
 
         if not response.ok:
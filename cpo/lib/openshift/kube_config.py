@@ -0,0 +1,240 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextlib
+import os
+import pathlib
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import yaml
+
+from filelock import FileLock
+
+from cpo.config import configuration_manager
+from cpo.lib.cluster.cluster import AbstractCluster
+from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.file import write_file_atomically
+
+
+@dataclass
+class KubeConfigNames:
+    """Names of the kubeconfig entries corresponding to a registered
+    OpenShift cluster"""
+
+    cluster: str
+    context: str
+    user: str
+
+
+class KubeConfig:
+    """Represents the parsed contents of a kubeconfig file
+
+    Methods modifying the kubeconfig file mirror the corresponding oc config
+    subcommands (set-credentials, set-cluster, set-context, and use-context),
+    i.e., existing entries are updated and missing entries are added.
+    """
+
+    def __init__(self, contents: dict[str, Any]):
+        self._contents = contents
+
+    def context_exists(self, context_name: str) -> bool:
+        return self._get_named_entry("contexts", context_name) is not None
+
+    def get_contents(self) -> dict[str, Any]:
+        return self._contents
+
+    def get_current_context(self) -> dict[str, Any] | None:
+        """Returns the details of the current context
+
+        Returns
+        -------
+        dict[str, Any] | None
+            details of the current context or None if the current context is
+            not set or does not exist
+        """
+
+        current_context_name = self._contents.get("current-context")
+
+        if not current_context_name:
+            return None
+
+        entry = self._get_named_entry("contexts", current_context_name)
+
+        return entry.get("context") if entry is not None else None
+
+    def set_cluster(self, name: str, server: str, insecure_skip_tls_verify: bool = False):
+        cluster = self._get_or_add_named_entry("clusters", name, "cluster")
+        cluster["server"] = server
+
+        if insecure_skip_tls_verify:
+            # like "oc config set-cluster --insecure-skip-tls-verify=true", as
+            # client-go rejects certificate authorities with the insecure flag
+            cluster["insecure-skip-tls-verify"] = True
+            cluster.pop("certificate-authority", None)
+            cluster.pop("certificate-authority-data", None)
+        else:
+            cluster.pop("insecure-skip-tls-verify", None)
+
+    def set_context(self, name: str, cluster: str, namespace: str, user: str):
+        context = self._get_or_add_named_entry("contexts", name, "context")
+        context["cluster"] = cluster
+        context["namespace"] = namespace
+        context["user"] = user
+
+    def set_credentials(self, name: str, token: str):
+        user = self._get_or_add_named_entry("users", name, "user")
+        user["token"] = token
+
+    def use_context(self, name: str):
+        if not self.context_exists(name):
+            raise CloudPakOperationsCLIException(f"Context '{name}' does not exist in kubeconfig file")
+
+        self._contents["current-context"] = name
+
+    def _get_named_entry(self, section: str, name: str) -> dict[str, Any] | None:
+        for entry in self._contents.get(section) or []:
+            if entry.get("name") == name:
+                return entry
+
+        return None
+
+    def _get_or_add_named_entry(self, section: str, name: str, key: str) -> dict[str, Any]:
+        entry = self._get_named_entry(section, name)
+
+        if entry is None:
+            entry = {"name": name}
+
+            if self._contents.get(section) is None:
+                self._contents[section] = []
+
+            self._contents[section].append(entry)
+
+        if entry.get(key) is None:
+            entry[key] = {}
+
+        return entry[key]
+
+
+@contextlib.contextmanager
+def edit_kube_config(kube_config_file_path: pathlib.Path | None = None) -> Iterator[KubeConfig]:
+    """Reads the kubeconfig file, yields its parsed contents for modification,
+    and writes the modified contents back to the kubeconfig file
+
+    The kubeconfig file is read once and written atomically once while
+    holding a file lock (~/.cpo/kubeconfig.lock). If an exception is raised within the context, the
+    kubeconfig file is not modified.
+
+    Parameters
+    ----------
+    kube_config_file_path
+        path of the kubeconfig file (default: path returned by
+        get_kube_config_file_path())
+
+    Yields
+    ------
+    KubeConfig
+        parsed contents of the kubeconfig file
+    """
+
+    if kube_config_file_path is None:
+        kube_config_file_path = get_kube_config_file_path()
+
+    # if the kubeconfig file is a symbolic link, its target is replaced
+    kube_config_file_path = kube_config_file_path.resolve()
+    kube_config_file_path.parent.mkdir(exist_ok=True, parents=True)
+
+    cli_data_directory_path = configuration_manager.get_cli_data_directory_path()
+    cli_data_directory_path.mkdir(exist_ok=True, parents=True)
+
+    # <kubeconfig>.lock must not be used as client-go (oc) creates it
+    # exclusively and fails if it exists
+    with FileLock(cli_data_directory_path / "kubeconfig.lock"):
+        contents: dict[str, Any] | None = None
+
+        if kube_config_file_path.exists():
+            contents = yaml.safe_load(kube_config_file_path.read_text())
+
+        if contents is None:
+            contents = {
+                "apiVersion": "v1",
+                "clusters": [],
+                "contexts": [],
+                "current-context": "",
+                "kind": "Config",
+                "preferences": {},
+                "users": [],
+            }
+
+        kube_config = KubeConfig(contents)
+
+        yield kube_config
+
+        write_file_atomically(
+            kube_config_file_path,
+            yaml.safe_dump(kube_config.get_contents(), default_flow_style=False),
+            None if kube_config_file_path.exists() else 0o600,
+        )
+
+
+def get_kube_config_file_path() -> pathlib.Path:
+    """Returns the path of the kubeconfig file
+
+    Returns
+    -------
+    pathlib.Path
+        path of the first file listed in the KUBECONFIG environment variable or
+        ~/.kube/config if the environment variable is not set
+    """
+
+    kube_config_environment_variable = os.environ.get("KUBECONFIG")
+
+    if kube_config_environment_variable:
+        return pathlib.Path(kube_config_environment_variable.split(os.pathsep)[0]).expanduser()
+
+    return configuration_manager.get_home_directory_path() / ".kube" / "config"
+
+
+def get_kube_config_names(cluster: AbstractCluster) -> KubeConfigNames:
+    """Returns the names of the kubeconfig entries corresponding to the given
+    registered OpenShift cluster
+
+    The names match the names chosen by oc login.
+
+    Parameters
+    ----------
+    cluster
+        registered OpenShift cluster
+
+    Returns
+    -------
+    KubeConfigNames
+        names of the kubeconfig entries corresponding to the given registered
+        OpenShift cluster
+    """
+
+    username = cluster.get_username()
+
+    if username == "kubeadmin":
+        username = "kube:admin"
+
+    kube_config_cluster = cluster.get_server().removeprefix("https://").replace(".", "-")
+
+    return KubeConfigNames(
+        cluster=kube_config_cluster,
+        context=f"default/{kube_config_cluster}/{username}",
+        user=f"{username}/{kube_config_cluster}",
+    )
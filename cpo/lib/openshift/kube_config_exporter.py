@@ -0,0 +1,114 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import concurrent.futures
+import logging
+import pathlib
+
+from dataclasses import dataclass, field
+
+from tqdm import tqdm
+
+from cpo.lib.cluster.cluster import AbstractCluster
+from cpo.lib.openshift.credentials.cluster_based_user_credentials import ClusterBasedUserCredentials
+from cpo.lib.openshift.kube_config import edit_kube_config, get_kube_config_names
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class KubeConfigExportResult:
+    exported_servers: list[str] = field(default_factory=list)
+    failed_servers: dict[str, Exception] = field(default_factory=dict)
+
+
+class KubeConfigExporter:
+    """Exports registered OpenShift clusters to a kubeconfig file
+
+    OAuth access tokens are refreshed (and stored in clusters.json) in
+    parallel. Afterwards, the entries of all clusters are merged into the
+    kubeconfig file, which is read and written once.
+    """
+
+    def __init__(self, clusters: list[AbstractCluster], max_parallel: int = 8):
+        self._clusters = clusters
+        self._max_parallel = max_parallel
+
+    def export_kube_config(
+        self, kube_config_file_path: pathlib.Path | None = None, current_server: str | None = None
+    ) -> KubeConfigExportResult:
+        """Exports registered OpenShift clusters to a kubeconfig file
+
+        Parameters
+        ----------
+        kube_config_file_path
+            path of the kubeconfig file (default: ~/.kube/config)
+        current_server
+            server URL of the cluster whose context shall become the current
+            context
+
+        Returns
+        -------
+        KubeConfigExportResult
+            servers of exported clusters and servers of clusters whose OAuth
+            access token could not be refreshed
+        """
+
+        result = KubeConfigExportResult()
+        tokens: dict[str, str] = {}
+
+        with (
+            concurrent.futures.ThreadPoolExecutor(max_workers=self._max_parallel) as executor,
+            tqdm(total=len(self._clusters), unit="cluster") as progress_bar,
+        ):
+            futures = {executor.submit(self._get_access_token, cluster): cluster for cluster in self._clusters}
+
+            for future in concurrent.futures.as_completed(futures):
+                cluster = futures[future]
+
+                try:
+                    tokens[cluster.get_server()] = future.result()
+                except Exception as exception:
+                    logger.debug(f"Failed to obtain OAuth access token for {cluster.get_server()}", exc_info=True)
+                    result.failed_servers[cluster.get_server()] = exception
+
+                progress_bar.update()
+
+        if len(tokens) == 0:
+            return result
+
+        with edit_kube_config(kube_config_file_path) as kube_config:
+            for cluster in self._clusters:
+                server = cluster.get_server()
+
+                if server not in tokens:
+                    continue
+
+                names = get_kube_config_names(cluster)
+
+                kube_config.set_credentials(names.user, tokens[server])
+                kube_config.set_cluster(names.cluster, server, insecure_skip_tls_verify=True)
+                kube_config.set_context(names.context, names.cluster, "default", names.user)
+                result.exported_servers.append(server)
+
+                if (server == current_server) or (kube_config.get_current_context() is None):
+                    kube_config.use_context(names.context)
+
+        return result
+
+    def _get_access_token(self, cluster: AbstractCluster) -> str:
+        # the refreshed OAuth access token is stored in clusters.json (updates
+        # of worker threads are serialized by the file lock of
+        # ClusterCredentialsManager)
+        return ClusterBasedUserCredentials(cluster).get_access_token(force_refresh_if_possible=True)
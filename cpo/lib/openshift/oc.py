@@ -1,4 +1,4 @@
-#  Copyright 2021, 2025 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -14,26 +14,123 @@
 
 import json
 import tempfile
+import threading
 
-from typing import Final
+from typing import Any, Final
 
 import semver
 
-from kubernetes.config.config_exception import ConfigException
-from kubernetes.config.kube_config import list_kube_config_contexts
-from pydantic import TypeAdapter
+from kubernetes import client, config
 
 import cpo.lib.openshift.credentials.cluster_based_user_credentials
 import cpo.utils.process
 
+from cpo.config import configuration_manager
 from cpo.lib.cluster.cluster import AbstractCluster
-from cpo.lib.cluster.types.context import Context
 from cpo.lib.dependency_manager.dependency_manager import DependencyManager
 from cpo.lib.dependency_manager.plugins.openshift.openshift_cli_plugin import OpenShiftCLIPlugIn
+from cpo.lib.openshift.kube_config import edit_kube_config, get_kube_config_file_path, get_kube_config_names
+from cpo.lib.openshift.openshift_api_manager import RESPONSE_COMPRESSION_CONFIG_KEY
 from cpo.lib.openshift.types.get_pod_entry import GetPodEntry
 from cpo.utils.error import CloudPakOperationsCLIException
 
 OPENSHIFT_REST_API_VERSION: Final[str] = "v1"
+OPENSHIFT_VERSION_CACHE_TTL: Final[float] = 300.0
+
+
+class KubeConfigAPIClientCache:
+    """Caches an API client and the namespace of the current context in
+    ~/.kube/config
+
+    The API client is reused by subsequent calls to benefit from connection
+    pooling. The API client and the namespace are replaced (and the previous
+    API client is closed) if the kubeconfig file was modified (e.g., by oc
+    login or cpo cluster export-kubeconfig), i.e., the kubeconfig file is only
+    parsed again in this case.
+    """
+
+    def __init__(self):
+        self._api_client: client.ApiClient | None = None
+        self._kube_config_file_identity: tuple[str, int, int, int] | None = None
+        self._lock = threading.Lock()
+        self._namespace: str | None = None
+
+    def clear(self):
+        """Closes and removes the cached API client and namespace"""
+
+        with self._lock:
+            self._clear()
+
+    def get_api_client(self) -> client.ApiClient:
+        """Returns an API client based on the current context in
+        ~/.kube/config
+
+        Returns
+        -------
+        client.ApiClient
+            API client based on the current context in ~/.kube/config
+        """
+
+        with self._lock:
+            self._clear_if_kube_config_file_was_modified()
+
+            if self._api_client is None:
+                api_client = config.new_client_from_config()
+
+                if configuration_manager.get_config_value(RESPONSE_COMPRESSION_CONFIG_KEY, bool, True):
+                    api_client.set_default_header("Accept-Encoding", "gzip")
+
+                self._api_client = api_client
+
+            return self._api_client
+
+    def get_namespace(self) -> str:
+        """Returns the namespace of the current context in ~/.kube/config
+
+        Returns
+        -------
+        str
+            namespace of the current context in ~/.kube/config or "default" if
+            the current context does not specify a namespace
+        """
+
+        with self._lock:
+            self._clear_if_kube_config_file_was_modified()
+
+            if self._namespace is None:
+                current_context = config.list_kube_config_contexts()[1]
+
+                self._namespace = current_context["context"].get("namespace", "default")
+
+            return self._namespace
+
+    def _clear(self):
+        if self._api_client is not None:
+            self._api_client.close()
+
+        self._api_client = None
+        self._kube_config_file_identity = None
+        self._namespace = None
+
+    def _clear_if_kube_config_file_was_modified(self):
+        kube_config_file_identity = self._get_kube_config_file_identity()
+
+        if self._kube_config_file_identity != kube_config_file_identity:
+            self._clear()
+            self._kube_config_file_identity = kube_config_file_identity
+
+    def _get_kube_config_file_identity(self) -> tuple[str, int, int, int] | None:
+        kube_config_file_path = get_kube_config_file_path()
+
+        try:
+            stat_result = kube_config_file_path.stat()
+        except FileNotFoundError:
+            return None
+
+        return (str(kube_config_file_path), stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+kube_config_api_client_cache = KubeConfigAPIClientCache()
 
 
 def enable_image_registry_default_route():
@@ -60,6 +157,8 @@ def execute_oc_command(
     capture_output=False,
     check=True,
     print_captured_output=False,
+    capture_raw_stdout=False,
+    cache_ttl: float | None = None,
 ) -> cpo.utils.process.ProcessResult:
     """Executes the OpenShift Container Platform CLI
 
@@ -77,6 +176,12 @@ def execute_oc_command(
     print_captured_output
         flag indicating whether captured process output shall also be written to
         stdout/stderr
+    capture_raw_stdout
+        flag indicating whether output to stdout shall be captured as raw bytes
+        (see ProcessResult.stdout_bytes)
+    cache_ttl
+        number of seconds for which the result of a successful read-only
+        invocation is cached (default: results are not cached)
 
     Returns
     -------
@@ -92,6 +197,46 @@ def execute_oc_command(
         capture_output=capture_output,
         check=check,
         print_captured_output=print_captured_output,
+        capture_raw_stdout=capture_raw_stdout,
+        cache_ttl=cache_ttl,
+    )
+
+
+def execute_oc_commands(
+    list_of_args: list[list[str]], check=True, print_captured_output=False, max_parallel: int = 4
+) -> list[cpo.utils.process.ProcessResult]:
+    """Executes the OpenShift Container Platform CLI concurrently with
+    different arguments
+
+    Parameters
+    ----------
+    list_of_args
+        list of arguments to be passed to the OpenShift Container Platform CLI
+        per invocation
+    check
+        flag indicating whether an exception shall be thrown if the OpenShift
+        Container Platform CLI returns with a nonzero return code
+    print_captured_output
+        flag indicating whether captured process output shall also be written to
+        stdout/stderr (each line is prefixed with the index of the corresponding
+        arguments)
+    max_parallel
+        maximum number of processes executed in parallel
+
+    Returns
+    -------
+    list[ProcessResult]
+        objects storing the return code and captured process output in the
+        order of the given arguments
+    """
+
+    return DependencyManager.get_instance().execute_binary_concurrently(
+        OpenShiftCLIPlugIn,
+        None,
+        list_of_args,
+        check=check,
+        print_captured_output=print_captured_output,
+        max_parallel=max_parallel,
     )
 
 
@@ -182,7 +327,12 @@ def get_image_registry_hostname(route_name: str = "default-route") -> str:
 
 def get_openshift_version() -> semver.Version:
     oc_version_command_result = json.loads(
-        execute_oc_command(["version", "--output", "json"], capture_output=True).stdout
+        execute_oc_command(
+            ["version", "--output", "json"],
+            capture_output=True,
+            capture_raw_stdout=True,
+            cache_ttl=OPENSHIFT_VERSION_CACHE_TTL,
+        ).stdout_bytes
     )
 
     return semver.Version.parse(oc_version_command_result["openshiftVersion"])
@@ -200,7 +350,8 @@ def get_persistent_volume_name(namespace: str, persistent_volume_claim_name: str
                 "json",
             ],
             capture_output=True,
-        ).stdout
+            capture_raw_stdout=True,
+        ).stdout_bytes
     )
 
     if len(oc_get_pvc_command_result["items"]) == 0:
@@ -243,6 +394,7 @@ def log_in_to_openshift_cluster_with_password(server: str, username: str, passwo
     oc_login_args = get_oc_login_args_with_password(server, username, password)
 
     execute_oc_command(oc_login_args)
+    kube_config_api_client_cache.clear()
 
 
 def log_in_to_openshift_cluster_with_token(server: str, token: str):
@@ -252,17 +404,41 @@ def log_in_to_openshift_cluster_with_token(server: str, token: str):
     oc_login_args = get_oc_login_args_with_token(server, token)
 
     execute_oc_command(oc_login_args)
+    kube_config_api_client_cache.clear()
+
 
+def get_deployment_name(
+    search_string: str, label_selector: str | None = None, namespace: str | None = None
+) -> list[str]:
+    """Returns the available OpenShift deployment(s) for a given search string
+
+    Deployments are retrieved using a single OpenShift API request based on
+    the current context in ~/.kube/config.
+
+    Parameters
+    ----------
+    search_string
+        string to be contained in deployment names
+    label_selector
+        label selector restricting the deployments to be searched
+    namespace
+        namespace to be searched (default: namespace of the current context)
 
-def get_deployment_name(search_string: str) -> list[str]:
-    """Returns the available OpenShift deployment(s) for a given search string"""
+    Returns
+    -------
+    list[str]
+        names of deployments containing the given search string
+    """
 
-    oc_get_deployments_result = execute_oc_command(["get", "deployments"], capture_output=True).stdout
-    result = []
+    apps_v1_api = client.AppsV1Api(kube_config_api_client_cache.get_api_client())
+    deployment_list: Any = apps_v1_api.list_namespaced_deployment(
+        namespace if namespace is not None else kube_config_api_client_cache.get_namespace(),
+        label_selector=label_selector,
+    )
 
-    for line in oc_get_deployments_result.splitlines():
-        if search_string in line:
-            result.append(line.split()[0].strip())
+    result = [
+        deployment.metadata.name for deployment in deployment_list.items if search_string in deployment.metadata.name
+    ]
 
     if not result:
         raise CloudPakOperationsCLIException(
@@ -272,15 +448,40 @@ def get_deployment_name(search_string: str) -> list[str]:
     return result
 
 
-def get_pod_name(search_string: str) -> list[str]:
-    """Returns the available OpenShift pod(s) for a given search string"""
+def get_pod_name(
+    search_string: str,
+    field_selector: str | None = None,
+    label_selector: str | None = None,
+    namespace: str | None = None,
+) -> list[str]:
+    """Returns the available OpenShift pod(s) for a given search string
 
-    oc_get_pods_result = execute_oc_command(["get", "pods"], capture_output=True).stdout
-    result = []
+    Pods are retrieved using a single OpenShift API request based on the
+    current context in ~/.kube/config.
 
-    for line in oc_get_pods_result.splitlines():
-        if search_string in line:
-            result.append(line.split()[0].strip())
+    Parameters
+    ----------
+    search_string
+        string to be contained in pod names
+    field_selector
+        field selector restricting the pods to be searched (e.g.,
+        "status.phase=Running")
+    label_selector
+        label selector restricting the pods to be searched
+    namespace
+        namespace to be searched (default: namespace of the current context)
+
+    Returns
+    -------
+    list[str]
+        names of pods containing the given search string
+    """
+
+    result = [
+        pod.metadata.name
+        for pod in _get_pods(namespace, field_selector, label_selector)
+        if search_string in pod.metadata.name
+    ]
 
     if not result:
         raise CloudPakOperationsCLIException(f"Pod(s) containing the string '{search_string}' could not be found")
@@ -288,16 +489,28 @@ def get_pod_name(search_string: str) -> list[str]:
     return result
 
 
-def get_pod_status(pod_name: str) -> GetPodEntry:
-    """Returns the current pod status for a given pod name"""
+def get_pod_status(pod_name: str, namespace: str | None = None) -> GetPodEntry:
+    """Returns the current pod status for a given pod name
+
+    Parameters
+    ----------
+    pod_name
+        pod name or string contained in the pod name (the status of the first
+        matching pod is returned)
+    namespace
+        namespace containing the pod (default: namespace of the current context)
 
-    oc_get_pods_result = execute_oc_command(["get", "pods"], capture_output=True).stdout
+    Returns
+    -------
+    GetPodEntry
+        current pod status
+    """
 
-    for line in oc_get_pods_result.splitlines():
-        if pod_name in line:
-            break
+    for pod in _get_pods(namespace, None, None):
+        if pod_name in pod.metadata.name:
+            return GetPodEntry.from_pod(pod)
 
-    return GetPodEntry.parse(line)
+    raise CloudPakOperationsCLIException(f"Pod '{pod_name}' could not be found")
 
 
 def get_custom_resource(custom_resource_kind: str, custom_resource_id: str) -> dict:
@@ -305,8 +518,10 @@ def get_custom_resource(custom_resource_kind: str, custom_resource_id: str) -> d
 
     oc_get_custom_resource_result = json.loads(
         execute_oc_command(
-            ["get", custom_resource_kind, custom_resource_id, "--output", "json"], capture_output=True
-        ).stdout
+            ["get", custom_resource_kind, custom_resource_id, "--output", "json"],
+            capture_output=True,
+            capture_raw_stdout=True,
+        ).stdout_bytes
     )
     return oc_get_custom_resource_result
 
@@ -317,36 +532,20 @@ def login(current_cluster: AbstractCluster):
     )
     credentials.refresh_access_token()
 
-    username = current_cluster.get_username()
-
-    if username == "kubeadmin":
-        username = "kube:admin"
-
-    kube_config_cluster = current_cluster.get_server().removeprefix("https://").replace(".", "-")
-    kube_config_username = f"{username}/{kube_config_cluster}"
-    default_project_context = f"default/{kube_config_cluster}/{username}"
-
-    execute_oc_command(
-        ["config", "set-credentials", kube_config_username, "--token", credentials.get_access_token()],
-        capture_output=True,
-    )
+    names = get_kube_config_names(current_cluster)
 
-    try:
-        kube_config_contexts = TypeAdapter(tuple[list[Context], Context]).validate_python(list_kube_config_contexts())
-        current_context = kube_config_contexts[1]
+    with edit_kube_config() as kube_config:
+        kube_config.set_credentials(names.user, credentials.get_access_token())
+        current_context = kube_config.get_current_context()
 
-        if current_context.context.cluster != kube_config_cluster:
-            contexts = kube_config_contexts[0]
+        if (current_context is None) or (current_context.get("cluster") != names.cluster):
+            if (current_context is None) or not kube_config.context_exists(names.context):
+                kube_config.set_cluster(names.cluster, current_cluster.get_server(), insecure_skip_tls_verify=True)
 
-            if not _context_exists(contexts, default_project_context):
-                set_cluster(kube_config_cluster, current_cluster)
+            kube_config.set_context(names.context, names.cluster, "default", names.user)
+            kube_config.use_context(names.context)
 
-            set_context(kube_config_cluster, kube_config_username, default_project_context)
-            use_context(kube_config_cluster, username)
-    except ConfigException:
-        set_cluster(kube_config_cluster, current_cluster)
-        set_context(kube_config_cluster, kube_config_username, default_project_context)
-        use_context(kube_config_cluster, username)
+    kube_config_api_client_cache.clear()
 
 
 def replace_custom_resource(custom_resource_json: dict):
@@ -359,48 +558,12 @@ def replace_custom_resource(custom_resource_json: dict):
         execute_oc_command(oc_set_custom_resource_args)
 
 
-def set_cluster(kube_config_cluster: str, current_cluster: AbstractCluster):
-    execute_oc_command(
-        [
-            "config",
-            "set-cluster",
-            kube_config_cluster,
-            "--insecure-skip-tls-verify=true",
-            "--server",
-            current_cluster.get_server(),
-        ],
-        capture_output=True,
-    )
-
-
-def set_context(kube_config_cluster: str, kube_config_username: str, default_project_context):
-    execute_oc_command(
-        [
-            "config",
-            "set-context",
-            default_project_context,
-            "--cluster",
-            kube_config_cluster,
-            "--namespace",
-            "default",
-            "--user",
-            kube_config_username,
-        ],
-        capture_output=True,
+def _get_pods(namespace: str | None, field_selector: str | None, label_selector: str | None) -> list[Any]:
+    core_v1_api = client.CoreV1Api(kube_config_api_client_cache.get_api_client())
+    pod_list: Any = core_v1_api.list_namespaced_pod(
+        namespace if namespace is not None else kube_config_api_client_cache.get_namespace(),
+        field_selector=field_selector,
+        label_selector=label_selector,
     )
 
-
-def use_context(kube_config_cluster: str, username: str):
-    execute_oc_command(["config", "use-context", f"default/{kube_config_cluster}/{username}"], capture_output=True)
-
-
-def _context_exists(contexts: list[Context], context_name: str) -> bool:
-    result = False
-
-    for context in contexts:
-        if context.name == context_name:
-            result = True
-
-            break
-
-    return result
+    return pod_list.items
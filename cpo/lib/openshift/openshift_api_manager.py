@@ -1,4 +1,4 @@
-#  Copyright 2021, 2024 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -12,9 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
 import logging
+import threading
 
-from typing import Any, Callable
+from typing import Any, Callable, Final
 
 import semver
 import urllib3.exceptions
@@ -23,6 +25,7 @@ from kubernetes import client, config, watch
 
 import cpo.lib.jmespath
 
+from cpo.config import configuration_manager
 from cpo.lib.openshift.credentials.credentials import AbstractCredentials
 from cpo.lib.openshift.data.global_pull_secret_data import GlobalPullSecretData
 from cpo.lib.openshift.types.catalog_source import CatalogSource
@@ -41,6 +44,14 @@ from cpo.utils.network import ScopedInsecureRequestWarningDisabler
 
 logger = logging.getLogger(__name__)
 
+RESPONSE_COMPRESSION_CONFIG_KEY: Final[str] = "openshift_api_response_compression"
+
+# requests lists containing object metadata only (plain JSON if the server
+# does not support metadata-only responses)
+PARTIAL_OBJECT_METADATA_LIST_ACCEPT_HEADER: Final[str] = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+)
+
 
 class OpenShiftAPIManager:
     """Manages REST communication with the OpenShift REST API
@@ -53,9 +64,13 @@ class OpenShiftAPIManager:
     """
 
     def __init__(self, credentials: AbstractCredentials):
+        self._api_client: client.ApiClient | None = None
         self._credentials = credentials
         self._kube_config_dict: dict[str, Any] = {}
+        self._kube_config_generation = 0
         self._kube_config_initialized = False
+        self._kube_config_lock = threading.RLock()
+        self._watch_api_client: client.ApiClient | None = None
 
     def cluster_role_exists(self, name: str) -> bool:
         """Returns whether the cluster role with the given name exists
@@ -429,6 +444,31 @@ class OpenShiftAPIManager:
 
         self.execute_kubernetes_client(self._delete_operator, name=name)
 
+    def delete_pods(self, project: str, field_selector: str, dry_run: bool = False) -> int:
+        """Deletes all pods in the given project matching the given field
+        selector using a single request
+
+        Parameters
+        ----------
+        project
+            project in which pods shall be deleted
+        field_selector
+            field selector restricting the pods to be deleted (e.g.,
+            "status.phase=Failed")
+        dry_run
+            flag indicating whether the deletion shall only be simulated by the
+            OpenShift API server
+
+        Returns
+        -------
+        int
+            number of deleted pods (or pods that would have been deleted)
+        """
+
+        return self.execute_kubernetes_client(
+            self._delete_pods, dry_run=dry_run, field_selector=field_selector, project=project
+        )
+
     def delete_project(self, name: str):
         """Deletes an OpenShift project
 
@@ -476,8 +516,7 @@ class OpenShiftAPIManager:
         )
 
     def get_kube_config(self) -> dict[str, Any]:
-        if not self._kube_config_initialized:
-            self._set_kube_config()
+        self._set_kube_config_if_required()
 
         return self._kube_config_dict
 
@@ -523,9 +562,7 @@ class OpenShiftAPIManager:
             method result
         """
 
-        if not self._kube_config_initialized:
-            self._set_kube_config()
-
+        kube_config_generation = self._set_kube_config_if_required()
         result: Any = None
 
         with ScopedInsecureRequestWarningDisabler(self._credentials.insecure_skip_tls_verify):
@@ -533,11 +570,7 @@ class OpenShiftAPIManager:
                 result = method(**kwargs)
             except client.ApiException as exception:
                 if exception.status == 401:
-                    if not self._credentials.is_refreshable():
-                        raise CloudPakOperationsCLIException("OAuth access token expired and cannot be refreshed")
-
-                    self._credentials.refresh_access_token()
-                    self._set_kube_config()
+                    self._refresh_kube_config(kube_config_generation)
                     result = method(**kwargs)
                 else:
                     raise exception
@@ -633,6 +666,17 @@ class OpenShiftAPIManager:
 
         return self.execute_kubernetes_client(self._get_kubernetes_version)
 
+    def get_projects(self) -> list[str]:
+        """Returns the names of all OpenShift projects
+
+        Returns
+        -------
+        list[str]
+            names of all OpenShift projects
+        """
+
+        return self.execute_kubernetes_client(self._get_projects)
+
     def get_subscription(self, project: str, name: str) -> Any:
         """Returns OpenShift subscription with the given name in the given
         project
@@ -718,8 +762,9 @@ class OpenShiftAPIManager:
         if not self._credentials.is_refreshable():
             raise CloudPakOperationsCLIException("OAuth access token expired and cannot be refreshed")
 
-        self._credentials.refresh_access_token()
-        self._kube_config_initialized = False
+        with self._kube_config_lock:
+            self._credentials.refresh_access_token()
+            self._kube_config_initialized = False
 
     def role_binding_exists(self, project: str, name: str) -> bool:
         """Returns whether the role binding with the given name exists in the
@@ -921,8 +966,18 @@ class OpenShiftAPIManager:
             **kwargs,
         )
 
+    def _close_api_clients(self):
+        """Closes API clients created for the previous Kubernetes configuration"""
+
+        for api_client in [self._api_client, self._watch_api_client]:
+            if api_client is not None:
+                api_client.close()
+
+        self._api_client = None
+        self._watch_api_client = None
+
     def _create_catalog_source(self, project: str, catalog_source: CatalogSource):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_namespaced_custom_object(
             "operators.coreos.com", "v1alpha1", project, "catalogsources", catalog_source
         )
@@ -935,7 +990,7 @@ class OpenShiftAPIManager:
             "rules": rules,
         }
 
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_cluster_custom_object("rbac.authorization.k8s.io", "v1", "clusterroles", cluster_role)
 
     def _create_cluster_role_binding(self, metadata: ObjectMeta, subjects: list[ObjectMeta], role_ref_name: str):
@@ -960,13 +1015,13 @@ class OpenShiftAPIManager:
                 }
             )
 
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_cluster_custom_object(
             "rbac.authorization.k8s.io", "v1", "clusterrolebindings", cluster_role_binding
         )
 
     def _create_deployment(self, project: str, deployment: Any):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_namespaced_custom_object("apps", "v1", project, "deployments", deployment)
 
     def _create_namespaced_custom_resource(self, project: str, custom_resource: CustomResource):
@@ -982,7 +1037,7 @@ class OpenShiftAPIManager:
 
         plural = custom_resource.kind.lower() + ("s" if not custom_resource.kind.lower().endswith("s") else "")
 
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_namespaced_custom_object(
             custom_resource.group,
             custom_resource.version,
@@ -1006,7 +1061,7 @@ class OpenShiftAPIManager:
             },
         }
 
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_namespaced_custom_object(
             "operators.coreos.com",
             "v1alpha2",
@@ -1016,7 +1071,7 @@ class OpenShiftAPIManager:
         )
 
     def _create_project(self, name: str):
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(self._api_client)
         core_v1_api.create_namespace(
             {
                 "apiVersion": "v1",
@@ -1038,7 +1093,7 @@ class OpenShiftAPIManager:
             "rules": rules,
         }
 
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_namespaced_custom_object("rbac.authorization.k8s.io", "v1", project, "roles", role)
 
     def _create_role_binding(self, project: str, name: str, subjects: list[ObjectMeta], role_ref_name: str):
@@ -1066,7 +1121,7 @@ class OpenShiftAPIManager:
                 }
             )
 
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_namespaced_custom_object(
             "rbac.authorization.k8s.io", "v1", project, "rolebindings", role_binding
         )
@@ -1081,7 +1136,7 @@ class OpenShiftAPIManager:
             },
         }
 
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(self._api_client)
         core_v1_api.create_namespaced_service_account(project, service_account)
 
     def _create_storage_class(self, name: str, provisioner: str, parameters: dict[str, str]):
@@ -1096,17 +1151,17 @@ class OpenShiftAPIManager:
 
         storage_class["parameters"] = parameters
 
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_cluster_custom_object("storage.k8s.io", "v1", "storageclasses", storage_class)
 
     def _create_subscription(self, project: str, subscription: Subscription):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.create_namespaced_custom_object(
             "operators.coreos.com", "v1alpha1", project, "subscriptions", subscription
         )
 
     def _custom_object_exists(self, name: str, kind_metadata: KindMetadata) -> bool:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         result = True
 
         try:
@@ -1122,56 +1177,77 @@ class OpenShiftAPIManager:
         return result
 
     def _delete_catalog_source(self, project: str, name: str):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.delete_namespaced_custom_object(
             "operators.coreos.com", "v1alpha1", project, "catalogsources", name
         )
 
     def _delete_cluster_service_version(self, project: str, name: str):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.delete_namespaced_custom_object(
             "operators.coreos.com", "v1alpha1", project, "clusterserviceversions", name
         )
 
     def _delete_custom_resource(self, project: str, kind_metadata: KindMetadata, name: str):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.delete_namespaced_custom_object(
             kind_metadata.group, kind_metadata.version, project, kind_metadata.plural, name
         )
 
     def _delete_custom_resource_definition(self, name: str):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.delete_cluster_custom_object("apiextensions.k8s.io", "v1", "customresourcedefinitions", name)
 
     def _delete_operator(self, name: str):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.delete_cluster_custom_object("operators.coreos.com", "v1", "operators", name)
 
+    def _delete_pods(self, project: str, field_selector: str, dry_run: bool) -> int:
+        core_v1_api = client.CoreV1Api(self._api_client)
+
+        # the response contains the list of deleted pods, which is not part of
+        # the V1Status object returned by the Kubernetes Python client
+        #
+        # The Kubernetes API does not provide an option to omit deleted
+        # objects from deletecollection responses. To limit the memory
+        # required to count them, the response only contains the metadata of
+        # deleted pods instead of their specification and status. Still, the
+        # memory required grows linearly with the number of deleted pods.
+        response = core_v1_api.delete_collection_namespaced_pod(
+            project,
+            _headers={"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT_HEADER},
+            _preload_content=False,
+            dry_run="All" if dry_run else None,
+            field_selector=field_selector,
+        )
+
+        return len(json.loads(response.data).get("items") or [])
+
     def _delete_project(self, name: str):
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(self._api_client)
         core_v1_api.delete_namespace(name)
 
     def _delete_subscription(self, project: str, name: str):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api.delete_namespaced_custom_object(
             "operators.coreos.com", "v1alpha1", project, "subscriptions", name
         )
 
     def _get_catalog_sources(self, project: str) -> Any:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
 
         return custom_objects_api.list_namespaced_custom_object(
             "operators.coreos.com", "v1alpha1", project, "catalogsources"
         )
 
     def _get_credentials(self) -> GlobalPullSecretData:
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(self._api_client)
         core_v1_api_result: Any = core_v1_api.read_namespaced_secret("pull-secret", "openshift-config")
 
         return GlobalPullSecretData(core_v1_api_result.data)
 
     def _get_custom_resources(self, kind_metadata: KindMetadata) -> list[Any]:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api_result: Any = custom_objects_api.list_cluster_custom_object(
             kind_metadata.group, kind_metadata.version, kind_metadata.plural
         )
@@ -1182,7 +1258,7 @@ class OpenShiftAPIManager:
         return custom_objects_api_result["items"]
 
     def _get_kubernetes_version(self) -> semver.Version:
-        version_api = client.VersionApi()
+        version_api = client.VersionApi(self._api_client)
         version_info = version_api.get_code()
 
         assert isinstance(version_info, client.VersionInfo)
@@ -1192,7 +1268,7 @@ class OpenShiftAPIManager:
         return semver.Version(int(version_info.major), int(version_info.minor))
 
     def _get_namespaced_custom_resource_if_exists(self, project: str, name: str, kind_metadata: KindMetadata) -> Any:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_resource: Any | None = None
 
         try:
@@ -1206,19 +1282,25 @@ class OpenShiftAPIManager:
         return custom_resource
 
     def _get_custom_resource_definitions(self) -> Any:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
 
         return custom_objects_api.list_cluster_custom_object("apiextensions.k8s.io", "v1", "customresourcedefinitions")
 
+    def _get_projects(self) -> list[str]:
+        core_v1_api = client.CoreV1Api(self._api_client)
+        namespace_list: Any = core_v1_api.list_namespace()
+
+        return [namespace.metadata.name for namespace in namespace_list.items]
+
     def _get_subscription(self, project: str, name: str) -> Any:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
 
         return custom_objects_api.get_namespaced_custom_object(
             "operators.coreos.com", "v1alpha1", project, "subscriptions", name
         )
 
     def _get_version(self) -> semver.Version:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         custom_objects_api_result = custom_objects_api.get_cluster_custom_object(
             "config.openshift.io", "v1", "clusteroperators", "openshift-apiserver"
         )
@@ -1264,7 +1346,7 @@ class OpenShiftAPIManager:
         log_callback("OpenShift API server closed connection")
 
     def _namespaced_custom_object_exists(self, project: str, name: str, kind_metadata: KindMetadata) -> bool:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._api_client)
         result = True
 
         try:
@@ -1280,11 +1362,11 @@ class OpenShiftAPIManager:
         return result
 
     def _patch_credentials(self, global_pull_secret_data: GlobalPullSecretData):
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(self._api_client)
         core_v1_api.patch_namespaced_secret("pull-secret", "openshift-config", global_pull_secret_data.get_json_patch())
 
     def _project_exists(self, name: str) -> bool:
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(self._api_client)
         result = True
 
         try:
@@ -1298,7 +1380,7 @@ class OpenShiftAPIManager:
         return result
 
     def _service_account_exists(self, project: str, name: str) -> bool:
-        core_v1_api = client.CoreV1Api()
+        core_v1_api = client.CoreV1Api(self._api_client)
         result = True
 
         try:
@@ -1311,6 +1393,33 @@ class OpenShiftAPIManager:
 
         return result
 
+    def _refresh_kube_config(self, kube_config_generation: int):
+        """Refreshes the OAuth access token and the Kubernetes configuration
+        after a request was rejected with HTTP status code 401
+
+        If the method is called concurrently (e.g., by worker threads sharing
+        this object), the OAuth access token is only refreshed and API clients
+        are only recreated once, i.e., API clients used by other threads are
+        not closed repeatedly.
+
+        Parameters
+        ----------
+        kube_config_generation
+            generation of the Kubernetes configuration used by the rejected
+            request
+        """
+
+        with self._kube_config_lock:
+            if self._kube_config_generation != kube_config_generation:
+                # another thread already refreshed the Kubernetes configuration
+                return
+
+            if not self._credentials.is_refreshable():
+                raise CloudPakOperationsCLIException("OAuth access token expired and cannot be refreshed")
+
+            self._credentials.refresh_access_token()
+            self._set_kube_config()
+
     def _set_kube_config(self):
         """Sets the Kubernetes configuration of the Kubernetes Python client"""
 
@@ -1344,10 +1453,41 @@ class OpenShiftAPIManager:
             ],
         }
 
-        config.load_kube_config_from_dict(self._kube_config_dict)
+        configuration = client.Configuration()
+        config.load_kube_config_from_dict(self._kube_config_dict, client_configuration=configuration)
+        client.Configuration.set_default(configuration)
+
+        self._close_api_clients()
 
+        # API clients are reused for all requests to benefit from connection
+        # pooling; watch responses are read without decoding the content by the
+        # Kubernetes Python client, which is why compression is only requested
+        # for non-watch requests
+        self._api_client = client.ApiClient(configuration)
+        self._watch_api_client = client.ApiClient(configuration)
+
+        if configuration_manager.get_config_value(RESPONSE_COMPRESSION_CONFIG_KEY, bool, True):
+            self._api_client.set_default_header("Accept-Encoding", "gzip")
+
+        self._kube_config_generation += 1
         self._kube_config_initialized = True
 
+    def _set_kube_config_if_required(self) -> int:
+        """Sets the Kubernetes configuration of the Kubernetes Python client
+        unless it was already set
+
+        Returns
+        -------
+        int
+            generation of the current Kubernetes configuration
+        """
+
+        with self._kube_config_lock:
+            if not self._kube_config_initialized:
+                self._set_kube_config()
+
+            return self._kube_config_generation
+
     def _wait_for_custom_resource(
         self,
         kind_metadata: KindMetadata,
@@ -1355,7 +1495,7 @@ class OpenShiftAPIManager:
         success_callback: Callable[..., bool],
         **kwargs,
     ):
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._watch_api_client)
         succeeded = False
 
         while not succeeded:
@@ -1389,7 +1529,7 @@ class OpenShiftAPIManager:
         success_callback: Callable[..., CustomResourceEventResult | None],
         **kwargs,
     ) -> CustomResourceEventResult:
-        custom_objects_api = client.CustomObjectsApi()
+        custom_objects_api = client.CustomObjectsApi(self._watch_api_client)
         custom_resource_event_result: CustomResourceEventResult | None = None
 
         while custom_resource_event_result is None:
@@ -33,6 +33,8 @@ from cpo.lib.dependency_manager.plugins.openshift.openshift_install_plugin impor
 from cpo.lib.openshift.openshift_install.types.architecture import Architecture
 from cpo.utils.error import CloudPakOperationsCLIException
 
+OPENSHIFT_INSTALL_MAX_CAPTURED_LINES: Final[int] = 10000
+
 file_lock = FileLock(configuration_manager.get_cli_data_directory_path() / "openshift-install.lock")
 
 
@@ -96,6 +98,7 @@ class OpenShiftInstallationManager(ABC):
             args,
             capture_output=True,
             env=self._get_environment(),
+            max_captured_lines=OPENSHIFT_INSTALL_MAX_CAPTURED_LINES,
             print_captured_output=True,
         )
 
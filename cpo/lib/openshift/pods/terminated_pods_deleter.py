@@ -0,0 +1,97 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import concurrent.futures
+import logging
+
+from dataclasses import dataclass, field
+from typing import Final
+
+from tqdm import tqdm
+
+from cpo.lib.openshift.credentials.credentials import AbstractCredentials
+from cpo.lib.openshift.openshift_api_manager import OpenShiftAPIManager
+
+logger = logging.getLogger(__name__)
+
+TERMINATED_POD_PHASES: Final[list[str]] = ["Failed", "Succeeded"]
+
+
+@dataclass
+class TerminatedPodsDeletionResult:
+    number_of_pods_per_project: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def number_of_pods(self) -> int:
+        return sum(self.number_of_pods_per_project.values())
+
+
+class TerminatedPodsDeleter:
+    """Deletes terminated pods (i.e., pods in phase "Failed" or "Succeeded")
+
+    For each project and phase, pods are deleted using a single
+    deletecollection request with a status.phase field selector. Requests
+    for different projects are sent in parallel.
+    """
+
+    def __init__(self, credentials: AbstractCredentials, max_parallel: int = 8):
+        self._max_parallel = max_parallel
+        self._openshift_api_manager = OpenShiftAPIManager(credentials)
+
+    def delete_terminated_pods(self, dry_run: bool = False) -> TerminatedPodsDeletionResult:
+        """Deletes terminated pods in all projects
+
+        Parameters
+        ----------
+        dry_run
+            flag indicating whether terminated pods shall only be counted
+
+        Returns
+        -------
+        TerminatedPodsDeletionResult
+            number of deleted pods (or pods that would have been deleted) per
+            project
+        """
+
+        projects = self._openshift_api_manager.get_projects()
+        result = TerminatedPodsDeletionResult()
+
+        with (
+            concurrent.futures.ThreadPoolExecutor(max_workers=self._max_parallel) as executor,
+            tqdm(total=len(projects), unit="project") as progress_bar,
+        ):
+            futures = {
+                executor.submit(self._delete_terminated_pods_in_project, project, dry_run): project
+                for project in projects
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                project = futures[future]
+                number_of_pods = future.result()
+
+                if number_of_pods != 0:
+                    result.number_of_pods_per_project[project] = number_of_pods
+                    progress_bar.set_postfix(pods=result.number_of_pods)
+
+                progress_bar.update()
+
+        return result
+
+    def _delete_terminated_pods_in_project(self, project: str, dry_run: bool) -> int:
+        number_of_pods = 0
+
+        for phase in TERMINATED_POD_PHASES:
+            number_of_pods += self._openshift_api_manager.delete_pods(project, f"status.phase={phase}", dry_run)
+
+        return number_of_pods
@@ -1,4 +1,4 @@
-#  Copyright 2022 IBM Corporation
+#  Copyright 2022, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -12,6 +12,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import datetime
+
+from typing import Any
 
 from cpo.utils.error import CloudPakOperationsCLIException
 
@@ -25,6 +28,45 @@ class GetPodEntry:
         self.restarts = restarts
         self.age = age
 
+    @classmethod
+    def from_pod(cls, pod: Any, now: datetime.datetime | None = None):
+        """Creates an object based on a pod returned by the Kubernetes Python
+        client
+
+        Parameters
+        ----------
+        pod
+            pod (V1Pod) returned by the Kubernetes Python client
+        now
+            point in time used to compute the age of the pod
+
+        Returns
+        -------
+        GetPodEntry
+            object corresponding to the given pod
+        """
+
+        container_statuses = pod.status.container_statuses or []
+        status = pod.status.reason or pod.status.phase
+
+        for container_status in container_statuses:
+            if (container_status.state is not None) and (container_status.state.waiting is not None):
+                status = container_status.state.waiting.reason or status
+
+                break
+
+        if pod.metadata.deletion_timestamp is not None:
+            status = "Terminating"
+
+        return GetPodEntry(
+            pod.metadata.name,
+            sum(1 for container_status in container_statuses if container_status.ready),
+            len(pod.spec.containers),
+            status,
+            sum(container_status.restart_count for container_status in container_statuses),
+            cls._get_age(pod.metadata.creation_timestamp, now or datetime.datetime.now(datetime.timezone.utc)),
+        )
+
     @classmethod
     def parse(cls, line: str):
         parts = line.split()
@@ -51,3 +93,22 @@ class GetPodEntry:
 
     def is_running(self):
         return self.status == "Running"
+
+    @classmethod
+    def _get_age(cls, creation_timestamp: datetime.datetime | None, now: datetime.datetime) -> str:
+        """Returns the age of a pod in the format used by oc get pods (e.g.,
+        "42s", "5m", "3h", or "7d")"""
+
+        if creation_timestamp is None:
+            return "<unknown>"
+
+        seconds = max(int((now - creation_timestamp).total_seconds()), 0)
+
+        if seconds < 120:
+            return f"{seconds}s"
+        elif seconds < 7200:
+            return f"{seconds // 60}m"
+        elif seconds < 172800:
+            return f"{seconds // 3600}h"
+        else:
+            return f"{seconds // 86400}d"
@@ -1,4 +1,4 @@
-#  Copyright 2021, 2024 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -14,11 +14,12 @@
 
 import os
 import pathlib
+import posixpath
 import re as regex
 import tarfile
 import zipfile
 
-from typing import Any, Callable
+from typing import IO, Any, Callable
 
 import cpo.utils.file
 
@@ -26,6 +27,63 @@ MemberIdentificationFunc = Callable[[str, cpo.utils.file.FileType], bool]
 PostExtractionFunc = Callable[[pathlib.Path], None]
 
 
+class MemberMatcher:
+    """Selects archive members to be extracted by file name
+
+    A member is selected if the last component of its path equals one of the
+    given file names and, optionally, if it is of the given file type. As each
+    file name is expected to occur once within an archive, extraction stops as
+    soon as one member per file name was extracted.
+    """
+
+    def __init__(self, file_names: list[str], file_type: cpo.utils.file.FileType | None = None):
+        self._file_names = frozenset(file_names)
+        self._file_type = file_type
+
+    def get_expected_member_count(self) -> int:
+        """Returns the number of members after whose extraction extraction
+        stops
+
+        Returns
+        -------
+        int
+            number of members after whose extraction extraction stops
+        """
+
+        return len(self._file_names)
+
+    def get_file_names(self) -> frozenset[str]:
+        """Returns the file names of members to be extracted
+
+        Returns
+        -------
+        frozenset[str]
+            file names of members to be extracted
+        """
+
+        return self._file_names
+
+    def matches(self, member_name: str, file_type: cpo.utils.file.FileType) -> bool:
+        """Returns whether the given member shall be extracted
+
+        Parameters
+        ----------
+        member_name
+            name of the member within an archive
+        file_type
+            file type of the member
+
+        Returns
+        -------
+        bool
+            true, if the given member shall be extracted
+        """
+
+        return (posixpath.basename(member_name) in self._file_names) and (
+            (self._file_type is None) or (file_type == self._file_type)
+        )
+
+
 def execute_post_extraction_func_if_exists(extracted_file_path: pathlib.Path, **kwargs: Any):
     """Calls an optional function to perform post-extraction actions
 
@@ -63,12 +121,15 @@ def extract_archive(archive_path: pathlib.Path, target_directory_path: pathlib.P
         memberIdentificationFunc: MemberIdentificationFunc
             function called for each file within the archive to determine whether
             the file shall be extracted
+        memberMatcher: MemberMatcher
+            matcher selecting the members to be extracted (extraction stops as
+            soon as all selected members were extracted)
         postExtractionFunc: PostExtractionFunc
             function called for each extracted file to perform
             post-extraction actions
     """
 
-    if (archive_path.suffixes[-2:] == [".tar", ".gz"]) or (archive_path.suffix == ".tgz"):
+    if is_tgz_archive(archive_path):
         extract_tgz_archive(archive_path, target_directory_path, **kwargs)
     elif archive_path.suffix == ".zip":
         extract_zip_archive(archive_path, target_directory_path, **kwargs)
@@ -83,6 +144,29 @@ def extract_tgz_archive(archive_path: pathlib.Path, target_directory_path: pathl
         path of the archive to be extracted
     target_directory_path
         path of the directory the archive shall be extracted to
+    **kwargs
+        see extract_tgz_archive_from_stream()
+    """
+
+    with open(archive_path, "rb") as archive_file:
+        extract_tgz_archive_from_stream(archive_file, target_directory_path, **kwargs)
+
+
+def extract_tgz_archive_from_stream(
+    stream: IO[bytes], target_directory_path: pathlib.Path, **kwargs: Any
+) -> list[pathlib.Path]:
+    """Extracts a tar.gz or tgz archive read sequentially from the given
+    stream
+
+    The stream is read in a single pass and is not required to be seekable,
+    i.e., an archive may be extracted while it is being downloaded.
+
+    Parameters
+    ----------
+    stream
+        stream the archive is read from
+    target_directory_path
+        path of the directory the archive shall be extracted to
     **kwargs
         directoryPathToStartExtraction: str
             path of a directory indicating that only files and directories whose
@@ -94,17 +178,34 @@ def extract_tgz_archive(archive_path: pathlib.Path, target_directory_path: pathl
         memberIdentificationFunc: MemberIdentificationFunc
             function called for each file within the archive to determine whether
             the file shall be extracted
+        memberMatcher: MemberMatcher
+            matcher selecting the members to be extracted (extraction stops
+            without reading the remaining stream as soon as all selected
+            members were extracted)
         postExtractionFunc: PostExtractionFunc
             function called for each extracted file to perform
             post-extraction actions
+
+    Returns
+    -------
+    list[pathlib.Path]
+        paths of extracted files and directories
     """
 
-    with tarfile.open(archive_path) as tar_file:
+    directory_path_to_start_extraction_pattern = (
+        regex.compile(f"({kwargs['directoryPathToStartExtraction']}/).*")
+        if "directoryPathToStartExtraction" in kwargs
+        else None
+    )
+
+    expected_member_count = _get_expected_member_count(**kwargs)
+    extracted_paths: list[pathlib.Path] = []
+
+    with tarfile.open(fileobj=stream, mode="r|gz") as tar_file:
         for member in tar_file:
             if is_member_to_be_extracted(member.name, member.isdir(), **kwargs):
-                if "directoryPathToStartExtraction" in kwargs:
-                    directory_path_to_start_extraction = kwargs["directoryPathToStartExtraction"]
-                    search_result = regex.search(f"({directory_path_to_start_extraction}/).*", member.name)
+                if directory_path_to_start_extraction_pattern is not None:
+                    search_result = directory_path_to_start_extraction_pattern.search(member.name)
 
                     if search_result is None:
                         continue
@@ -116,6 +217,12 @@ def extract_tgz_archive(archive_path: pathlib.Path, target_directory_path: pathl
 
                 tar_file.extract(member, target_directory_path)
                 execute_post_extraction_func_if_exists(target_directory_path / member.name, **kwargs)
+                extracted_paths.append(target_directory_path / member.name)
+
+                if len(extracted_paths) == expected_member_count:
+                    break
+
+    return extracted_paths
 
 
 def extract_zip_archive(archive_path: pathlib.Path, target_directory_path: pathlib.Path, **kwargs: Any):
@@ -138,19 +245,22 @@ def extract_zip_archive(archive_path: pathlib.Path, target_directory_path: pathl
         memberIdentificationFunc: MemberIdentificationFunc
             function called for each file within the archive to determine whether
             the file shall be extracted
+        memberMatcher: MemberMatcher
+            matcher selecting the members to be extracted (members located in
+            the root directory of the archive are looked up in the central
+            directory instead of iterating over all members)
         postExtractionFunc: PostExtractionFunc
             function called for each extracted file to perform
             post-extraction actions
     """
 
     with zipfile.ZipFile(archive_path) as zip_file:
-        for member in zip_file.infolist():
-            if is_member_to_be_extracted(member.filename, member.is_dir(), **kwargs):
-                if is_directory_structure_to_be_ignored(**kwargs):
-                    member.filename = os.path.basename(member.filename)
+        for member in _get_zip_archive_members_to_be_extracted(zip_file, **kwargs):
+            if is_directory_structure_to_be_ignored(**kwargs):
+                member.filename = os.path.basename(member.filename)
 
-                zip_file.extract(member, str(target_directory_path))
-                execute_post_extraction_func_if_exists(target_directory_path / member.filename, **kwargs)
+            zip_file.extract(member, str(target_directory_path))
+            execute_post_extraction_func_if_exists(target_directory_path / member.filename, **kwargs)
 
 
 def is_directory_structure_to_be_ignored(**kwargs: Any) -> bool:
@@ -174,6 +284,23 @@ def is_directory_structure_to_be_ignored(**kwargs: Any) -> bool:
     return ("ignoreDirectoryStructure" in kwargs) and (kwargs["ignoreDirectoryStructure"])
 
 
+def is_tgz_archive(archive_path: pathlib.PurePath) -> bool:
+    """Returns whether the given path is the path of a tar.gz or tgz archive
+
+    Parameters
+    ----------
+    archive_path
+        path of an archive
+
+    Returns
+    -------
+    bool
+        true, if the given path is the path of a tar.gz or tgz archive
+    """
+
+    return (archive_path.suffixes[-2:] == [".tar", ".gz"]) or (archive_path.suffix == ".tgz")
+
+
 def is_member_to_be_extracted(member_name: str, is_dir: bool, **kwargs: Any) -> bool:
     """Returns whether the given member within an archive shall be extracted
 
@@ -187,6 +314,8 @@ def is_member_to_be_extracted(member_name: str, is_dir: bool, **kwargs: Any) ->
         memberIdentificationFunc: MemberIdentificationFunc
             function called for each file within the archive to determine whether
             the file shall be extracted
+        memberMatcher: MemberMatcher
+            matcher selecting the members to be extracted
 
     Returns
     -------
@@ -194,10 +323,44 @@ def is_member_to_be_extracted(member_name: str, is_dir: bool, **kwargs: Any) ->
         true, if the given file within an archive shall be extracted
     """
 
-    return ("memberIdentificationFunc" not in kwargs) or (
-        ("memberIdentificationFunc" in kwargs)
-        and kwargs["memberIdentificationFunc"](
-            member_name,
-            cpo.utils.file.FileType.Directory if is_dir else cpo.utils.file.FileType.RegularFile,
-        )
+    file_type = cpo.utils.file.FileType.Directory if is_dir else cpo.utils.file.FileType.RegularFile
+
+    return (("memberMatcher" not in kwargs) or kwargs["memberMatcher"].matches(member_name, file_type)) and (
+        ("memberIdentificationFunc" not in kwargs) or kwargs["memberIdentificationFunc"](member_name, file_type)
     )
+
+
+def _get_expected_member_count(**kwargs: Any) -> int | None:
+    return kwargs["memberMatcher"].get_expected_member_count() if "memberMatcher" in kwargs else None
+
+
+def _get_zip_archive_members_to_be_extracted(zip_file: zipfile.ZipFile, **kwargs: Any) -> list[zipfile.ZipInfo]:
+    members: list[zipfile.ZipInfo] = []
+
+    if "memberMatcher" in kwargs:
+        # look up members located in the root directory of the archive in the
+        # central directory
+        for file_name in sorted(kwargs["memberMatcher"].get_file_names()):
+            try:
+                member = zip_file.getinfo(file_name)
+            except KeyError:
+                continue
+
+            if is_member_to_be_extracted(member.filename, member.is_dir(), **kwargs):
+                members.append(member)
+
+        if len(members) == _get_expected_member_count(**kwargs):
+            return members
+
+        members.clear()
+
+    expected_member_count = _get_expected_member_count(**kwargs)
+
+    for member in zip_file.infolist():
+        if is_member_to_be_extracted(member.filename, member.is_dir(), **kwargs):
+            members.append(member)
+
+            if len(members) == expected_member_count:
+                break
+
+    return members
@@ -1,4 +1,4 @@
-#  Copyright 2021, 2023 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -12,22 +12,38 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import concurrent.futures
+import contextlib
+import dataclasses
 import io
+import json
 import logging
 import os
 import pathlib
 import re as regex
 import tempfile
+import threading
 import urllib.parse
 
-from typing import Any
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import IO, Any, Final
 
 import requests
 
 from tqdm import tqdm
 
+from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.file import write_file_atomically
+from cpo.utils.http_session import get_session
+
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE: Final[int] = 1048576  # 1 MiB
+DOWNLOAD_SEGMENTS: Final[int] = 4
+MAX_DOWNLOAD_ATTEMPTS: Final[int] = 5
+SEGMENTED_DOWNLOAD_MIN_SIZE: Final[int] = 33554432  # 32 MiB
+
 
 def download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
     """Downloads a file to the temporary directory of the current user
@@ -35,15 +51,32 @@ def download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
     If an argument for target_directory_path is passed, the file is
     downloaded to the specified directory.
 
+    The file is downloaded to a partial file (<file name>.part) first, which
+    is renamed after its size was verified. The ETag and Last-Modified
+    response headers are recorded in a sidecar file (<file name>.part.json).
+    If the connection is interrupted, the download is resumed using an HTTP
+    range request if the server supports range requests and the file was not
+    modified in the meantime. This also applies to partial files left behind
+    by previous invocations.
+
+    Files of at least SEGMENTED_DOWNLOAD_MIN_SIZE bytes are split into
+    segments downloaded concurrently into a preallocated partial file, each of
+    which is retried separately. If the server does not satisfy range
+    requests, the file is downloaded using a single connection.
+
     Parameters
     ----------
     url
         url of the file to be downloaded
     **kwargs
         auth
-            passed to requests.get()
+            passed to requests.Session.get()
         headers
-            passed to requests.get()
+            passed to requests.Session.get()
+        segments
+            number of ranges downloaded concurrently if the file is large
+            enough and the server supports range requests (default: 4; 1
+            disables segmented downloads)
         target_directory_path
             path of the directory the file shall be downloaded to
 
@@ -58,47 +91,140 @@ def download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
     if "auth" in kwargs:
         args["auth"] = kwargs["auth"]
 
-    if "headers" in kwargs:
-        args["headers"] = kwargs["headers"]
-
+    # request the identity encoding as byte ranges and Content-Length refer to
+    # the encoded representation
+    args["headers"] = {"Accept-Encoding": "identity"} | (kwargs["headers"] if "headers" in kwargs else {})
     args["stream"] = True
 
-    response = requests.get(urllib.parse.urlunsplit(url), **args)
+    response: requests.Response | None = get_session().get(urllib.parse.urlunsplit(url), **args)
     response.raise_for_status()
 
-    file_name: str
-
-    if "Content-Disposition" in response.headers:
-        content_disposition = response.headers["Content-Disposition"]
-        search_result = regex.search('filename="?([^;"]+)"?', content_disposition)
-        file_name = (
-            search_result.group(1)
-            if search_result is not None
-            else os.path.basename(urllib.parse.urlsplit(response.url).path)
-        )
-    else:
-        file_name = os.path.basename(urllib.parse.urlsplit(response.url).path)
+    file_name = _get_file_name(response)
 
     logger.info(f"Downloading: {response.url} [{file_name}]")
 
-    content_length = (
-        int(str(response.headers.get("Content-Length"))) if response.headers.get("Content-Length") is not None else 0
-    )
-
-    download_progress_bar = tqdm(total=content_length, unit="B", unit_scale=True)
     path = (
         pathlib.Path(kwargs["target_directory_path"] if "target_directory_path" in kwargs else tempfile.gettempdir())
         / file_name
     )
 
-    with open(path, "wb") as file:
-        for chunk in response.iter_content(chunk_size=1048576):  # 1 MiB
-            file.write(chunk)
-            download_progress_bar.update(len(chunk))
+    partial_download = _PartialDownload(
+        path, _PartialDownloadMetadata.from_response(urllib.parse.urlunsplit(url), response)
+    )
 
-    download_progress_bar.close()
+    if not partial_download.is_resumable() or not partial_download.is_matching_sidecar_file():
+        partial_download.restart()
+
+    attempt = 1
+    completed = False
+    segment_count = kwargs["segments"] if "segments" in kwargs else DOWNLOAD_SEGMENTS
+
+    # the file name is displayed as progress bars of concurrent downloads are
+    # stacked
+    with tqdm(
+        desc=file_name, total=partial_download.metadata.content_length or 0, unit="B", unit_scale=True
+    ) as progress_bar:
+        if (
+            (segment_count > 1)
+            and partial_download.is_resumable()
+            and (partial_download.get_size() == 0)
+            and ((partial_download.metadata.content_length or 0) >= SEGMENTED_DOWNLOAD_MIN_SIZE)
+        ):
+            response.close()
+            response = None
+
+            try:
+                partial_download.write_segments(args, segment_count, progress_bar)
+                completed = True
+            except _RangeRequestNotSatisfiedError:
+                logger.debug(f"Range requests for {partial_download.metadata.url} not satisfied, using one connection")
+                partial_download.restart()
+                progress_bar.reset()
+
+        while not completed:
+            try:
+                if (response is None) or (partial_download.get_size() != 0):
+                    if response is not None:
+                        response.close()
+
+                    response = partial_download.request_remaining_content(args)
+
+                progress_bar.n = partial_download.get_size()
+                progress_bar.refresh()
+                partial_download.write(response, progress_bar)
+                completed = partial_download.is_complete()
+            except (
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as exception:
+                logger.debug(f"Download of {partial_download.metadata.url} interrupted: {exception}")
+            finally:
+                if response is not None:
+                    response.close()
+                    response = None
+
+            if not completed:
+                if attempt == MAX_DOWNLOAD_ATTEMPTS:
+                    raise CloudPakOperationsCLIException(
+                        f"Download of {partial_download.metadata.url} failed after {attempt} attempts"
+                    )
+
+                attempt += 1
+
+                if partial_download.is_resumable():
+                    logger.warning(f"Download interrupted, resuming at byte {partial_download.get_size()}")
+                else:
+                    logger.warning("Download interrupted, restarting")
+                    partial_download.restart()
+
+    return partial_download.finish()
+
+
+@contextlib.contextmanager
+def open_file_stream(url: urllib.parse.SplitResult, **kwargs: Any) -> Iterator[tuple[str, IO[bytes]]]:
+    """Opens a stream of the contents of a file to be downloaded
+
+    In contrast to download_file(), the file is not written to disk and
+    interrupted downloads are not resumed.
 
-    return path
+    Parameters
+    ----------
+    url
+        url of the file to be downloaded
+    **kwargs
+        auth
+            passed to requests.Session.get()
+        headers
+            passed to requests.Session.get()
+
+    Yields
+    ------
+    tuple[str, IO[bytes]]
+        name of the file and stream of its contents
+    """
+
+    args: dict[str, Any] = {}
+
+    if "auth" in kwargs:
+        args["auth"] = kwargs["auth"]
+
+    args["headers"] = {"Accept-Encoding": "identity"} | (kwargs["headers"] if "headers" in kwargs else {})
+    args["stream"] = True
+
+    with get_session().get(urllib.parse.urlunsplit(url), **args) as response:
+        response.raise_for_status()
+
+        file_name = _get_file_name(response)
+
+        logger.info(f"Downloading: {response.url} [{file_name}]")
+
+        content_length = _PartialDownloadMetadata.from_response(urllib.parse.urlunsplit(url), response).content_length
+
+        response.raw.decode_content = True
+
+        with tqdm.wrapattr(response.raw, "read", desc=file_name, total=content_length or 0) as stream:
+            yield file_name, stream
 
 
 def download_file_into_buffer(url: urllib.parse.SplitResult, output_stream: io.BufferedIOBase, **kwargs: Any) -> str:
@@ -116,21 +242,10 @@ def download_file_into_buffer(url: urllib.parse.SplitResult, output_stream: io.B
             flag indicating whether output to stdout shall be suppressed
     """
 
-    response = requests.get(urllib.parse.urlunsplit(url), stream=True)
+    response = get_session().get(urllib.parse.urlunsplit(url), stream=True)
     response.raise_for_status()
 
-    file_name: str
-
-    if "Content-Disposition" in response.headers:
-        content_disposition = response.headers["Content-Disposition"]
-        search_result = regex.search('filename="?([^;"]+)"?', content_disposition)
-        file_name = (
-            search_result.group(1)
-            if search_result is not None
-            else os.path.basename(urllib.parse.urlsplit(response.url).path)
-        )
-    else:
-        file_name = os.path.basename(urllib.parse.urlsplit(response.url).path)
+    file_name = _get_file_name(response)
 
     if ("silent" not in kwargs) or not kwargs["silent"]:
         logger.info(f"Downloading: {response.url} [{file_name}]")
@@ -140,15 +255,315 @@ def download_file_into_buffer(url: urllib.parse.SplitResult, output_stream: io.B
     )
 
     if ("silent" in kwargs) and kwargs["silent"]:
-        for chunk in response.iter_content(chunk_size=1048576):  # 1 MiB
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
             output_stream.write(chunk)
     else:
         download_progress_bar = tqdm(total=content_length, unit="B", unit_scale=True)
 
-        for chunk in response.iter_content(chunk_size=1048576):  # 1 MiB
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
             output_stream.write(chunk)
             download_progress_bar.update(len(chunk))
 
         download_progress_bar.close()
 
     return file_name
+
+
+@dataclass
+class _PartialDownloadMetadata:
+    """Metadata of a partially downloaded file stored in a sidecar file"""
+
+    accept_ranges: bool
+    content_length: int | None
+    etag: str | None
+    last_modified: str | None
+    url: str
+
+    @classmethod
+    def from_response(cls, url: str, response: requests.Response) -> "_PartialDownloadMetadata":
+        return cls(
+            accept_ranges=response.headers.get("Accept-Ranges", "").lower() == "bytes",
+            content_length=(
+                int(response.headers["Content-Length"]) if response.headers.get("Content-Length") is not None else None
+            ),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            url=url,
+        )
+
+    def get_validator(self) -> str | None:
+        """Returns the value of the If-Range request header
+
+        Returns
+        -------
+        str | None
+            strong ETag or Last-Modified date or None if the server did not
+            return any of them
+        """
+
+        return self.etag if (self.etag is not None) and not self.etag.startswith("W/") else self.last_modified
+
+
+class _PartialDownload:
+    """Manages a partially downloaded file (<file name>.part) and its sidecar
+    file (<file name>.part.json)"""
+
+    def __init__(self, path: pathlib.Path, metadata: _PartialDownloadMetadata):
+        self._partial_file_path = path.with_name(f"{path.name}.part")
+        self._path = path
+        self._sidecar_file_path = path.with_name(f"{path.name}.part.json")
+        self.metadata = metadata
+
+    def finish(self) -> pathlib.Path:
+        """Renames the partially downloaded file to the target file and
+        removes the sidecar file
+
+        Returns
+        -------
+        pathlib.Path
+            path of the target file
+        """
+
+        os.replace(self._partial_file_path, self._path)
+        self._sidecar_file_path.unlink(missing_ok=True)
+
+        return self._path
+
+    def get_size(self) -> int:
+        try:
+            return self._partial_file_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def is_complete(self) -> bool:
+        """Returns whether the size of the partially downloaded file matches
+        the expected size
+
+        Returns
+        -------
+        bool
+            true, if the size of the partially downloaded file matches the
+            expected size or if the expected size is unknown
+        """
+
+        size = self.get_size()
+
+        if self.metadata.content_length is None:
+            return True
+
+        if size > self.metadata.content_length:
+            self.restart()
+
+            raise CloudPakOperationsCLIException(
+                f"Size of downloaded file ({size} bytes) exceeds expected size ({self.metadata.content_length} bytes)"
+            )
+
+        return size == self.metadata.content_length
+
+    def is_matching_sidecar_file(self) -> bool:
+        try:
+            return _PartialDownloadMetadata(**json.loads(self._sidecar_file_path.read_text())) == self.metadata
+        except (OSError, TypeError, ValueError):
+            return False
+
+    def is_resumable(self) -> bool:
+        return self.metadata.accept_ranges and (self.metadata.get_validator() is not None)
+
+    def request_remaining_content(self, args: dict[str, Any]) -> requests.Response:
+        """Requests the content not downloaded yet
+
+        If the file was modified since the download started or if the server
+        ignores the range request, the download is restarted.
+
+        Parameters
+        ----------
+        args
+            arguments passed to requests.Session.get()
+
+        Returns
+        -------
+        requests.Response
+            response whose content shall be appended to the partially
+            downloaded file
+        """
+
+        offset = self.get_size()
+        validator = self.metadata.get_validator()
+
+        if (offset == 0) or (validator is None):
+            response = get_session().get(self.metadata.url, **args)
+            response.raise_for_status()
+            self.restart()
+
+            return response
+
+        response = get_session().get(
+            self.metadata.url,
+            **(args | {"headers": args["headers"] | {"If-Range": validator, "Range": f"bytes={offset}-"}}),
+        )
+
+        response.raise_for_status()
+
+        if (response.status_code != 206) or not response.headers.get("Content-Range", "").startswith(
+            f"bytes {offset}-"
+        ):
+            logger.debug(f"Range request for {self.metadata.url} not satisfied, restarting download")
+
+            if response.status_code == 206:
+                response.close()
+                response = get_session().get(self.metadata.url, **args)
+                response.raise_for_status()
+
+            self.metadata = _PartialDownloadMetadata.from_response(self.metadata.url, response)
+            self.restart()
+
+        return response
+
+    def restart(self):
+        """Truncates the partially downloaded file and writes the sidecar
+        file"""
+
+        self._partial_file_path.write_bytes(b"")
+        write_file_atomically(self._sidecar_file_path, json.dumps(dataclasses.asdict(self.metadata)), 0o644)
+
+    def write(self, response: requests.Response, progress_bar: tqdm):
+        with open(self._partial_file_path, "ab") as file:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+                progress_bar.update(len(chunk))
+
+    def write_segments(self, args: dict[str, Any], segment_count: int, progress_bar: tqdm):
+        """Downloads the file in segments concurrently
+
+        The partial file is preallocated and each segment is written at its
+        offset. As the size of the partial file does not reflect the progress
+        of a segmented download, the sidecar file is removed so that a
+        segmented download interrupted by terminating the process is not
+        resumed.
+
+        Parameters
+        ----------
+        args
+            arguments passed to requests.Session.get()
+        segment_count
+            number of segments
+        progress_bar
+            progress bar to be updated
+
+        Raises
+        ------
+        _RangeRequestNotSatisfiedError
+            if the server does not satisfy a range request
+        """
+
+        content_length = self.metadata.content_length
+
+        assert content_length is not None
+
+        self._sidecar_file_path.unlink(missing_ok=True)
+
+        with open(self._partial_file_path, "wb") as file:
+            file.truncate(content_length)
+
+        segment_size = -(-content_length // segment_count)
+        stop_event = threading.Event()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=segment_count) as executor:
+            futures = [
+                executor.submit(
+                    self._write_segment,
+                    args,
+                    start,
+                    min(start + segment_size, content_length) - 1,
+                    progress_bar,
+                    stop_event,
+                )
+                for start in range(0, content_length, segment_size)
+            ]
+
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except BaseException:
+                stop_event.set()
+
+                raise
+
+    def _write_segment(
+        self,
+        args: dict[str, Any],
+        start: int,
+        end: int,
+        progress_bar: tqdm,
+        stop_event: threading.Event,
+    ):
+        attempt = 1
+        offset = start
+        validator = self.metadata.get_validator()
+
+        assert validator is not None
+
+        with open(self._partial_file_path, "r+b") as file:
+            while offset <= end:
+                try:
+                    with get_session().get(
+                        self.metadata.url,
+                        **(
+                            args
+                            | {"headers": args["headers"] | {"If-Range": validator, "Range": f"bytes={offset}-{end}"}}
+                        ),
+                    ) as response:
+                        if (response.status_code != 206) or not response.headers.get("Content-Range", "").startswith(
+                            f"bytes {offset}-"
+                        ):
+                            response.raise_for_status()
+
+                            raise _RangeRequestNotSatisfiedError()
+
+                        file.seek(offset)
+
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            if stop_event.is_set():
+                                return
+
+                            chunk = chunk[: end + 1 - offset]
+                            file.write(chunk)
+                            offset += len(chunk)
+                            progress_bar.update(len(chunk))
+
+                    if offset <= end:
+                        raise requests.exceptions.ChunkedEncodingError(f"Segment ended at byte {offset}")
+                except (
+                    requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                ) as exception:
+                    if attempt == MAX_DOWNLOAD_ATTEMPTS:
+                        raise CloudPakOperationsCLIException(
+                            f"Download of bytes {start}-{end} of {self.metadata.url} failed after {attempt} attempts"
+                        ) from exception
+
+                    attempt += 1
+                    logger.debug(f"Download of bytes {start}-{end} interrupted, resuming at byte {offset}: {exception}")
+
+
+class _RangeRequestNotSatisfiedError(Exception):
+    """Raised if the server responds to a range request with the whole file or
+    a different range"""
+
+
+def _get_file_name(response: requests.Response) -> str:
+    file_name: str
+
+    if "Content-Disposition" in response.headers:
+        content_disposition = response.headers["Content-Disposition"]
+        search_result = regex.search('filename="?([^;"]+)"?', content_disposition)
+        file_name = (
+            search_result.group(1)
+            if search_result is not None
+            else os.path.basename(urllib.parse.urlsplit(response.url).path)
+        )
+    else:
+        file_name = os.path.basename(urllib.parse.urlsplit(response.url).path)
+
+    return file_name
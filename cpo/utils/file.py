@@ -1,4 +1,4 @@
-#  Copyright 2021, 2024 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -12,17 +12,90 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import contextlib
 import os
 import pathlib
+import secrets
+import shutil
+import stat
 
+from collections.abc import Iterator
 from enum import Enum
 
+from filelock import FileLock, Timeout
+
 
 class FileType(Enum):
     Directory = 1
     RegularFile = 2
 
 
+@contextlib.contextmanager
+def create_staging_directory(directory_path: pathlib.Path) -> Iterator[pathlib.Path]:
+    """Creates a temporary staging directory within the given directory
+
+    Files are prepared in the staging directory and renamed to their final
+    path afterwards. As the staging directory is located on the same file
+    system, files are installed atomically.
+
+    The staging directory is owned by the caller as long as it holds the lock
+    file next to the staging directory, which is acquired before the staging
+    directory is created. Staging directories whose lock file is not held
+    were left behind by terminated processes (e.g., daemon threads killed
+    during an extraction) and are removed first.
+
+    Parameters
+    ----------
+    directory_path
+        path of the directory the staging directory is created in
+
+    Yields
+    ------
+    pathlib.Path
+        path of the staging directory
+    """
+
+    directory_path.mkdir(exist_ok=True, parents=True)
+
+    for abandoned_staging_directory_path in directory_path.glob(".staging-*"):
+        if abandoned_staging_directory_path.is_dir():
+            _remove_staging_directory_if_abandoned(abandoned_staging_directory_path)
+
+    staging_directory_path = directory_path / f".staging-{secrets.token_hex(8)}"
+    lock_file_path = _get_staging_directory_lock_file_path(staging_directory_path)
+
+    try:
+        with FileLock(lock_file_path):
+            staging_directory_path.mkdir(mode=0o700)
+
+            try:
+                yield staging_directory_path
+            finally:
+                shutil.rmtree(staging_directory_path, ignore_errors=True)
+    finally:
+        lock_file_path.unlink(missing_ok=True)
+
+
+def get_modification_time(path: pathlib.Path) -> str | None:
+    """Returns the modification time of the given file in nanoseconds
+
+    Parameters
+    ----------
+    path
+        path of the file
+
+    Returns
+    -------
+    str | None
+        modification time of the given file or None if the file does not exist
+    """
+
+    try:
+        return str(path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+
 def get_relative_path(path: os.PathLike, subpath: pathlib.Path) -> pathlib.Path | None:
     relative_path: pathlib.Path | None = None
 
@@ -32,3 +105,72 @@ def get_relative_path(path: os.PathLike, subpath: pathlib.Path) -> pathlib.Path
         pass
 
     return relative_path
+
+
+def write_file_atomically(path: pathlib.Path, contents: str, mode: int | None = None):
+    """Writes the given contents to a file atomically
+
+    The contents are written to a temporary file in the directory of the
+    target file, flushed to disk, and renamed to the target file. Therefore,
+    readers either see the previous or the new contents but never a partially
+    written file.
+
+    Parameters
+    ----------
+    path
+        path of the file to be written
+    contents
+        contents to be written
+    mode
+        permissions of the file (default: permissions of the existing file or,
+        like open(), 0666 modified by the umask if the file does not exist)
+    """
+
+    if mode is None and path.exists():
+        mode = stat.S_IMODE(path.stat().st_mode)
+
+    # in contrast to tempfile.mkstemp(), which always creates files with
+    # permissions 0600, os.open() applies the umask
+    temporary_file_path = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    file_descriptor = os.open(temporary_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+
+    try:
+        with os.fdopen(file_descriptor, "w") as temporary_file:
+            temporary_file.write(contents)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+
+        if mode is not None:
+            os.chmod(temporary_file_path, mode)
+
+        os.replace(temporary_file_path, path)
+    except BaseException:
+        temporary_file_path.unlink(missing_ok=True)
+
+        raise
+
+
+def _get_staging_directory_lock_file_path(staging_directory_path: pathlib.Path) -> pathlib.Path:
+    return staging_directory_path.with_name(f"{staging_directory_path.name}.lock")
+
+
+def _remove_staging_directory_if_abandoned(staging_directory_path: pathlib.Path):
+    """Removes the given staging directory if its lock file is not held by
+    another thread or process
+
+    Parameters
+    ----------
+    staging_directory_path
+        path of the staging directory
+    """
+
+    lock_file_path = _get_staging_directory_lock_file_path(staging_directory_path)
+
+    try:
+        with FileLock(lock_file_path, timeout=0):
+            shutil.rmtree(staging_directory_path, ignore_errors=True)
+
+        lock_file_path.unlink(missing_ok=True)
+    except Timeout:
+        # the staging directory is in use
+        pass
@@ -0,0 +1,159 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Final
+
+import requests
+import requests.adapters
+import requests.utils
+
+from urllib3.util.retry import Retry
+
+HTTP_POOL_CONNECTIONS: Final[int] = 16
+HTTP_POOL_MAXSIZE: Final[int] = 16
+HTTP_RETRY_STATUS_CODES: Final[tuple[int, ...]] = (429, 500, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class HTTPSessionSettings:
+    """Settings of HTTP sessions created by HTTPSessionFactory"""
+
+    backoff_factor: float = 0.5
+    ca_bundle_path: str | None = None
+    connect_timeout: float = 10.0
+    no_proxy: str = ""
+    proxies: dict[str, str] = field(default_factory=dict)
+    read_timeout: float = 60.0
+    retries: int = 3
+
+
+class HTTPSessionFactory:
+    """Creates the HTTP session shared by all outbound HTTP requests
+
+    The session keeps a connection pool per host (i.e., connections are
+    reused across requests), retries idempotent requests failing due to
+    connection errors or HTTP status codes indicating a transient error with
+    exponential backoff, and applies default connect and read timeouts to
+    requests not specifying a timeout. Requests to hosts matching the
+    no_proxy setting bypass the configured proxies (requests ignores
+    "no_proxy" in Session.proxies).
+
+    Settings are obtained from a settings provider when the session is
+    created (see cpo.config, which registers a provider reading settings from
+    the settings file).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._settings_provider: Callable[[], HTTPSessionSettings] = HTTPSessionSettings
+
+    def get_session(self) -> requests.Session:
+        """Returns the shared HTTP session
+
+        Returns
+        -------
+        requests.Session
+            shared HTTP session
+        """
+
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session(self._settings_provider())
+
+            return self._session
+
+    def reset(self):
+        """Closes the shared HTTP session (a new session is created when
+        get_session() is called next)"""
+
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def set_settings_provider(self, settings_provider: Callable[[], HTTPSessionSettings]):
+        """Sets the function returning settings of HTTP sessions
+
+        Parameters
+        ----------
+        settings_provider
+            function returning settings of HTTP sessions
+        """
+
+        self._settings_provider = settings_provider
+        self.reset()
+
+    def _create_session(self, settings: HTTPSessionSettings) -> requests.Session:
+        adapter = _HTTPAdapter(
+            (settings.connect_timeout, settings.read_timeout),
+            settings.no_proxy,
+            max_retries=Retry(
+                total=settings.retries,
+                backoff_factor=settings.backoff_factor,
+                raise_on_status=False,
+                status_forcelist=HTTP_RETRY_STATUS_CODES,
+            ),
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.proxies.update(settings.proxies)
+
+        if settings.ca_bundle_path is not None:
+            session.verify = settings.ca_bundle_path
+
+        return session
+
+
+class _HTTPAdapter(requests.adapters.HTTPAdapter):
+    def __init__(self, timeout: tuple[float, float], no_proxy: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._no_proxy = no_proxy
+        self._timeout = timeout
+
+    # override
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+
+        if (
+            (self._no_proxy != "")
+            and (request.url is not None)
+            and requests.utils.should_bypass_proxies(request.url, self._no_proxy)
+        ):
+            kwargs["proxies"] = {}
+
+        return super().send(request, **kwargs)
+
+
+http_session_factory = HTTPSessionFactory()
+
+
+def get_session() -> requests.Session:
+    """Returns the HTTP session shared by all outbound HTTP requests
+
+    Returns
+    -------
+    requests.Session
+        shared HTTP session
+    """
+
+    return http_session_factory.get_session()
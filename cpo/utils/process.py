@@ -1,4 +1,4 @@
-#  Copyright 2021, 2024 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -13,25 +13,181 @@
 #  limitations under the License.
 
 import asyncio
+import codecs
+import collections
+import functools
 import logging
 import os
 import pathlib
-
-from typing import Callable
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import IO, Callable, Final, Literal
 
 import click
 
 from cpo.utils.error import CloudPakOperationsCLIException
 
+STREAM_READ_CHUNK_SIZE: Final[int] = 65536
+TERMINATION_GRACE_PERIOD: Final[float] = 10.0
+
+
+class OutputBuffer:
+    """Stores captured process output in memory"""
+
+    def __init__(self):
+        self._lines: collections.deque[str] | list[str] = []
+
+    def append(self, line: str):
+        self._lines.append(line)
+
+    def close(self):
+        pass
+
+    def get_lines(self) -> Iterable[str]:
+        return self._lines
+
+    def get_text(self) -> str:
+        return "\n".join(self.get_lines())
+
+
+class RingOutputBuffer(OutputBuffer):
+    """Stores the given maximum number of most recent lines of captured process
+    output in memory"""
+
+    def __init__(self, max_lines: int):
+        self._lines = collections.deque(maxlen=max_lines)
+
+
+class FileOutputBuffer(OutputBuffer):
+    """Stores captured process output in a temporary file
+
+    The temporary file is deleted when the buffer is closed or garbage
+    collected.
+    """
+
+    def __init__(self):
+        self._file: IO[str] = tempfile.TemporaryFile("w+", encoding="utf-8", prefix="cpo-process-output-")
+        self._is_first_line = True
+
+    def append(self, line: str):
+        if not self._is_first_line:
+            self._file.write("\n")
+
+        self._file.write(line)
+        self._is_first_line = False
+
+    def close(self):
+        self._file.close()
+
+    def get_lines(self) -> Iterable[str]:
+        return self.get_text().split("\n") if not self._is_first_line else []
+
+    def get_text(self) -> str:
+        self._file.seek(0)
+
+        text = self._file.read()
+
+        self._file.seek(0, os.SEEK_END)
+
+        return text
+
+
+@dataclass
+class CommandSpec:
+    """Specification of a process to be executed by execute_commands()"""
+
+    program: pathlib.Path
+    args: list[str]
+    check: bool = True
+    env: dict[str, str] = field(default_factory=os.environ.copy)
+    label: str | None = None
+    max_captured_lines: int | None = None
+    print_captured_output: bool = False
+    spill_captured_output_to_file: bool = False
+    timeout: float | None = None
+
+    def get_label(self, index: int) -> str:
+        return self.label if self.label is not None else f"{self.program.name}:{index}"
+
+
+@dataclass
+class ProcessOutputLine:
+    line: str
+    stream: Literal["stderr", "stdout"]
+
+
+@dataclass
+class ProcessStatistics:
+    """Resource usage of a terminated process
+
+    CPU time and maximum resident set size are only available on POSIX
+    systems.
+    """
+
+    wall_time: float
+    cpu_time: float | None = None
+    max_rss: int | None = None
+    timed_out: bool = False
+
 
 class ProcessResult:
-    def __init__(self, command: list[str], return_code: int, stderr: list[str], stdout: list[str]):
+    def __init__(
+        self,
+        command: list[str],
+        return_code: int,
+        stderr: list[str] | OutputBuffer,
+        stdout: list[str] | OutputBuffer,
+        stdout_bytes: bytes | None = None,
+        statistics: ProcessStatistics | None = None,
+    ):
         self.command = command
         self.return_code = return_code
+        self.statistics = statistics
         self._stderr = stderr
         self._stdout = stdout
+        self._stdout_bytes = stdout_bytes
+
+    @property
+    def cpu_time(self) -> float | None:
+        """Returns the CPU time (user and system) consumed by the process in
+        seconds"""
+
+        return self.statistics.cpu_time if self.statistics is not None else None
+
+    @property
+    def max_rss(self) -> int | None:
+        """Returns the maximum resident set size of the process in bytes"""
+
+        return self.statistics.max_rss if self.statistics is not None else None
+
+    @property
+    def timed_out(self) -> bool:
+        return self.statistics.timed_out if self.statistics is not None else False
+
+    @property
+    def wall_time(self) -> float | None:
+        """Returns the wall time of the process in seconds"""
+
+        return self.statistics.wall_time if self.statistics is not None else None
 
     def raise_for_status(self):
+        if self.timed_out:
+            command_string = " ".join(self.command)
+
+            raise CloudPakOperationsCLIException(
+                f"Command '{command_string}' timed out after {self.wall_time:.1f} seconds.",
+                self.stderr,
+                self.stdout,
+            )
+
         if self.return_code != 0:
             command_string = " ".join(self.command)
 
@@ -41,13 +197,31 @@ class ProcessResult:
                 self.stdout,
             )
 
-    @property
+    @functools.cached_property
     def stderr(self) -> str:
-        return "\n".join(self._stderr)
+        return self._stderr.get_text() if isinstance(self._stderr, OutputBuffer) else "\n".join(self._stderr)
 
-    @property
+    @functools.cached_property
     def stdout(self) -> str:
-        return "\n".join(self._stdout)
+        if self._stdout_bytes is not None:
+            return self._stdout_bytes.decode(errors="replace").rstrip()
+
+        return self._stdout.get_text() if isinstance(self._stdout, OutputBuffer) else "\n".join(self._stdout)
+
+    @property
+    def stdout_bytes(self) -> bytes:
+        """Returns output to stdout as raw bytes
+
+        Unaltered output is only available if the process was executed with
+        capture_raw_stdout=True (e.g., for passing output to json.loads()).
+
+        Returns
+        -------
+        bytes
+            output to stdout
+        """
+
+        return self._stdout_bytes if self._stdout_bytes is not None else self.stdout.encode()
 
 
 def execute_command(
@@ -57,6 +231,10 @@ def execute_command(
     capture_output=False,
     check=True,
     print_captured_output=False,
+    max_captured_lines: int | None = None,
+    spill_captured_output_to_file=False,
+    capture_raw_stdout=False,
+    timeout: float | None = None,
 ) -> ProcessResult:
     """Executes a process
 
@@ -76,6 +254,21 @@ def execute_command(
     print_captured_output
         flag indicating whether captured process output shall also be written to
         stdout/stderr
+    max_captured_lines
+        maximum number of most recent lines of captured process output kept in
+        memory per stream (default: unlimited)
+    spill_captured_output_to_file
+        flag indicating whether captured process output shall be stored in
+        temporary files instead of memory
+    capture_raw_stdout
+        flag indicating whether output to stdout shall be captured as raw bytes
+        without decoding it and splitting it into lines (see
+        ProcessResult.stdout_bytes)
+    timeout
+        number of seconds after which the process (and, on POSIX systems, its
+        process group) is terminated and, if it does not exit within a grace
+        period, killed; only for non-interactive processes, as stdin is
+        redirected from the null device (see _uses_process_group())
 
     Returns
     -------
@@ -88,24 +281,46 @@ def execute_command(
 
     logging.debug(f"Executing command: {' '.join(command)}")
 
-    return_code: int | None = None
-    stderr_buffer: list[str] = []
-    stdout_buffer: list[str] = []
+    statistics: ProcessStatistics | None = None
+    stderr_buffer = _create_output_buffer(max_captured_lines, spill_captured_output_to_file)
+    stdout_buffer = _create_output_buffer(max_captured_lines, spill_captured_output_to_file)
+    stdout_bytes: bytearray | None = None
 
     if capture_output:
-        return_code = asyncio.run(
+        stdout_callback: Callable[[str], None] | None = None
+        stdout_chunk_callback: Callable[[bytes], None] | None = None
+
+        if capture_raw_stdout:
+            stdout_bytes = bytearray()
+            stdout_callback = functools.partial(click.echo, nl=False) if print_captured_output else None
+            stdout_chunk_callback = stdout_bytes.extend
+        else:
+            stdout_callback = functools.partial(
+                _process_stdout_output, buffer=stdout_buffer, print_captured_output=print_captured_output
+            )
+
+        return_code, statistics = asyncio.run(
             _create_subprocess_and_capture_output(
                 program,
                 args,
                 env,
-                lambda line: _process_stdout_output(line, stdout_buffer, print_captured_output),
+                stdout_callback,
                 lambda line: _process_stderr_output(line, stderr_buffer, print_captured_output),
+                stdout_chunk_callback,
+                timeout,
             )
         )
     else:
-        return_code = asyncio.run(_create_subprocess(program, args, env))
-
-    result = ProcessResult(command, return_code, stderr_buffer, stdout_buffer)
+        return_code, statistics = asyncio.run(_create_subprocess(program, args, env, timeout))
+
+    result = ProcessResult(
+        command,
+        return_code,
+        stderr_buffer,
+        stdout_buffer,
+        bytes(stdout_bytes) if stdout_bytes is not None else None,
+        statistics,
+    )
 
     if check:
         result.raise_for_status()
@@ -113,6 +328,101 @@ def execute_command(
     return result
 
 
+def execute_commands(command_specs: list[CommandSpec], max_parallel: int = 4) -> list[ProcessResult]:
+    """Executes processes concurrently
+
+    All processes are executed using a single event loop. Process output is
+    always captured. If captured process output shall also be written to
+    stdout/stderr, each line is prefixed with the label of the corresponding
+    command specification (default: name of the executable and index of the
+    command specification).
+
+    Parameters
+    ----------
+    command_specs
+        specifications of the processes to be executed
+    max_parallel
+        maximum number of processes executed in parallel
+
+    Returns
+    -------
+    list[ProcessResult]
+        objects storing the return code and captured process output in the
+        order of the given command specifications
+    """
+
+    results = asyncio.run(_execute_commands(command_specs, max_parallel))
+
+    for command_spec, result in zip(command_specs, results):
+        if command_spec.check:
+            result.raise_for_status()
+
+    return results
+
+
+def iterate_command_output(
+    program: pathlib.Path, args: list[str], env: dict[str, str] = os.environ.copy(), check=True
+) -> Iterator[ProcessOutputLine]:
+    """Executes a process and yields lines written to stdout/stderr as they
+    arrive
+
+    In contrast to execute_command(), process output is not accumulated. If
+    the caller stops iterating, the process is terminated.
+
+    Parameters
+    ----------
+    program
+        path of the executable
+    args
+        arguments to be passed to the executable
+    env
+        dictionary of environment variables passed to the process
+    check
+        flag indicating whether an exception shall be thrown if the executable
+        returns with a nonzero return code
+
+    Returns
+    -------
+    Iterator[ProcessOutputLine]
+        lines written to stdout/stderr (without line separators)
+    """
+
+    command = [str(program)] + args
+
+    logging.debug(f"Executing command: {' '.join(command)}")
+
+    output_queue: queue.Queue[ProcessOutputLine | None] = queue.Queue()
+    process = subprocess.Popen(command, env=env, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    threads = [
+        threading.Thread(target=_enqueue_lines, args=(process.stderr, "stderr", output_queue), daemon=True),
+        threading.Thread(target=_enqueue_lines, args=(process.stdout, "stdout", output_queue), daemon=True),
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        number_of_open_streams = len(threads)
+
+        while number_of_open_streams != 0:
+            if (output_line := output_queue.get()) is not None:
+                yield output_line
+            else:
+                number_of_open_streams -= 1
+
+        return_code = process.wait()
+    finally:
+        if process.poll() is None:
+            process.terminate()
+            process.wait()
+
+        for thread in threads:
+            thread.join()
+
+    if check:
+        ProcessResult(command, return_code, [], []).raise_for_status()
+
+
 def execute_command_without_check(
     program: pathlib.Path, args: list[str], capture_output=True, print_captured_output=False
 ) -> ProcessResult:
@@ -146,7 +456,9 @@ def execute_command_without_check(
     )
 
 
-async def _create_subprocess(program: pathlib.Path, args: list[str], env: dict[str, str]) -> int:
+async def _create_subprocess(
+    program: pathlib.Path, args: list[str], env: dict[str, str], timeout: float | None = None
+) -> tuple[int, ProcessStatistics]:
     """Executes a process
 
     Parameters
@@ -157,21 +469,91 @@ async def _create_subprocess(program: pathlib.Path, args: list[str], env: dict[s
         arguments to be passed to the executable
     env
         dictionary of environment variables passed to the process
+    timeout
+        number of seconds after which the process is terminated
 
     Returns
     -------
-    int
-        return code
+    tuple[int, ProcessStatistics]
+        return code and resource usage
     """
 
-    process = await asyncio.create_subprocess_exec(*([str(program)] + args), env=env)
+    process = _start_process(program, args, env, capture_output=False, timeout=timeout)
+
+    return await _wait_for_process(process, [], timeout)
+
+
+def _create_output_buffer(max_captured_lines: int | None, spill_captured_output_to_file: bool) -> OutputBuffer:
+    if (max_captured_lines is not None) and spill_captured_output_to_file:
+        raise CloudPakOperationsCLIException(
+            "Captured process output cannot both be limited and be stored in a temporary file"
+        )
+
+    if max_captured_lines is not None:
+        return RingOutputBuffer(max_captured_lines)
+    elif spill_captured_output_to_file:
+        return FileOutputBuffer()
+    else:
+        return OutputBuffer()
+
+
+def _enqueue_lines(
+    stream: IO[bytes] | None,
+    stream_name: Literal["stderr", "stdout"],
+    output_queue: queue.Queue[ProcessOutputLine | None],
+):
+    try:
+        if stream is not None:
+            with stream:
+                for line in stream:
+                    output_queue.put(ProcessOutputLine(line.decode(errors="replace").rstrip("\r\n"), stream_name))
+    finally:
+        # the consumer waits for the sentinel of each stream
+        output_queue.put(None)
+
+
+async def _execute_command_spec(command_spec: CommandSpec, index: int, semaphore: asyncio.Semaphore) -> ProcessResult:
+    async with semaphore:
+        command = [str(command_spec.program)] + command_spec.args
+        prefix = f"[{command_spec.get_label(index)}] "
+        stderr_buffer = _create_output_buffer(
+            command_spec.max_captured_lines, command_spec.spill_captured_output_to_file
+        )
+        stdout_buffer = _create_output_buffer(
+            command_spec.max_captured_lines, command_spec.spill_captured_output_to_file
+        )
+
+        logging.debug(f"Executing command: {' '.join(command)}")
+
+        return_code, statistics = await _create_subprocess_and_capture_output(
+            command_spec.program,
+            command_spec.args,
+            command_spec.env,
+            lambda line: _process_stdout_output(line, stdout_buffer, command_spec.print_captured_output, prefix),
+            lambda line: _process_stderr_output(line, stderr_buffer, command_spec.print_captured_output, prefix),
+            timeout=command_spec.timeout,
+        )
+
+        return ProcessResult(command, return_code, stderr_buffer, stdout_buffer, statistics=statistics)
+
+
+async def _execute_commands(command_specs: list[CommandSpec], max_parallel: int) -> list[ProcessResult]:
+    semaphore = asyncio.Semaphore(max_parallel)
 
-    return await process.wait()
+    return await asyncio.gather(
+        *(_execute_command_spec(command_spec, index, semaphore) for index, command_spec in enumerate(command_specs))
+    )
 
 
 async def _create_subprocess_and_capture_output(
-    program: pathlib.Path, args: list[str], env: dict[str, str], stdout_callback, stderr_callback
-) -> int:
+    program: pathlib.Path,
+    args: list[str],
+    env: dict[str, str],
+    stdout_callback: Callable[[str], None] | None,
+    stderr_callback: Callable[[str], None] | None,
+    stdout_chunk_callback: Callable[[bytes], None] | None = None,
+    timeout: float | None = None,
+) -> tuple[int, ProcessStatistics]:
     """Executes a process and captures its output to stdout/stderr
 
     Parameters
@@ -186,48 +568,278 @@ async def _create_subprocess_and_capture_output(
         callback invoked when a line was read from stdout
     stderr_callback
         callback invoked when a line was read from stderr
+    stdout_chunk_callback
+        callback invoked when a chunk of raw bytes was read from stdout
+    timeout
+        number of seconds after which the process is terminated
 
     Returns
     -------
-    int
-        return code
+    tuple[int, ProcessStatistics]
+        return code and resource usage
     """
 
-    process = await asyncio.create_subprocess_exec(
-        *([str(program)] + args),
+    process = _start_process(program, args, env, capture_output=True, timeout=timeout)
+    stderr_reader = await _create_stream_reader(process.stderr)
+    stdout_reader = await _create_stream_reader(process.stdout)
+
+    return await _wait_for_process(
+        process,
+        [
+            asyncio.create_task(_read_stream(stderr_reader, stderr_callback)),
+            asyncio.create_task(_read_stream(stdout_reader, stdout_callback, stdout_chunk_callback)),
+        ],
+        timeout,
+    )
+
+
+async def _create_stream_reader(pipe: IO[bytes] | None) -> asyncio.StreamReader | None:
+    if pipe is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+
+    if os.name == "posix":
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+    else:
+        # the Windows event loop only supports pipes opened in overlapped mode
+        threading.Thread(target=_feed_stream_reader, args=(pipe, reader, loop), daemon=True).start()
+
+    return reader
+
+
+def _feed_stream_reader(pipe: IO[bytes], reader: asyncio.StreamReader, loop: asyncio.AbstractEventLoop):
+    with pipe:
+        while len(chunk := os.read(pipe.fileno(), STREAM_READ_CHUNK_SIZE)) != 0:
+            loop.call_soon_threadsafe(reader.feed_data, chunk)
+
+    loop.call_soon_threadsafe(reader.feed_eof)
+
+
+def _reap_process(process: subprocess.Popen) -> tuple[int, float | None, int | None]:
+    """Waits for the given process to exit and returns its return code, CPU
+    time, and maximum resident set size
+
+    On POSIX systems, os.wait4() is used to obtain the resource usage of the
+    process.
+    """
+
+    if not hasattr(os, "wait4"):
+        return process.wait(), None, None
+
+    _, status, resource_usage = os.wait4(process.pid, 0)
+    return_code = os.waitstatus_to_exitcode(status)
+
+    # prevent subprocess.Popen from waiting for the reaped process
+    process.returncode = return_code
+
+    # ru_maxrss is measured in bytes on macOS and in kilobytes on Linux
+    max_rss = resource_usage.ru_maxrss if sys.platform == "darwin" else resource_usage.ru_maxrss * 1024
+
+    return return_code, resource_usage.ru_utime + resource_usage.ru_stime, max_rss
+
+
+def _send_signal(process: subprocess.Popen, kill: bool, process_group: bool):
+    """Terminates or kills the given process or its process group"""
+
+    try:
+        if os.name != "posix":
+            if kill:
+                process.kill()
+            else:
+                process.terminate()
+        elif process_group:
+            os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        else:
+            os.kill(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def _start_process(
+    program: pathlib.Path, args: list[str], env: dict[str, str], capture_output: bool, timeout: float | None
+) -> subprocess.Popen:
+    uses_process_group = _uses_process_group(timeout)
+
+    return subprocess.Popen(
+        [str(program)] + args,
         env=env,
-        stderr=asyncio.subprocess.PIPE,
-        stdout=asyncio.subprocess.PIPE,
+        process_group=0 if uses_process_group else None,
+        stderr=subprocess.PIPE if capture_output else None,
+        stdin=subprocess.DEVNULL if uses_process_group else None,
+        stdout=subprocess.PIPE if capture_output else None,
     )
 
-    await asyncio.wait(
-        [
-            asyncio.create_task(_read_stream(process.stderr, stderr_callback)),
-            asyncio.create_task(_read_stream(process.stdout, stdout_callback)),
-        ]
+
+async def _terminate_process(process: subprocess.Popen, reap_future: asyncio.Future, process_group: bool):
+    """Terminates the given process (or its process group) and kills it if it
+    does not exit within the grace period"""
+
+    if not reap_future.done():
+        logging.debug(f"Terminating process {process.pid}")
+        _send_signal(process, False, process_group)
+
+        if len((await asyncio.wait([reap_future], timeout=TERMINATION_GRACE_PERIOD))[0]) == 0:
+            logging.debug(f"Killing process {process.pid}")
+            _send_signal(process, True, process_group)
+
+        await reap_future
+
+    if process_group:
+        # kill remaining processes of the process group (e.g., child processes
+        # ignoring SIGTERM and keeping pipes open)
+        _send_signal(process, True, process_group)
+
+
+def _uses_process_group(timeout: float | None) -> bool:
+    """Returns whether a process is started in a new process group
+
+    If a timeout is set, the process is started in a new process group to be
+    able to terminate its child processes, too. Otherwise, the process remains
+    in the foreground process group, which receives SIGINT on Ctrl-C.
+
+    A process in a new process group is a background process of the terminal
+    and would be stopped by SIGTTIN when reading from the terminal (e.g., an
+    interactive prompt of oc login). Therefore, its stdin is redirected from
+    the null device, i.e., reading from stdin returns EOF instead.
+    """
+
+    return (timeout is not None) and (os.name == "posix")
+
+
+async def _wait_for_process(
+    process: subprocess.Popen, reader_tasks: list[asyncio.Task], timeout: float | None
+) -> tuple[int, ProcessStatistics]:
+    """Waits for the given process to exit and for its output to be read
+
+    If the timeout expires or the calling task is cancelled (e.g., on Ctrl-C),
+    the process is terminated.
+    """
+
+    start_time = time.monotonic()
+    reap_future = asyncio.get_running_loop().run_in_executor(None, _reap_process, process)
+    timed_out = False
+
+    try:
+        tasks: list[asyncio.Future] = [reap_future, *reader_tasks]
+
+        if len((await asyncio.wait(tasks, timeout=timeout))[1]) != 0:
+            timed_out = True
+
+            await _terminate_process(process, reap_future, _uses_process_group(timeout))
+
+        await asyncio.wait(tasks)
+    except asyncio.CancelledError:
+        await _terminate_process(process, reap_future, _uses_process_group(timeout))
+
+        raise
+
+    return_code, cpu_time, max_rss = reap_future.result()
+    statistics = ProcessStatistics(time.monotonic() - start_time, cpu_time, max_rss, timed_out)
+
+    logging.debug(
+        f"Process {process.pid} exited with return code {return_code} (wall time: {statistics.wall_time:.2f} s"
+        + (f", CPU time: {cpu_time:.2f} s" if cpu_time is not None else "")
+        + (f", maximum RSS: {max_rss // 1024} KiB" if max_rss is not None else "")
+        + ")"
     )
 
-    return await process.wait()
+    return return_code, statistics
 
 
-def _process_stderr_output(line: str, buffer: list[str], print_captured_output: bool):
+def _process_stderr_output(line: str, buffer: OutputBuffer, print_captured_output: bool, prefix: str = ""):
     if print_captured_output:
-        click.echo(click.style(line, fg="red"), err=True, nl=False)
+        click.echo(click.style(prefix + line, fg="red"), err=True, nl=False)
 
     buffer.append(line.rstrip())
 
 
-def _process_stdout_output(line: str, buffer: list[str], print_captured_output: bool):
+def _process_stdout_output(line: str, buffer: OutputBuffer, print_captured_output: bool, prefix: str = ""):
     if print_captured_output:
-        click.echo(line, nl=False)
+        click.echo(prefix + line, nl=False)
 
     buffer.append(line.rstrip())
 
 
-async def _read_stream(stream: asyncio.StreamReader | None, callback: Callable[[str], None]):
+async def _read_stream(
+    stream: asyncio.StreamReader | None,
+    callback: Callable[[str], None] | None,
+    chunk_callback: Callable[[bytes], None] | None = None,
+):
+    """Reads a stream in chunks and passes decoded lines to the given callback
+
+    In contrast to StreamReader.readline(), the length of lines is not limited.
+
+    Parameters
+    ----------
+    stream
+        stream to be read
+    callback
+        callback invoked for each line (including the line separator) or None
+        if the stream shall not be decoded and split into lines
+    chunk_callback
+        callback invoked for each chunk of raw bytes
+    """
+
     if stream is not None:
+        line_decoder = _LineDecoder() if callback is not None else None
+
         while True:
-            if len(line := await stream.readline()) != 0:
-                callback(line.decode())
-            else:
+            chunk = await stream.read(STREAM_READ_CHUNK_SIZE)
+
+            if chunk_callback is not None:
+                chunk_callback(chunk)
+
+            if line_decoder is not None:
+                assert callback is not None
+
+                for line in line_decoder.decode(chunk, final=len(chunk) == 0):
+                    callback(line)
+
+            if len(chunk) == 0:
                 break
+
+
+class _LineDecoder:
+    """Incrementally decodes UTF-8 encoded chunks and splits them into lines"""
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial_line: list[str] = []
+
+    def decode(self, chunk: bytes, final: bool = False) -> list[str]:
+        """Decodes the given chunk
+
+        Parameters
+        ----------
+        chunk
+            chunk to be decoded
+        final
+            flag indicating whether the given chunk is the last chunk
+
+        Returns
+        -------
+        list[str]
+            complete lines (including the line separator) and, if final is
+            true, the remaining incomplete line
+        """
+
+        text = self._decoder.decode(chunk, final)
+        lines: list[str] = []
+
+        if "\n" in text:
+            parts = text.split("\n")
+
+            self._partial_line.append(parts[0])
+            lines.append("".join(self._partial_line) + "\n")
+            lines.extend(part + "\n" for part in parts[1:-1])
+            self._partial_line = [parts[-1]]
+        elif text != "":
+            self._partial_line.append(text)
+
+        if final and ((remaining_line := "".join(self._partial_line)) != ""):
+            lines.append(remaining_line)
+            self._partial_line = []
+
+        return lines
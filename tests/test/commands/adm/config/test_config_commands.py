@@ -77,6 +77,67 @@ class TestConfigCommands(unittest.TestCase):
         self.assertEqual(value, False)
         self.assertFalse(settings_file_path.exists())
 
+    def test_set_http(self):
+        """Tests 'cpo adm config set-http'"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            ca_bundle_path = pathlib.Path(temporary_directory) / "ca.crt"
+            ca_bundle_path.write_text("")
+            settings_file_path = pathlib.Path(temporary_directory) / "settings.json"
+
+            with unittest.mock.patch.object(
+                cpo.config.configuration_manager, "get_settings_file_path", return_value=settings_file_path
+            ):
+                runner = click.testing.CliRunner()
+                result = runner.invoke(
+                    cli,  # type: ignore
+                    [
+                        "adm",
+                        "config",
+                        "set-http",
+                        "--ca-bundle",
+                        str(ca_bundle_path),
+                        "--https-proxy",
+                        "http://proxy:3128",
+                        "--no-proxy",
+                        "localhost,.cluster.local",
+                        "--read-timeout",
+                        "120",
+                        "--retries",
+                        "5",
+                    ],
+                )
+
+                self.assertEqual(result.exit_code, 0, result.output)
+
+                settings = cpo.config.configuration_manager.get_http_session_settings()
+
+                self.assertEqual(settings.ca_bundle_path, str(ca_bundle_path.resolve()))
+                self.assertEqual(settings.no_proxy, "localhost,.cluster.local")
+                self.assertEqual(settings.proxies, {"https": "http://proxy:3128"})
+                self.assertEqual(settings.read_timeout, 120)
+                self.assertEqual(settings.retries, 5)
+
+                # options that are not passed remain unchanged and empty
+                # strings unset options
+                result = runner.invoke(
+                    cli,  # type: ignore
+                    ["adm", "config", "set-http", "--https-proxy", ""],
+                )
+
+                self.assertEqual(result.exit_code, 0, result.output)
+
+                settings = cpo.config.configuration_manager.get_http_session_settings()
+
+                self.assertEqual(settings.proxies, {})
+                self.assertEqual(settings.retries, 5)
+
+                # invalid values are rejected
+                for args in [["--https-proxy", "proxy:3128"], ["--retries", "-1"], ["--ca-bundle", "missing.crt"]]:
+                    result = runner.invoke(cli, ["adm", "config", "set-http", *args])  # type: ignore
+
+                    self.assertNotEqual(result.exit_code, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
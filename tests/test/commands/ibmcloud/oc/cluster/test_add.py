@@ -1,4 +1,4 @@
-#  Copyright 2021, 2023 IBM Corporation
+#  Copyright 2021, 2026 IBM Corporation
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -28,6 +28,7 @@ import cpo.utils.process
 from cpo.config.cluster_credentials_manager import cluster_credentials_manager
 from cpo.cpo import cli
 from cpo.lib.cluster.cluster import AbstractCluster
+from cpo.lib.dependency_manager.dependency_manager import DependencyManager
 from cpo.lib.ibmcloud.ibm_cloud_api_manager import IBMCloudAPIManager
 from cpo.utils.process import ProcessResult
 
@@ -65,15 +66,19 @@ class TestAddClusterCommands(unittest.TestCase):
     def _add_cluster(self, cluster_data: ClusterData, num_expected_cluster: int):
         server = cluster_data["server"]
 
-        with unittest.mock.patch.object(
-            IBMCloudAPIManager,
-            "execute_ibmcloud_command",
-            lambda self, args, capture_output=False, check=True, print_captured_output=False: ProcessResult(
-                command=[],
-                stderr=[],
-                stdout=[f'{{"serverURL": "{server}"}}'],
-                return_code=0,
+        with (
+            unittest.mock.patch.object(
+                IBMCloudAPIManager,
+                "execute_ibmcloud_command",
+                lambda self, args, capture_output=False, check=True, print_captured_output=False: ProcessResult(
+                    command=[],
+                    stderr=[],
+                    stdout=[f'{{"serverURL": "{server}"}}'],
+                    return_code=0,
+                ),
             ),
+            # the IBM Cloud CLI is not required as IBMCloudAPIManager is mocked
+            unittest.mock.patch.object(DependencyManager, "prefetch_dependencies"),
         ):
             runner = click.testing.CliRunner()
             result = runner.invoke(
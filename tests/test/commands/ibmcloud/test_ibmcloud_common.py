@@ -41,7 +41,7 @@ class TestIBMCloudCommon(unittest.TestCase):
     @patch.object(
         IBMCloudAPIManager,
         "execute_ibmcloud_command",
-        lambda self, args, capture_output=False, check=True, print_captured_output=False: ProcessResult(
+        lambda self, args, capture_output=False, check=True, print_captured_output=False, cache_ttl=None: ProcessResult(
             command=[],
             stderr=[],
             stdout=[(pathlib.Path(__file__).parent / "dependencies/ibmcloud_api_keys.json").read_text()],
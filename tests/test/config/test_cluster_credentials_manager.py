@@ -0,0 +1,142 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import pathlib
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+import cpo.config.cluster_credentials_manager
+
+from cpo.config.cluster_credentials_manager import ClusterCredentialsManager
+from cpo.utils.error import CloudPakOperationsCLIException
+
+
+class TestClusterCredentialsManager(unittest.TestCase):
+    def test_get_clusters_file_entry(self):
+        """Tests that clusters are looked up by alias or server URL using the
+        index of the snapshot"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            clusters_file_path = pathlib.Path(temporary_directory) / "clusters.json"
+
+            with patch.object(ClusterCredentialsManager, "get_clusters_file_path", lambda self: clusters_file_path):
+                cluster_credentials_manager = ClusterCredentialsManager()
+
+                for index in range(100):
+                    cluster_credentials_manager.add_cluster(
+                        f"cluster-{index}", f"https://cluster-{index}:6443", "generic", {}
+                    )
+
+                for alias_or_server in ["cluster-99", "https://cluster-99:6443"]:
+                    clusters_file_entry = cluster_credentials_manager.get_clusters_file_entry(alias_or_server)
+
+                    self.assertIsNotNone(clusters_file_entry)
+                    assert clusters_file_entry is not None
+                    self.assertEqual(clusters_file_entry.server, "https://cluster-99:6443")
+
+                # the index is created once per snapshot
+                snapshot = cluster_credentials_manager._snapshot
+
+                assert snapshot is not None
+                servers_by_alias = snapshot.servers_by_alias
+
+                self.assertIsNotNone(servers_by_alias)
+                self.assertIsNotNone(cluster_credentials_manager.get_clusters_file_entry("cluster-0"))
+                self.assertIs(snapshot.servers_by_alias, servers_by_alias)
+
+                self.assertIsNone(cluster_credentials_manager.get_clusters_file_entry("cluster-100"))
+
+                with self.assertRaisesRegex(CloudPakOperationsCLIException, "Alias already exists"):
+                    cluster_credentials_manager.add_cluster("cluster-0", "https://cluster-100:6443", "generic", {})
+
+                with self.assertRaisesRegex(CloudPakOperationsCLIException, "Server already exists"):
+                    cluster_credentials_manager.add_cluster("cluster-100", "https://cluster-0:6443", "generic", {})
+
+    def test_failed_save(self):
+        """Tests that the snapshot remains unchanged if the clusters file
+        cannot be saved and that returned contents are copies"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            clusters_file_path = pathlib.Path(temporary_directory) / "clusters.json"
+
+            with patch.object(ClusterCredentialsManager, "get_clusters_file_path", lambda self: clusters_file_path):
+                cluster_credentials_manager = ClusterCredentialsManager()
+                cluster_credentials_manager.add_cluster("cluster-1", "https://cluster-1:6443", "generic", {})
+
+                with patch.object(cpo.config.cluster_credentials_manager, "write_file_atomically", side_effect=OSError):
+                    with self.assertRaises(OSError):
+                        cluster_credentials_manager.add_cluster_data("cluster-1", {"alias": "cluster-2"})
+
+                    with self.assertRaises(OSError):
+                        cluster_credentials_manager.set_cluster("cluster-1")
+
+                self.assertIsNone(cluster_credentials_manager.get_clusters_file_entry("cluster-2"))
+                self.assertIsNone(cluster_credentials_manager.get_current_cluster_file_entry())
+
+                clusters_file_entry = cluster_credentials_manager.get_clusters_file_entry("cluster-1")
+
+                self.assertIsNotNone(clusters_file_entry)
+                assert clusters_file_entry is not None
+                self.assertEqual(clusters_file_entry.cluster_data["alias"], "cluster-1")
+
+                # modifying returned contents does not modify the snapshot
+                clusters_file_entry.cluster_data["alias"] = "cluster-3"
+                cluster_credentials_manager.get_clusters_file_contents_with_default()["clusters"].clear()
+
+                self.assertIsNone(cluster_credentials_manager.get_clusters_file_entry("cluster-3"))
+                self.assertIsNotNone(cluster_credentials_manager.get_clusters_file_entry("cluster-1"))
+
+    def test_snapshot(self):
+        """Tests that the clusters file is only parsed again if it was
+        modified"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            clusters_file_path = pathlib.Path(temporary_directory) / "clusters.json"
+
+            with patch.object(ClusterCredentialsManager, "get_clusters_file_path", lambda self: clusters_file_path):
+                cluster_credentials_manager = ClusterCredentialsManager()
+                cluster_credentials_manager.add_cluster("cluster-1", "https://cluster-1:6443", "generic", {})
+
+                with patch.object(
+                    cpo.config.cluster_credentials_manager.json, "load", side_effect=json.load
+                ) as json_load_mock:
+                    for _ in range(2):
+                        clusters_file_entry = cluster_credentials_manager.get_clusters_file_entry("cluster-1")
+
+                        self.assertIsNotNone(clusters_file_entry)
+                        assert clusters_file_entry is not None
+                        self.assertEqual(clusters_file_entry.server, "https://cluster-1:6443")
+
+                    # the snapshot was updated when the clusters file was
+                    # written
+                    json_load_mock.assert_not_called()
+
+                    # the clusters file is modified by another process
+                    clusters_file_contents = json.loads(clusters_file_path.read_text())
+                    clusters_file_contents["clusters"]["https://cluster-2:6443"] = {
+                        "alias": "cluster-2",
+                        "type": "generic",
+                    }
+
+                    clusters_file_path.write_text(json.dumps(clusters_file_contents))
+
+                    self.assertIsNotNone(cluster_credentials_manager.get_clusters_file_entry("cluster-2"))
+                    self.assertEqual(json_load_mock.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
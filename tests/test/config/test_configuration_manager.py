@@ -0,0 +1,56 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import pathlib
+import tempfile
+import threading
+import unittest
+
+from unittest.mock import patch
+
+from cpo.config.configuration_manager import ConfigurationManager
+
+
+class TestConfigurationManager(unittest.TestCase):
+    def test_set_bool_config_value(self):
+        """Tests that concurrent updates of the settings file are retained"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            with patch.object(
+                ConfigurationManager, "get_cli_data_directory_path", lambda self: pathlib.Path(temporary_directory)
+            ):
+                configuration_manager = ConfigurationManager()
+                threads = [
+                    threading.Thread(target=configuration_manager.set_bool_config_value, args=(f"key_{index}", True))
+                    for index in range(8)
+                ]
+
+                for thread in threads:
+                    thread.start()
+
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(
+                    json.loads(configuration_manager.get_settings_file_path().read_text()),
+                    {f"key_{index}": True for index in range(8)},
+                )
+
+                # temporary files are renamed to the settings file
+                self.assertEqual(list(pathlib.Path(temporary_directory).glob(".settings.json.*")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
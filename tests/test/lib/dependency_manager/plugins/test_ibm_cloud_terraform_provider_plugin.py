@@ -0,0 +1,56 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pathlib
+import tempfile
+import unittest
+
+from unittest.mock import Mock, patch
+
+from cpo.lib.dependency_manager.plugins.ibm_cloud_terraform_provider_plugin import IBMCloudTerraformProviderPlugIn
+
+
+class TestIBMCloudTerraformProviderPlugIn(unittest.TestCase):
+    def test_extract_archive(self):
+        """Tests IBMCloudTerraformProviderPlugIn._extract_archive()"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            plugins_directory_path = pathlib.Path(temporary_directory) / "plugins"
+
+            with patch.object(
+                IBMCloudTerraformProviderPlugIn,
+                "get_terraform_plugins_directory_path",
+                lambda self: plugins_directory_path,
+            ):
+                plugin = IBMCloudTerraformProviderPlugIn()
+
+                self.assertFalse(plugin.is_dependency_version_downloaded("1.70.0"))
+
+                for version in ["1.70.0", "1.71.0"]:
+                    archive = Mock()
+                    archive.extract.side_effect = lambda path, version=version: (
+                        path / f"terraform-provider-ibm_v{version}"
+                    ).write_text(version)
+
+                    plugin._extract_archive(archive, plugins_directory_path)
+
+                    self.assertTrue(plugin.is_dependency_version_downloaded(version))
+
+                # the provider of the previous version is replaced and no
+                # staging directory is left behind
+                self.assertFalse(plugin.is_dependency_version_downloaded("1.70.0"))
+                self.assertFalse(plugin.is_dependency_version_downloaded("1.7"))
+                self.assertEqual(
+                    [entry.name for entry in plugins_directory_path.iterdir()], ["terraform-provider-ibm_v1.71.0"]
+                )
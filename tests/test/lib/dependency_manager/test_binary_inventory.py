@@ -0,0 +1,73 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import pathlib
+import tempfile
+import time
+import unittest
+
+from unittest.mock import patch
+
+from cpo.lib.dependency_manager.binary_inventory import BinaryInventory
+
+
+class TestBinaryInventory(unittest.TestCase):
+    def test_collect_garbage(self):
+        """Tests cpo.lib.dependency_manager.binary_inventory.BinaryInventory.collect_garbage()"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            temporary_directory_path = pathlib.Path(temporary_directory)
+
+            with patch.object(
+                BinaryInventory, "get_index_file_path", lambda self: temporary_directory_path / "binary_inventory.json"
+            ):
+                binary_inventory = BinaryInventory()
+                now = time.time()
+
+                for index, version in enumerate(["4.14.0", "4.15.0", "4.16.0"]):
+                    binary_path = temporary_directory_path / f"oc-{version}"
+                    binary_path.write_bytes(b"\0" * 1024)
+
+                    binary_inventory.add("oc", version, binary_path, now - (3 - index) * 86400)
+
+                entry = binary_inventory.get_entry("oc", "4.16.0")
+
+                self.assertIsNotNone(entry)
+                self.assertEqual(entry.size, 1024)
+                self.assertEqual(entry.sha256, hashlib.sha256(b"\0" * 1024).hexdigest())
+
+                # the inventory is read from the inventory file
+                self.assertIsNotNone(BinaryInventory().get_entry("oc", "4.14.0"))
+
+                self.assertEqual(
+                    [entry.version for entry in binary_inventory.collect_garbage(max_count=2, dry_run=True)],
+                    ["4.14.0"],
+                )
+
+                self.assertTrue((temporary_directory_path / "oc-4.14.0").exists())
+
+                removed_entries = binary_inventory.collect_garbage(max_size=2048, protected_keys={"oc-4.14.0"})
+
+                self.assertEqual([entry.version for entry in removed_entries], ["4.15.0"])
+                self.assertFalse((temporary_directory_path / "oc-4.15.0").exists())
+                self.assertIsNone(binary_inventory.get_entry("oc", "4.15.0"))
+
+                # the last-used time is updated
+                binary_inventory.touch("oc", "4.14.0")
+                self.assertEqual(binary_inventory.collect_garbage(max_age=2 * 86400), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
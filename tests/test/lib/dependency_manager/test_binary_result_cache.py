@@ -0,0 +1,65 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pathlib
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from cpo.lib.dependency_manager.binary_result_cache import BinaryResultCache
+from cpo.utils.process import ProcessResult
+
+
+class TestBinaryResultCache(unittest.TestCase):
+    def test_binary_result_cache(self):
+        """Tests cpo.lib.dependency_manager.binary_result_cache.BinaryResultCache"""
+
+        with (
+            tempfile.TemporaryDirectory() as temporary_directory,
+            patch.object(BinaryResultCache, "get_cache_directory_path", lambda self: pathlib.Path(temporary_directory)),
+            patch.object(BinaryResultCache, "is_enabled", lambda self: True),
+        ):
+            binary_result_cache = BinaryResultCache()
+            args = ["version", "--output", "json"]
+            env: dict[str, str | None] = {"KUBECONFIG": None}
+
+            binary_result_cache.put("oc", "4.16.0", args, env, ProcessResult([], 0, [], ["{}"]), False)
+            binary_result_cache.put("oc", "4.16.0", ["get"], env, ProcessResult([], 1, [], ["{}"]), False)
+
+            result = binary_result_cache.get("oc", "4.16.0", args, env, 60)
+
+            self.assertIsNotNone(result)
+            self.assertEqual(result.stdout, "{}")
+            self.assertIsNone(binary_result_cache.get("oc", "4.16.0", ["get"], env, 60))
+            self.assertIsNone(binary_result_cache.get("oc", "4.17.0", args, env, 60))
+            self.assertIsNone(binary_result_cache.get("oc", "4.16.0", args, {"KUBECONFIG": "config"}, 60))
+            self.assertIsNone(binary_result_cache.get("oc", "4.16.0", args, env, -1))
+
+            binary_result_cache.put("oc", "4.16.0", args, env, ProcessResult([], 0, [], [], b"\x00"), True)
+
+            result = binary_result_cache.get("oc", "4.16.0", args, env, 60)
+
+            self.assertIsNotNone(result)
+            self.assertEqual(result.stdout_bytes, b"\x00")
+
+            binary_result_cache.invalidate("ibmcloud")
+            self.assertIsNotNone(binary_result_cache.get("oc", "4.16.0", args, env, 60))
+
+            binary_result_cache.invalidate("oc")
+            self.assertIsNone(binary_result_cache.get("oc", "4.16.0", args, env, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,291 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import pathlib
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest.mock import patch
+
+from cpo.config import configuration_manager
+from cpo.config.binaries_manager import binaries_manager
+from cpo.lib.dependency_manager.binary_inventory import binary_inventory
+from cpo.lib.dependency_manager.dependency_manager import DependencyManager
+from cpo.lib.dependency_manager.dependency_manager_binary_plugin import DependencyManagerBinaryPlugIn
+from cpo.lib.dependency_manager.dependency_manager_plugin import AbstractDependencyManagerPlugIn, DependencyVersion
+from cpo.lib.dependency_manager.plugins.ibm_cloud_cli_plugin import IBMCloudCLIPlugIn
+from cpo.utils.error import CloudPakOperationsCLIException, IBMCloudException
+from cpo.utils.operating_system import OperatingSystem
+
+barrier = threading.Barrier(2, timeout=10)
+
+
+class FirstPlugIn(AbstractDependencyManagerPlugIn):
+    # override
+    def download_dependency_version(self, github_access_token: str | None, version: str):
+        # fails unless both dependencies are downloaded concurrently
+        barrier.wait()
+
+    # override
+    def get_dependency_alias(self) -> str:
+        return self.get_dependency_name()
+
+    # override
+    def get_dependency_name(self) -> str:
+        return type(self).__name__
+
+    # override
+    def get_latest_dependency_version(self, github_access_token: str | None) -> DependencyVersion:
+        return DependencyVersion("1.0.0")
+
+    # override
+    def is_operating_system_supported(self, operating_system: OperatingSystem) -> bool:
+        return True
+
+
+class SecondPlugIn(FirstPlugIn):
+    pass
+
+
+class FailingPlugIn(FirstPlugIn):
+    # override
+    def download_dependency_version(self, github_access_token: str | None, version: str):
+        raise CloudPakOperationsCLIException("Download failed")
+
+
+class SlowPlugIn(FirstPlugIn):
+    def __init__(self):
+        self.download_count = 0
+
+    # override
+    def download_dependency_version(self, github_access_token: str | None, version: str):
+        time.sleep(0.2)
+
+        self.download_count += 1
+
+    # override
+    def is_dependency_version_downloaded(self, version: str) -> bool:
+        return self.download_count != 0
+
+
+class BinaryPlugIn(DependencyManagerBinaryPlugIn, FirstPlugIn):
+    # override
+    def download_dependency_version(self, github_access_token: str | None, version: str):
+        binary_path = configuration_manager.get_bin_directory_path() / self.get_binary_relative_path(version)
+        binary_path.parent.mkdir(parents=True)
+        binary_path.write_text("binary")
+        binary_path.chmod(0o700)
+
+    # override
+    def get_binary_name(self) -> str:
+        return "binary"
+
+
+class ScriptPlugIn(BinaryPlugIn):
+    def __init__(self):
+        self.download_count = 0
+
+    # override
+    def download_dependency_version(self, github_access_token: str | None, version: str):
+        binary_path = configuration_manager.get_bin_directory_path() / self.get_binary_relative_path(version)
+        binary_path.parent.mkdir(exist_ok=True, parents=True)
+        binary_path.write_text("#!/bin/sh\necho binary\n")
+        binary_path.chmod(0o700)
+
+        self.download_count += 1
+
+
+class TestDependencyManager(unittest.TestCase):
+    def test_download_latest_dependencies_if_required(self):
+        """Tests that
+        cpo.lib.dependency_manager.dependency_manager.DependencyManager.download_latest_dependencies_if_required()
+        downloads dependencies concurrently"""
+
+        dependency_manager = DependencyManager()
+        dependency_manager.register_plugin(FirstPlugIn)
+        dependency_manager.register_plugin(SecondPlugIn)
+        dependency_manager.register_plugin(FailingPlugIn)
+
+        binary_versions: dict[str, str] = {}
+
+        with (
+            patch.object(binaries_manager, "_binaries_file_contents", binary_versions),
+            patch.object(binaries_manager, "_save_binaries_file"),
+        ):
+            with self.assertRaises(CloudPakOperationsCLIException), self.assertLogs(level="ERROR") as logs:
+                dependency_manager.download_latest_dependencies_if_required(None)
+
+        self.assertEqual(binary_versions, {"FirstPlugIn": "1.0.0", "SecondPlugIn": "1.0.0"})
+        self.assertIn("Failed to download FailingPlugIn", logs.output[0])
+
+    def test_download_dependency_version_if_required(self):
+        """Tests that a dependency required by concurrent callers is downloaded
+        once"""
+
+        dependency_manager = DependencyManager()
+        dependency_manager.register_plugin(SlowPlugIn)
+
+        plugin = dependency_manager.get_plugin_for_plugin_class(SlowPlugIn)
+
+        with (
+            tempfile.TemporaryDirectory() as temporary_directory,
+            patch.object(
+                configuration_manager, "get_cli_data_directory_path", lambda: pathlib.Path(temporary_directory)
+            ),
+        ):
+            threads = [
+                threading.Thread(
+                    target=dependency_manager._download_dependency_version_if_required, args=(plugin, "1.0.0", None)
+                )
+                for _ in range(4)
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(plugin.download_count, 1)
+
+    def test_prefetch_dependencies(self):
+        """Tests that a prefetched dependency is joined before it is used"""
+
+        dependency_manager = DependencyManager()
+        dependency_manager.register_plugin(SlowPlugIn)
+
+        plugin = dependency_manager.get_plugin_for_plugin_class(SlowPlugIn)
+
+        with (
+            tempfile.TemporaryDirectory() as temporary_directory,
+            patch.object(
+                configuration_manager, "get_cli_data_directory_path", lambda: pathlib.Path(temporary_directory)
+            ),
+            patch.object(binaries_manager, "_binaries_file_contents", {}),
+            patch.object(binaries_manager, "_save_binaries_file"),
+        ):
+            dependency_manager.prefetch_dependencies([SlowPlugIn])
+
+            # the download is not performed by the calling thread
+            self.assertEqual(plugin.download_count, 0)
+            self.assertEqual(dependency_manager.download_dependency_if_required(SlowPlugIn), "1.0.0")
+            self.assertEqual(plugin.download_count, 1)
+
+    def test_execute_binary_concurrently(self):
+        """Tests that binaries executed concurrently are executed by the
+        dependency manager plug-in (e.g., errors of the IBM Cloud CLI are
+        wrapped in IBMCloudException)"""
+
+        dependency_manager = DependencyManager()
+        dependency_manager.register_plugin(IBMCloudCLIPlugIn)
+
+        with (
+            patch.object(DependencyManager, "_get_binary_version_and_download_if_required", return_value="1.0.0"),
+            patch.object(IBMCloudCLIPlugIn, "get_binary_path", return_value=pathlib.Path(sys.executable)),
+        ):
+            results = dependency_manager.execute_binary_concurrently(
+                IBMCloudCLIPlugIn, None, [["-c", "print(1)"], ["-c", "print(2)"]]
+            )
+
+            self.assertEqual([result.stdout for result in results], ["1", "2"])
+
+            with self.assertRaises(IBMCloudException):
+                dependency_manager.execute_binary_concurrently(
+                    IBMCloudCLIPlugIn, None, [["-c", "import sys; sys.exit('FAILED')"]]
+                )
+
+    @unittest.skipIf(sys.platform == "win32", "requires a POSIX shell")
+    def test_execute_binary_removed_from_bin_directory(self):
+        """Tests that a binary recorded in the binary inventory is downloaded
+        again if it was removed from the binaries directory"""
+
+        dependency_manager = DependencyManager()
+        dependency_manager.register_plugin(ScriptPlugIn)
+
+        plugin = dependency_manager.get_plugin_for_plugin_class(ScriptPlugIn)
+
+        with (
+            tempfile.TemporaryDirectory() as temporary_directory,
+            patch.object(
+                configuration_manager, "get_cli_data_directory_path", lambda: pathlib.Path(temporary_directory)
+            ),
+            patch.object(configuration_manager, "get_shared_bin_directory_path", lambda: None),
+            patch.object(binary_inventory, "_entries", None),
+            patch.object(binaries_manager, "_binaries_file_contents", {}),
+            patch.object(binaries_manager, "_save_binaries_file"),
+        ):
+            result = dependency_manager.execute_binary(ScriptPlugIn, "1.0.0", [], capture_output=True)
+
+            self.assertEqual(result.stdout, "binary")
+            self.assertIsNotNone(binary_inventory.get_entry("ScriptPlugIn", "1.0.0"))
+
+            plugin.get_binary_path("1.0.0").unlink()
+
+            with self.assertLogs(level="WARNING"):
+                result = dependency_manager.execute_binary(ScriptPlugIn, "1.0.0", [], capture_output=True)
+
+            self.assertEqual(result.stdout, "binary")
+            self.assertEqual(plugin.download_count, 2)
+            self.assertIsNotNone(binary_inventory.get_entry("ScriptPlugIn", "1.0.0"))
+
+    def test_populate_shared_bin_directory(self):
+        """Tests that binaries copied to the shared binaries directory are
+        found before binaries in ~/.cpo/bin"""
+
+        dependency_manager = DependencyManager()
+        dependency_manager.register_plugin(BinaryPlugIn)
+
+        plugin = dependency_manager.get_plugin_for_plugin_class(BinaryPlugIn)
+
+        with (
+            tempfile.TemporaryDirectory() as temporary_directory,
+            patch.object(
+                configuration_manager, "get_cli_data_directory_path", lambda: pathlib.Path(temporary_directory)
+            ),
+            patch.object(
+                configuration_manager,
+                "get_shared_bin_directory_path",
+                lambda: pathlib.Path(temporary_directory) / "shared",
+            ),
+            patch.object(binaries_manager, "_binaries_file_contents", {}),
+            patch.object(binaries_manager, "_save_binaries_file"),
+        ):
+            shared_bin_directory_path = pathlib.Path(temporary_directory) / "shared"
+
+            self.assertEqual(
+                plugin.get_binary_path("1.0.0"), configuration_manager.get_bin_directory_path() / "binary-1.0.0"
+            )
+
+            self.assertEqual(
+                dependency_manager.populate_shared_bin_directory(shared_bin_directory_path),
+                [shared_bin_directory_path / "binary-1.0.0"],
+            )
+
+            self.assertEqual(plugin.get_binary_path("1.0.0"), shared_bin_directory_path / "binary-1.0.0")
+            self.assertEqual(stat.S_IMODE((shared_bin_directory_path / "binary-1.0.0").stat().st_mode), 0o755)
+            self.assertEqual(
+                json.loads((shared_bin_directory_path / "binaries.json").read_text()), {"BinaryPlugIn": "1.0.0"}
+            )
+
+            # binaries are not copied again
+            self.assertEqual(dependency_manager.populate_shared_bin_directory(shared_bin_directory_path), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import functools
+import hashlib
+import http.server
+import io
+import pathlib
+import tarfile
+import tempfile
+import threading
+import unittest
+import urllib.parse
+
+from typing import Any
+from unittest.mock import patch
+
+import cpo.utils.download
+
+from cpo.lib.dependency_manager.download_cache import DownloadCache
+from cpo.utils.compression import MemberMatcher
+from cpo.utils.error import CloudPakOperationsCLIException
+
+
+def _download_file(url: urllib.parse.SplitResult, **kwargs: Any) -> pathlib.Path:
+    path = pathlib.Path(kwargs["target_directory_path"]) / pathlib.PurePosixPath(url.path).name
+    path.write_bytes(url.path.encode() * 100)
+
+    return path
+
+
+class TestDownloadCache(unittest.TestCase):
+    def test_download_cache(self):
+        """Tests cpo.lib.dependency_manager.download_cache.DownloadCache"""
+
+        with (
+            tempfile.TemporaryDirectory() as temporary_directory,
+            patch.object(cpo.utils.download, "download_file", side_effect=_download_file) as download_file,
+            patch.object(DownloadCache, "get_cache_directory_path", lambda self: pathlib.Path(temporary_directory)),
+            patch.object(DownloadCache, "get_max_size", lambda self: 2500),
+            patch.object(DownloadCache, "is_enabled", lambda self: True),
+        ):
+            download_cache = DownloadCache()
+            url_1 = urllib.parse.urlsplit("https://example.com/1.0.0/archive-1.tar.gz")
+            url_2 = urllib.parse.urlsplit("https://example.com/2.0.0/archive-2.tar.gz")
+            url_3 = urllib.parse.urlsplit("https://example.com/3.0.0/archive-3.tar.gz")
+
+            path_1 = download_cache.download_file(url_1, lambda: hashlib.sha256(url_1.path.encode() * 100).hexdigest())
+
+            self.assertEqual(path_1.name, "archive-1.tar.gz")
+            self.assertEqual(path_1.read_bytes(), url_1.path.encode() * 100)
+            self.assertEqual(download_cache.download_file(url_1), path_1)
+            self.assertEqual(download_file.call_count, 1)
+
+            with self.assertRaises(CloudPakOperationsCLIException):
+                download_cache.download_file(url_2, lambda: "0" * 64)
+
+            path_2 = download_cache.download_file(url_2)
+
+            # the total size of both files exceeds the maximum size, i.e., the
+            # least recently used file is evicted
+            self.assertFalse(path_1.exists())
+            self.assertTrue(path_2.exists())
+
+            download_cache.download_file(url_3)
+            self.assertFalse(path_2.exists())
+            self.assertEqual(download_file.call_count, 4)
+
+    def test_extract_archive(self):
+        """Tests cpo.lib.dependency_manager.download_cache.DownloadCache.extract_archive()"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            temporary_directory_path = pathlib.Path(temporary_directory)
+            server_directory_path = temporary_directory_path / "server"
+            server_directory_path.mkdir()
+
+            with tarfile.open(server_directory_path / "archive.tar.gz", "w:gz") as tar_file:
+                for name in ["archive/README.md", "archive/binary", "archive/LICENSE"]:
+                    tar_info = tarfile.TarInfo(name)
+                    tar_info.size = len(name)
+                    tar_file.addfile(tar_info, io.BytesIO(name.encode()))
+
+            request_paths: list[str] = []
+
+            class RequestHandler(http.server.SimpleHTTPRequestHandler):
+                def log_message(self, format, *args):
+                    request_paths.append(self.path)
+
+            server = http.server.ThreadingHTTPServer(
+                ("127.0.0.1", 0), functools.partial(RequestHandler, directory=str(server_directory_path))
+            )
+
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+            url = urllib.parse.urlsplit(f"http://127.0.0.1:{server.server_port}/archive.tar.gz")
+            sha256 = hashlib.sha256((server_directory_path / "archive.tar.gz").read_bytes()).hexdigest()
+
+            try:
+                for is_enabled in [False, True]:
+                    with (
+                        patch.object(
+                            DownloadCache, "get_cache_directory_path", lambda self: temporary_directory_path / "cache"
+                        ),
+                        patch.object(DownloadCache, "is_enabled", lambda self: is_enabled),
+                    ):
+                        target_directory_path = temporary_directory_path / f"target-{is_enabled}"
+                        target_directory_path.mkdir()
+
+                        with self.assertRaises(CloudPakOperationsCLIException):
+                            DownloadCache().extract_archive(url, target_directory_path, lambda: "0" * 64)
+
+                        # extracted files are removed if the digest does not match
+                        self.assertFalse((target_directory_path / "archive" / "LICENSE").exists())
+
+                        DownloadCache().extract_archive(
+                            url,
+                            target_directory_path,
+                            lambda: sha256,
+                            ignoreDirectoryStructure=True,
+                            memberMatcher=MemberMatcher(["binary"]),
+                        )
+
+                        self.assertTrue((target_directory_path / "binary").exists())
+
+                # the archive was added to the cache while being extracted
+                with (
+                    patch.object(
+                        DownloadCache, "get_cache_directory_path", lambda self: temporary_directory_path / "cache"
+                    ),
+                    patch.object(DownloadCache, "is_enabled", lambda self: True),
+                ):
+                    request_count = len(request_paths)
+
+                    DownloadCache().extract_archive(url, temporary_directory_path / "target-True")
+
+                    self.assertEqual(len(request_paths), request_count)
+                    self.assertTrue((temporary_directory_path / "target-True" / "archive" / "LICENSE").exists())
+            finally:
+                server.shutdown()
+                server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import http.server
+import pathlib
+import tempfile
+import threading
+import unittest
+
+from typing import Any
+from unittest.mock import patch
+
+from cpo.lib.dependency_manager.http_response_cache import HTTPResponseCache
+
+
+class RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.request_headers.append(dict(self.headers))  # type: ignore[attr-defined]
+
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.headers.get("If-None-Match") == '"1"':
+            self.send_response(304)
+            self.send_header("ETag", '"1"')
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header("Content-Length", "7")
+            self.send_header("ETag", '"1"')
+            self.end_headers()
+            self.wfile.write(b"content")
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+class TestHTTPResponseCache(unittest.TestCase):
+    def test_get_content(self):
+        """Tests cpo.lib.dependency_manager.http_response_cache.HTTPResponseCache.get_content()"""
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        server.request_headers = []  # type: ignore[attr-defined]
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        url = f"http://127.0.0.1:{server.server_port}/release.txt"
+
+        try:
+            with (
+                tempfile.TemporaryDirectory() as temporary_directory,
+                patch.object(
+                    HTTPResponseCache, "get_cache_directory_path", lambda self: pathlib.Path(temporary_directory)
+                ),
+                patch.object(HTTPResponseCache, "is_enabled", lambda self: True),
+            ):
+                http_response_cache = HTTPResponseCache()
+
+                self.assertEqual(http_response_cache.get_content(url, 60), b"content")
+                self.assertEqual(http_response_cache.get_content(url, 60), b"content")
+                self.assertEqual(len(server.request_headers), 1)  # type: ignore[attr-defined]
+
+                # expired contents are revalidated
+                self.assertEqual(http_response_cache.get_content(url, 0), b"content")
+                self.assertEqual(len(server.request_headers), 2)  # type: ignore[attr-defined]
+                self.assertEqual(server.request_headers[1]["If-None-Match"], '"1"')  # type: ignore[attr-defined]
+
+                self.assertIsNone(http_response_cache.get_content(f"http://127.0.0.1:{server.server_port}/missing", 60))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
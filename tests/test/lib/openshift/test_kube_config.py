@@ -0,0 +1,126 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import pathlib
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+import yaml
+
+from cpo.config import configuration_manager
+from cpo.lib.openshift.kube_config import KubeConfig, edit_kube_config
+
+
+class TestKubeConfig(unittest.TestCase):
+    def test_edit_kube_config(self):
+        """Tests cpo.lib.openshift.kube_config.edit_kube_config()"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            kube_config_file_path = pathlib.Path(temporary_directory) / "config"
+
+            with (
+                patch.dict(os.environ, {"KUBECONFIG": str(kube_config_file_path)}),
+                patch.object(
+                    configuration_manager, "get_cli_data_directory_path", lambda: pathlib.Path(temporary_directory)
+                ),
+            ):
+                with edit_kube_config() as kube_config:
+                    self.assertIsNone(kube_config.get_current_context())
+
+                    kube_config.set_credentials("user/cluster", "token-1")
+                    kube_config.set_cluster("cluster", "https://cluster:6443", insecure_skip_tls_verify=True)
+                    kube_config.set_context("default/cluster/user", "cluster", "default", "user/cluster")
+                    kube_config.use_context("default/cluster/user")
+
+                self.assertEqual(kube_config_file_path.stat().st_mode & 0o777, 0o600)
+
+                with edit_kube_config() as kube_config:
+                    kube_config.set_credentials("user/cluster", "token-2")
+
+                    current_context = kube_config.get_current_context()
+
+                    self.assertIsNotNone(current_context)
+                    assert current_context is not None
+                    self.assertEqual(current_context["cluster"], "cluster")
+
+                with self.assertRaises(RuntimeError):
+                    with edit_kube_config() as kube_config:
+                        kube_config.set_credentials("user/cluster", "token-3")
+
+                        raise RuntimeError()
+
+            contents = yaml.safe_load(kube_config_file_path.read_text())
+
+            self.assertEqual(contents["current-context"], "default/cluster/user")
+            self.assertEqual(contents["users"], [{"name": "user/cluster", "user": {"token": "token-2"}}])
+            self.assertEqual(
+                contents["clusters"],
+                [{"cluster": {"insecure-skip-tls-verify": True, "server": "https://cluster:6443"}, "name": "cluster"}],
+            )
+            self.assertEqual(list(pathlib.Path(temporary_directory).glob("*.tmp")), [])
+
+            # oc fails to modify the kubeconfig file if <kubeconfig>.lock exists
+            self.assertFalse(kube_config_file_path.with_name("config.lock").exists())
+
+    def test_edit_kube_config_with_symbolic_link(self):
+        """Tests that the target of a kubeconfig file that is a symbolic link
+        is modified"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            kube_config_file_path = pathlib.Path(temporary_directory) / "config"
+            target_path = pathlib.Path(temporary_directory) / "target"
+            target_path.write_text("apiVersion: v1\nkind: Config\n")
+            kube_config_file_path.symlink_to(target_path)
+
+            with patch.object(
+                configuration_manager, "get_cli_data_directory_path", lambda: pathlib.Path(temporary_directory)
+            ):
+                with edit_kube_config(kube_config_file_path) as kube_config:
+                    kube_config.set_credentials("user/cluster", "token")
+
+            self.assertTrue(kube_config_file_path.is_symlink())
+            self.assertEqual(
+                yaml.safe_load(target_path.read_text())["users"], [{"name": "user/cluster", "user": {"token": "token"}}]
+            )
+
+    def test_set_cluster_with_insecure_skip_tls_verify(self):
+        """Tests that certificate authorities are removed if TLS verification
+        is skipped (client-go rejects this combination)"""
+
+        contents = {
+            "clusters": [
+                {
+                    "cluster": {
+                        "certificate-authority": "/path/to/ca.crt",
+                        "certificate-authority-data": "Y2E=",
+                        "server": "https://cluster:6443",
+                    },
+                    "name": "cluster",
+                }
+            ]
+        }
+
+        KubeConfig(contents).set_cluster("cluster", "https://cluster:6443", insecure_skip_tls_verify=True)
+
+        self.assertEqual(
+            contents["clusters"],
+            [{"cluster": {"insecure-skip-tls-verify": True, "server": "https://cluster:6443"}, "name": "cluster"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pathlib
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+import yaml
+
+import cpo.lib.openshift.cluster
+
+from cpo.config import configuration_manager
+from cpo.config.cluster_credentials_manager import ClusterCredentialsManager, cluster_credentials_manager
+from cpo.lib.openshift.credentials.user_credentials import UserCredentials
+from cpo.lib.openshift.kube_config import get_kube_config_names
+from cpo.lib.openshift.kube_config_exporter import KubeConfigExporter
+from cpo.utils.error import CloudPakOperationsCLIException
+
+
+def refresh_access_token(self: UserCredentials):
+    if self.server == "https://cluster-2:6443":
+        raise CloudPakOperationsCLIException("Login failed")
+
+    self.persist_access_token(f"token-{self.server}")
+
+
+class TestKubeConfigExporter(unittest.TestCase):
+    def test_export_kube_config(self):
+        """Tests that clusters whose OAuth access token could be refreshed are
+        exported"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            temporary_directory_path = pathlib.Path(temporary_directory)
+            kube_config_file_path = temporary_directory_path / "config"
+
+            with (
+                patch.object(
+                    ClusterCredentialsManager,
+                    "get_clusters_file_path",
+                    lambda self: temporary_directory_path / "clusters.json",
+                ),
+                patch.object(configuration_manager, "get_cli_data_directory_path", lambda: temporary_directory_path),
+                patch.object(UserCredentials, "refresh_access_token", refresh_access_token),
+            ):
+                for index in [1, 2]:
+                    cluster_credentials_manager.add_cluster(
+                        f"cluster-{index}",
+                        f"https://cluster-{index}:6443",
+                        cpo.lib.openshift.cluster.CLUSTER_TYPE_ID,
+                        {"password": "password", "username": "kubeadmin"},
+                    )
+
+                clusters = [
+                    cluster_credentials_manager.get_cluster_or_raise_exception(alias)
+                    for alias in ["cluster-1", "cluster-2"]
+                ]
+
+                result = KubeConfigExporter(clusters, max_parallel=2).export_kube_config(kube_config_file_path)
+
+                self.assertEqual(result.exported_servers, ["https://cluster-1:6443"])
+                self.assertEqual(list(result.failed_servers), ["https://cluster-2:6443"])
+
+                # the refreshed OAuth access token is stored in clusters.json
+                self.assertEqual(
+                    cluster_credentials_manager.get_cluster_or_raise_exception("cluster-1").get_cluster_data()["token"],
+                    "token-https://cluster-1:6443",
+                )
+
+            names = get_kube_config_names(clusters[0])
+
+            self.assertEqual(names.user, "kube:admin/cluster-1:6443")
+            self.assertEqual(names.context, "default/cluster-1:6443/kube:admin")
+
+            contents = yaml.safe_load(kube_config_file_path.read_text())
+
+            self.assertEqual(contents["current-context"], names.context)
+            self.assertEqual([cluster["name"] for cluster in contents["clusters"]], [names.cluster])
+            self.assertEqual(
+                contents["users"], [{"name": names.user, "user": {"token": "token-https://cluster-1:6443"}}]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
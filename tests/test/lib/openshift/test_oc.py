@@ -0,0 +1,87 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pathlib
+import tempfile
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+import cpo.lib.openshift.oc
+
+from cpo.lib.openshift.oc import KubeConfigAPIClientCache
+
+
+class TestOC(unittest.TestCase):
+    def test_kube_config_api_client_cache(self):
+        """Tests that the cached API client is replaced and closed if the
+        kubeconfig file was modified"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            kube_config_file_path = pathlib.Path(temporary_directory) / "config"
+            kube_config_file_path.write_text("apiVersion: v1\n")
+
+            with (
+                patch.object(cpo.lib.openshift.oc, "get_kube_config_file_path", return_value=kube_config_file_path),
+                patch.object(
+                    cpo.lib.openshift.oc.config, "new_client_from_config", side_effect=lambda: MagicMock()
+                ) as new_client_from_config_mock,
+            ):
+                kube_config_api_client_cache = KubeConfigAPIClientCache()
+                api_client = kube_config_api_client_cache.get_api_client()
+
+                self.assertIs(kube_config_api_client_cache.get_api_client(), api_client)
+
+                # the kubeconfig file is modified (e.g., by oc login)
+                kube_config_file_path.write_text("apiVersion: v1\nkind: Config\n")
+
+                self.assertIsNot(kube_config_api_client_cache.get_api_client(), api_client)
+                self.assertEqual(new_client_from_config_mock.call_count, 2)
+                api_client.close.assert_called_once()
+
+    def test_kube_config_api_client_cache_namespace(self):
+        """Tests that the namespace of the current context is cached until the
+        kubeconfig file is modified"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            kube_config_file_path = pathlib.Path(temporary_directory) / "config"
+            kube_config_file_path.write_text("apiVersion: v1\n")
+
+            with (
+                patch.object(cpo.lib.openshift.oc, "get_kube_config_file_path", return_value=kube_config_file_path),
+                patch.object(
+                    cpo.lib.openshift.oc.config,
+                    "list_kube_config_contexts",
+                    side_effect=[
+                        ([], {"context": {"namespace": "project-1"}}),
+                        ([], {"context": {}}),
+                    ],
+                ) as list_kube_config_contexts_mock,
+            ):
+                kube_config_api_client_cache = KubeConfigAPIClientCache()
+
+                for _ in range(2):
+                    self.assertEqual(kube_config_api_client_cache.get_namespace(), "project-1")
+
+                self.assertEqual(list_kube_config_contexts_mock.call_count, 1)
+
+                # the kubeconfig file is modified (e.g., by oc project)
+                kube_config_file_path.write_text("apiVersion: v1\nkind: Config\n")
+
+                self.assertEqual(kube_config_api_client_cache.get_namespace(), "default")
+                self.assertEqual(list_kube_config_contexts_mock.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
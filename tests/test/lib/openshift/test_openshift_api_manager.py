@@ -0,0 +1,116 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import threading
+import unittest
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from kubernetes import client
+
+from cpo.lib.openshift.credentials.credentials import AbstractCredentials
+from cpo.lib.openshift.openshift_api_manager import OpenShiftAPIManager
+from cpo.lib.openshift.pods.terminated_pods_deleter import TerminatedPodsDeleter
+
+
+class UnitTestCredentials(AbstractCredentials):
+    def __init__(self):
+        super().__init__("https://cluster:6443", True)
+
+        self.refresh_count = 0
+
+    # override
+    def get_access_token(self, force_refresh_if_possible: bool = False) -> str:
+        return f"token-{self.refresh_count}"
+
+    # override
+    def is_refreshable(self) -> bool:
+        return True
+
+    # override
+    def persist_access_token(self, token: str):
+        pass
+
+    # override
+    def refresh_access_token(self):
+        self.refresh_count += 1
+
+
+class TestOpenShiftAPIManager(unittest.TestCase):
+    def test_delete_terminated_pods(self):
+        """Tests that terminated pods are deleted using deletecollection
+        requests (or counted if --dry-run is passed)"""
+
+        def delete_collection_namespaced_pod(project: str, **kwargs: Any) -> MagicMock:
+            items = [{"metadata": {"name": "pod"}}] if kwargs["field_selector"] == "status.phase=Failed" else []
+
+            return MagicMock(data=json.dumps({"items": items}).encode())
+
+        with (
+            patch.object(OpenShiftAPIManager, "get_projects", return_value=["project-1", "project-2"]),
+            patch.object(
+                client.CoreV1Api, "delete_collection_namespaced_pod", side_effect=delete_collection_namespaced_pod
+            ) as delete_collection_namespaced_pod_mock,
+        ):
+            result = TerminatedPodsDeleter(UnitTestCredentials()).delete_terminated_pods(dry_run=True)
+
+            self.assertEqual(result.number_of_pods_per_project, {"project-1": 1, "project-2": 1})
+            self.assertEqual(result.number_of_pods, 2)
+            self.assertEqual(delete_collection_namespaced_pod_mock.call_count, 4)
+
+            for call in delete_collection_namespaced_pod_mock.call_args_list:
+                self.assertEqual(call.kwargs["dry_run"], "All")
+                self.assertIn("as=PartialObjectMetadataList", call.kwargs["_headers"]["Accept"])
+
+            TerminatedPodsDeleter(UnitTestCredentials()).delete_terminated_pods()
+
+            self.assertIsNone(delete_collection_namespaced_pod_mock.call_args.kwargs["dry_run"])
+
+    def test_execute_kubernetes_client(self):
+        """Tests that the OAuth access token is refreshed once if concurrent
+        requests are rejected with HTTP status code 401"""
+
+        credentials = UnitTestCredentials()
+        openshift_api_manager = OpenShiftAPIManager(credentials)
+        barrier = threading.Barrier(4, timeout=10)
+
+        def method() -> str:
+            if credentials.refresh_count == 0:
+                # all threads are rejected before the token is refreshed
+                barrier.wait()
+
+                raise client.ApiException(status=401)
+
+            return openshift_api_manager.get_kube_config()["users"][0]["user"]["token"]
+
+        results: list[str] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(openshift_api_manager.execute_kubernetes_client(method)))
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(credentials.refresh_count, 1)
+        self.assertEqual(results, ["token-1"] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
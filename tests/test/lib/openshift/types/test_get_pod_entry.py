@@ -0,0 +1,89 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import datetime
+import unittest
+
+from kubernetes import client
+
+from cpo.lib.openshift.types.get_pod_entry import GetPodEntry
+
+
+class TestGetPodEntry(unittest.TestCase):
+    def test_from_pod(self):
+        """Tests cpo.lib.openshift.types.get_pod_entry.GetPodEntry.from_pod()"""
+
+        now = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+        pod = client.V1Pod(
+            metadata=client.V1ObjectMeta(creation_timestamp=now - datetime.timedelta(hours=3), name="pod-1"),
+            spec=client.V1PodSpec(containers=[client.V1Container(name="c-1"), client.V1Container(name="c-2")]),
+            status=client.V1PodStatus(
+                container_statuses=[
+                    client.V1ContainerStatus(
+                        image="image",
+                        image_id="",
+                        name="c-1",
+                        ready=True,
+                        restart_count=1,
+                        state=client.V1ContainerState(running=client.V1ContainerStateRunning()),
+                    ),
+                    client.V1ContainerStatus(
+                        image="image",
+                        image_id="",
+                        name="c-2",
+                        ready=False,
+                        restart_count=2,
+                        state=client.V1ContainerState(
+                            waiting=client.V1ContainerStateWaiting(reason="CrashLoopBackOff")
+                        ),
+                    ),
+                ],
+                phase="Running",
+            ),
+        )
+
+        entry = GetPodEntry.from_pod(pod, now)
+
+        self.assertEqual(entry.name, "pod-1")
+        self.assertEqual((entry.readiness_actual, entry.readiness_total), (1, 2))
+        self.assertEqual(entry.status, "CrashLoopBackOff")
+        self.assertEqual(entry.restarts, 3)
+        self.assertEqual(entry.age, "3h")
+        self.assertFalse(entry.is_ready())
+
+        pod.metadata.deletion_timestamp = now
+
+        self.assertEqual(GetPodEntry.from_pod(pod, now).status, "Terminating")
+
+    def test_get_age(self):
+        """Tests cpo.lib.openshift.types.get_pod_entry.GetPodEntry._get_age()"""
+
+        now = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+        for seconds, age in [
+            (-5, "0s"),
+            (119, "119s"),
+            (120, "2m"),
+            (7199, "119m"),
+            (7200, "2h"),
+            (172799, "47h"),
+            (172800, "2d"),
+        ]:
+            self.assertEqual(GetPodEntry._get_age(now - datetime.timedelta(seconds=seconds), now), age)
+
+        self.assertEqual(GetPodEntry._get_age(None, now), "<unknown>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import os
+import pathlib
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from unittest.mock import patch
+
+import cpo.utils.compression
+import cpo.utils.file
+
+from cpo.utils.compression import MemberMatcher
+
+
+class TestCompressionUtilities(unittest.TestCase):
+    def test_extract_tgz_archive_from_stream(self):
+        """Tests that cpo.utils.compression.extract_tgz_archive_from_stream()
+        stops reading the stream after all selected members were extracted"""
+
+        archive = io.BytesIO()
+
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar_file:
+            for name in ["archive/binary", "archive/LICENSE"]:
+                tar_info = tarfile.TarInfo(name)
+                tar_info.size = 1024 * 1024
+                tar_file.addfile(tar_info, io.BytesIO(os.urandom(tar_info.size)))
+
+        archive.seek(0)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            extracted_paths = cpo.utils.compression.extract_tgz_archive_from_stream(
+                archive,
+                pathlib.Path(temporary_directory),
+                ignoreDirectoryStructure=True,
+                memberMatcher=MemberMatcher(["binary"], cpo.utils.file.FileType.RegularFile),
+            )
+
+            self.assertEqual(extracted_paths, [pathlib.Path(temporary_directory) / "binary"])
+            self.assertFalse((pathlib.Path(temporary_directory) / "LICENSE").exists())
+            self.assertLess(archive.tell(), len(archive.getvalue()))
+
+    def test_extract_zip_archive(self):
+        """Tests that cpo.utils.compression.extract_zip_archive() looks up
+        members located in the root directory of the archive in the central
+        directory"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            temporary_directory_path = pathlib.Path(temporary_directory)
+
+            with zipfile.ZipFile(temporary_directory_path / "archive.zip", "w") as zip_file:
+                zip_file.writestr("binary", "binary")
+                zip_file.writestr("LICENSE", "LICENSE")
+                zip_file.writestr("directory/plugin", "plugin")
+
+            with patch.object(zipfile.ZipFile, "infolist", side_effect=AssertionError):
+                cpo.utils.compression.extract_zip_archive(
+                    temporary_directory_path / "archive.zip",
+                    temporary_directory_path / "target",
+                    memberMatcher=MemberMatcher(["binary"]),
+                )
+
+            self.assertEqual((temporary_directory_path / "target" / "binary").read_text(), "binary")
+            self.assertFalse((temporary_directory_path / "target" / "LICENSE").exists())
+
+            # members located in subdirectories are found by iterating over all
+            # members
+            cpo.utils.compression.extract_zip_archive(
+                temporary_directory_path / "archive.zip",
+                temporary_directory_path / "target",
+                ignoreDirectoryStructure=True,
+                memberMatcher=MemberMatcher(["plugin"]),
+            )
+
+            self.assertEqual((temporary_directory_path / "target" / "plugin").read_text(), "plugin")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import http.server
+import os
+import pathlib
+import re as regex
+import tempfile
+import threading
+import unittest
+import urllib.parse
+
+from unittest.mock import patch
+
+import cpo.utils.download
+
+CONTENT = os.urandom(3 * 1048576 + 17)
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serves CONTENT, supports range requests unless configured otherwise,
+    and drops the connection halfway through the first responses"""
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        start = 0
+        end = len(CONTENT) - 1
+
+        if (
+            (range_header is not None) and (self.headers.get("If-Range") == '"etag"') and not self.server.ignore_ranges  # type: ignore[attr-defined]
+        ):
+            search_result = regex.fullmatch("bytes=(\\d+)-(\\d*)", range_header)
+
+            assert search_result is not None
+
+            start = int(search_result.group(1))
+            end = int(search_result.group(2)) if search_result.group(2) != "" else end
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(CONTENT)}")
+        else:
+            self.send_response(200)
+
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end + 1 - start))
+        self.send_header("ETag", '"etag"')
+        self.end_headers()
+
+        with self.server.lock:  # type: ignore[attr-defined]
+            self.server.range_starts.append(start)  # type: ignore[attr-defined]
+            interrupt = self.server.requests_to_interrupt > 0  # type: ignore[attr-defined]
+
+            if interrupt:
+                self.server.requests_to_interrupt -= 1  # type: ignore[attr-defined]
+
+        if interrupt:
+            self.wfile.write(CONTENT[start : start + (end + 1 - start) // 2])
+            self.wfile.flush()
+            self.connection.shutdown(2)
+        else:
+            try:
+                self.wfile.write(CONTENT[start : end + 1])
+            except (BrokenPipeError, ConnectionResetError):
+                # the client closed the connection to send a range request
+                pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDownloadUtilities(unittest.TestCase):
+    def setUp(self):
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+        self._server.ignore_ranges = False  # type: ignore[attr-defined]
+        self._server.lock = threading.Lock()  # type: ignore[attr-defined]
+        self._server.range_starts = []  # type: ignore[attr-defined]
+        self._server.requests_to_interrupt = 1  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def tearDown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def test_download_file_resumes_interrupted_download(self):
+        """Tests cpo.utils.download.download_file() with an interrupted
+        connection"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = cpo.utils.download.download_file(
+                urllib.parse.urlsplit(f"http://127.0.0.1:{self._server.server_port}/archive.tar.gz"),
+                target_directory_path=temporary_directory,
+            )
+
+            self.assertEqual(path, pathlib.Path(temporary_directory) / "archive.tar.gz")
+            self.assertEqual(path.read_bytes(), CONTENT)
+            range_starts = self._server.range_starts  # type: ignore[attr-defined]
+
+            self.assertEqual(len(range_starts), 2)
+            self.assertEqual(range_starts[0], 0)
+            self.assertGreater(range_starts[1], 0)
+            self.assertLessEqual(range_starts[1], len(CONTENT) // 2)
+            self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [path])
+
+    def test_download_file_resumes_partial_file(self):
+        """Tests cpo.utils.download.download_file() with a partial file left
+        behind by a previous invocation"""
+
+        self._server.requests_to_interrupt = 0  # type: ignore[attr-defined]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            url = f"http://127.0.0.1:{self._server.server_port}/archive.tar.gz"
+            partial_download = cpo.utils.download._PartialDownload(
+                pathlib.Path(temporary_directory) / "archive.tar.gz",
+                cpo.utils.download._PartialDownloadMetadata(True, len(CONTENT), '"etag"', None, url),
+            )
+
+            partial_download.restart()
+            (pathlib.Path(temporary_directory) / "archive.tar.gz.part").write_bytes(CONTENT[:1000])
+
+            path = cpo.utils.download.download_file(
+                urllib.parse.urlsplit(url), target_directory_path=temporary_directory
+            )
+
+            self.assertEqual(path.read_bytes(), CONTENT)
+            self.assertEqual(self._server.range_starts, [0, 1000])  # type: ignore[attr-defined]
+
+    @patch.object(cpo.utils.download, "SEGMENTED_DOWNLOAD_MIN_SIZE", 1048576)
+    def test_download_file_in_segments(self):
+        """Tests cpo.utils.download.download_file() downloading segments
+        concurrently"""
+
+        self._server.requests_to_interrupt = 3  # type: ignore[attr-defined]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = cpo.utils.download.download_file(
+                urllib.parse.urlsplit(f"http://127.0.0.1:{self._server.server_port}/archive.tar.gz"),
+                segments=3,
+                target_directory_path=temporary_directory,
+            )
+
+            self.assertEqual(path.read_bytes(), CONTENT)
+            self.assertEqual(list(pathlib.Path(temporary_directory).iterdir()), [path])
+
+            # initial request, three segments (two of them interrupted), and
+            # two resumed segments
+            self.assertEqual(len(self._server.range_starts), 6)  # type: ignore[attr-defined]
+
+    @patch.object(cpo.utils.download, "SEGMENTED_DOWNLOAD_MIN_SIZE", 1048576)
+    def test_download_file_in_segments_without_range_support(self):
+        """Tests cpo.utils.download.download_file() falling back to one
+        connection if the server ignores range requests"""
+
+        self._server.ignore_ranges = True  # type: ignore[attr-defined]
+        self._server.requests_to_interrupt = 0  # type: ignore[attr-defined]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = cpo.utils.download.download_file(
+                urllib.parse.urlsplit(f"http://127.0.0.1:{self._server.server_port}/archive.tar.gz"),
+                target_directory_path=temporary_directory,
+            )
+
+            self.assertEqual(path.read_bytes(), CONTENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
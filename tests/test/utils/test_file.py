@@ -0,0 +1,91 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import pathlib
+import tempfile
+import unittest
+
+from filelock import FileLock
+
+from cpo.utils.file import create_staging_directory, write_file_atomically
+
+
+class TestFile(unittest.TestCase):
+    def test_create_staging_directory(self):
+        """Tests that staging directories left behind by terminated processes
+        are removed while staging directories in use are kept"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            directory_path = pathlib.Path(temporary_directory)
+            abandoned_staging_directory_path = directory_path / ".staging-abandoned"
+            used_staging_directory_path = directory_path / ".staging-used"
+
+            for staging_directory_path in [abandoned_staging_directory_path, used_staging_directory_path]:
+                staging_directory_path.mkdir()
+                (staging_directory_path / "binary").write_text("binary")
+
+            # the mtime of a staging directory is not updated while a file is
+            # written
+            os.utime(used_staging_directory_path, (0, 0))
+
+            with FileLock(directory_path / ".staging-used.lock"):
+                with create_staging_directory(directory_path) as staging_directory_path:
+                    self.assertTrue(staging_directory_path.is_dir())
+                    self.assertEqual(staging_directory_path.parent, directory_path)
+
+                    # staging directories in use are not removed by other
+                    # threads
+                    with create_staging_directory(directory_path):
+                        self.assertTrue(staging_directory_path.is_dir())
+
+                self.assertFalse(staging_directory_path.exists())
+                self.assertFalse(abandoned_staging_directory_path.exists())
+                self.assertTrue(used_staging_directory_path.exists())
+
+            self.assertEqual(
+                sorted(path.name for path in directory_path.iterdir()), [".staging-used", ".staging-used.lock"]
+            )
+
+    @unittest.skipIf(os.name != "posix", "requires POSIX permissions")
+    def test_write_file_atomically(self):
+        """Tests that files written by cpo.utils.file.write_file_atomically()
+        are created with permissions modified by the umask and retain the
+        permissions of existing files"""
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            file_path = pathlib.Path(temporary_directory) / "settings.json"
+            umask = os.umask(0o027)
+
+            try:
+                write_file_atomically(file_path, "{}")
+            finally:
+                os.umask(umask)
+
+            self.assertEqual(file_path.stat().st_mode & 0o777, 0o640)
+
+            file_path.chmod(0o600)
+            write_file_atomically(file_path, "{}\n")
+
+            self.assertEqual(file_path.read_text(), "{}\n")
+            self.assertEqual(file_path.stat().st_mode & 0o777, 0o600)
+
+            write_file_atomically(file_path, "{}", 0o644)
+
+            self.assertEqual(file_path.stat().st_mode & 0o777, 0o644)
+            self.assertEqual(list(pathlib.Path(temporary_directory).glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import http.server
+import threading
+import unittest
+
+from typing import Any
+
+from cpo.utils.http_session import HTTPSessionFactory, HTTPSessionSettings
+
+
+class RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])  # type: ignore[attr-defined]
+
+        status = 503 if len(self.server.client_ports) == 1 else 200  # type: ignore[attr-defined]
+
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+
+class TestHTTPSessionFactory(unittest.TestCase):
+    def test_get_session(self):
+        """Tests that sessions returned by
+        cpo.utils.http_session.HTTPSessionFactory.get_session() retry requests
+        and reuse connections"""
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        server.client_ports = []  # type: ignore[attr-defined]
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        session_factory = HTTPSessionFactory()
+        session_factory.set_settings_provider(lambda: HTTPSessionSettings(backoff_factor=0, retries=1))
+
+        try:
+            session = session_factory.get_session()
+
+            self.assertIs(session_factory.get_session(), session)
+
+            response = session.get(f"http://127.0.0.1:{server.server_port}/")
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(server.client_ports), 2)  # type: ignore[attr-defined]
+
+            session.get(f"http://127.0.0.1:{server.server_port}/")
+
+            # the connection is reused
+            self.assertEqual(len(set(server.client_ports)), 1)  # type: ignore[attr-defined]
+        finally:
+            session_factory.reset()
+            server.shutdown()
+            server.server_close()
+
+    def test_no_proxy(self):
+        """Tests that requests to hosts matching the no_proxy setting bypass
+        the configured proxies"""
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        # the first request is not answered with 503
+        server.client_ports = [0]  # type: ignore[attr-defined]
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        session_factory = HTTPSessionFactory()
+        session_factory.set_settings_provider(
+            lambda: HTTPSessionSettings(
+                no_proxy="127.0.0.1,localhost", proxies={"http": "http://127.0.0.1:9"}, retries=0
+            )
+        )
+
+        try:
+            response = session_factory.get_session().get(f"http://127.0.0.1:{server.server_port}/")
+
+            self.assertEqual(response.status_code, 200)
+        finally:
+            session_factory.reset()
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#  Copyright 2026 IBM Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import pathlib
+import sys
+import unittest
+
+import cpo.utils.process
+
+from cpo.utils.error import CloudPakOperationsCLIException
+from cpo.utils.process import CommandSpec, ProcessOutputLine
+
+
+class TestProcessUtilities(unittest.TestCase):
+    def test_execute_commands(self):
+        """Tests cpo.utils.process.execute_commands()"""
+
+        python = pathlib.Path(sys.executable)
+        results = cpo.utils.process.execute_commands(
+            [
+                CommandSpec(python, ["-c", "import time; time.sleep(0.2); print('1')"]),
+                CommandSpec(python, ["-c", "import sys; print('2'); print('e', file=sys.stderr)"]),
+                CommandSpec(python, ["-c", "import sys; sys.exit(3)"], check=False),
+            ],
+            max_parallel=2,
+        )
+
+        self.assertEqual([result.stdout for result in results], ["1", "2", ""])
+        self.assertEqual(results[1].stderr, "e")
+        self.assertEqual([result.return_code for result in results], [0, 0, 3])
+
+        with self.assertRaises(CloudPakOperationsCLIException):
+            cpo.utils.process.execute_commands([CommandSpec(python, ["-c", "import sys; sys.exit(1)"])])
+
+    def test_execute_command_with_bounded_buffers(self):
+        """Tests cpo.utils.process.execute_command() with bounded buffers"""
+
+        python = pathlib.Path(sys.executable)
+        args = ["-c", "for i in range(100): print(i)"]
+
+        result = cpo.utils.process.execute_command(python, args, capture_output=True, max_captured_lines=2)
+        self.assertEqual(result.stdout, "98\n99")
+
+        result = cpo.utils.process.execute_command(
+            python, args, capture_output=True, spill_captured_output_to_file=True
+        )
+        self.assertEqual(result.stdout, "\n".join(str(i) for i in range(100)))
+        self.assertIs(result.stdout, result.stdout)
+
+    def test_execute_command_with_long_lines(self):
+        """Tests cpo.utils.process.execute_command() with lines exceeding the
+        default limit of asyncio.StreamReader.readline()"""
+
+        python = pathlib.Path(sys.executable)
+        args = ["-c", "import json; print(json.dumps(['\u00e4' * 100000], ensure_ascii=False)); print('x')"]
+
+        env = os.environ | {"PYTHONIOENCODING": "utf-8"}
+
+        result = cpo.utils.process.execute_command(python, args, env, capture_output=True)
+        self.assertEqual(result.stdout.split("\n")[1], "x")
+        self.assertEqual(len(result.stdout.split("\n")[0]), 100004)
+
+        result = cpo.utils.process.execute_command(python, args, env, capture_output=True, capture_raw_stdout=True)
+        self.assertEqual(json.loads(result.stdout_bytes.split(b"\n")[0]), ["\u00e4" * 100000])
+
+    def test_execute_command_with_timeout(self):
+        """Tests cpo.utils.process.execute_command() with a timeout"""
+
+        python = pathlib.Path(sys.executable)
+
+        result = cpo.utils.process.execute_command(
+            python, ["-c", "import time; time.sleep(60)"], capture_output=True, check=False, timeout=0.5
+        )
+
+        self.assertTrue(result.timed_out)
+        self.assertNotEqual(result.return_code, 0)
+        self.assertLess(result.wall_time, 30)
+
+        with self.assertRaises(CloudPakOperationsCLIException):
+            result.raise_for_status()
+
+        result = cpo.utils.process.execute_command(python, ["-c", "pass"], capture_output=True, timeout=30)
+
+        self.assertFalse(result.timed_out)
+        self.assertIsNotNone(result.wall_time)
+
+        if os.name == "posix":
+            self.assertIsNotNone(result.cpu_time)
+            self.assertGreater(result.max_rss, 0)
+
+            # processes started in a new process group do not read from the
+            # terminal (they would be stopped by SIGTTIN)
+            result = cpo.utils.process.execute_command(
+                python, ["-c", "import sys; print(repr(sys.stdin.read()))"], capture_output=True, timeout=30
+            )
+
+            self.assertEqual(result.stdout, "''")
+
+    def test_iterate_command_output(self):
+        """Tests cpo.utils.process.iterate_command_output()"""
+
+        python = pathlib.Path(sys.executable)
+        lines = list(
+            cpo.utils.process.iterate_command_output(
+                python, ["-c", "import sys; print('1'); sys.stdout.flush(); print('2', file=sys.stderr)"]
+            )
+        )
+
+        self.assertCountEqual(lines, [ProcessOutputLine("1", "stdout"), ProcessOutputLine("2", "stderr")])
+
+        with self.assertRaises(CloudPakOperationsCLIException):
+            list(cpo.utils.process.iterate_command_output(python, ["-c", "import sys; sys.exit(1)"]))
+
+        iterator = cpo.utils.process.iterate_command_output(
+            python, ["-c", "import time\nwhile True: print('x', flush=True); time.sleep(0.01)"]
+        )
+
+        self.assertEqual(next(iterator), ProcessOutputLine("x", "stdout"))
+
+        iterator.close()
+
+    def test_iterate_command_output_with_invalid_utf8(self):
+        """Tests that cpo.utils.process.iterate_command_output() replaces
+        invalid UTF-8 sequences instead of blocking"""
+
+        python = pathlib.Path(sys.executable)
+        lines = list(
+            cpo.utils.process.iterate_command_output(
+                python, ["-c", "import sys; sys.stdout.buffer.write(b'a\\xff\\n'); print('b', file=sys.stderr)"]
+            )
+        )
+
+        self.assertCountEqual(lines, [ProcessOutputLine("a\ufffd", "stdout"), ProcessOutputLine("b", "stderr")])
+
+
+if __name__ == "__main__":
+    unittest.main()